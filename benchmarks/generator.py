@@ -0,0 +1,151 @@
+"""
+This module provides methods for generating synthetic descriptions
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import random
+
+from bootstrap import Description, Assignment, Group, Container
+from bootstrap.table import Column
+
+LOCALES = [
+    "strings_us", "strings_de", "strings_fr", "strings_es", "strings_it",
+    "strings_ja", "strings_ko", "strings_pl", "strings_cz", "strings_ru",
+    "strings_zh", "strings_ar"
+]
+"""
+Locale keys used for synthetic descriptions
+"""
+
+
+def generate_locales(name, locales):
+    """
+    This method generates the locales of a synthetic description.
+    :param name: string
+    :param locales: integer
+    :return: dict
+    """
+    keys = LOCALES[:locales] + [
+        "strings_{}".format(x) for x in range(len(LOCALES), locales)
+    ]
+
+    return {key: "{} {}".format(name, x) for x, key in enumerate(keys)}
+
+
+def generate_parameter(index, locales, rng):
+    """
+    This method generates a synthetic REAL parameter.
+    :param index: integer
+    :param locales: integer
+    :param rng: random.Random
+    :return: bootstrap.Description
+    """
+    maximum = float(rng.randint(1, 1000))
+
+    return Description({
+        "id": "PARAMETER_{}".format(index),
+        "key": "REAL",
+        "value": [
+            Assignment("MIN", 0.0),
+            Assignment("MAX", maximum),
+            Assignment("STEP", maximum / 100),
+            Assignment("UNIT", "PERCENT"),
+            Assignment("CUSTOMGUI", "REALSLIDER")
+        ],
+        "locales": generate_locales("Parameter {}".format(index), locales)
+    })
+
+
+def generate_description(size=1000, depth=3, fanout=4, locales=1, seed=0):
+    """
+    This method generates a synthetic description with size parameters
+    spread over groups nested depth levels deep, every group holding
+    fanout sub groups.
+    :param size: integer
+    :param depth: integer
+    :param fanout: integer
+    :param locales: integer
+    :param seed: integer
+    :return: bootstrap.Container
+    """
+    rng = random.Random(seed)
+
+    groups = []
+
+    root = Container("Tbenchmark", {
+        "value": [
+            Assignment("NAME", "Tbenchmark"),
+            Assignment("INCLUDE", "Tbase")
+        ],
+        "locales": generate_locales("Benchmark", locales)
+    })
+
+    level = [root]
+
+    for index in range(depth):
+        next_level = []
+
+        for parent in level:
+            for child in range(fanout):
+                group = Group("GROUP_{}".format(len(groups)), {
+                    "value": [],
+                    "locales": generate_locales(
+                        "Group {}".format(len(groups)), locales
+                    )
+                })
+
+                groups.append(group)
+                parent.value.append(group)
+                next_level.append(group)
+
+        level = next_level
+
+    for index in range(size):
+        level[index % len(level)].value.append(
+            generate_parameter(index, locales, rng)
+        )
+
+    return root
+
+
+def generate_table(size=1000, locales=1, seed=0):
+    """
+    This method generates the columns and the template of size synthetic
+    REAL parameters like generate_parameter.
+    :param size: integer
+    :param locales: integer
+    :param seed: integer
+    :return: tuple
+    """
+    rng = random.Random(seed)
+
+    maximums = [float(rng.randint(1, 1000)) for x in range(size)]
+
+    columns = {
+        "id": ["PARAMETER_{}".format(x) for x in range(size)],
+        "max": maximums,
+        "step": [x / 100 for x in maximums]
+    }
+
+    keys = list(generate_locales("", locales).keys())
+
+    for index, key in enumerate(keys):
+        columns[key] = [
+            "Parameter {} {}".format(x, index) for x in range(size)
+        ]
+
+    template = Description({
+        "id": Column("id"),
+        "key": "REAL",
+        "value": [
+            Assignment("MIN", 0.0),
+            Assignment("MAX", Column("max")),
+            Assignment("STEP", Column("step")),
+            Assignment("UNIT", "PERCENT"),
+            Assignment("CUSTOMGUI", "REALSLIDER")
+        ],
+        "locales": {x: Column(x) for x in keys}
+    })
+
+    return columns, template
@@ -0,0 +1,323 @@
+"""
+This module provides the benchmark runner
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import bootstrap
+from bootstrap.io import write_header,\
+    write_resource,\
+    write_strings,\
+    compile_plugin,\
+    build
+from bootstrap.catalog import export_catalog, import_catalogs
+from bootstrap.document import load_document, dump_document
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.reducers.h import reduce_header
+from bootstrap.reducers.res import reduce_resource
+from bootstrap.reducers.str import reduce_strings
+from bootstrap.render.h import render_header
+from bootstrap.render.res import render_resource
+from bootstrap.render.str import render_strings
+from bootstrap.table import build_table
+from bootstrap.classes.index import DescriptionIndex
+from bootstrap.validation import validate_description
+
+from benchmarks.generator import generate_description, generate_table
+
+PLUGIN_SOURCE = """import os
+
+#----begin_resource_section----
+from benchmarks.generator import generate_description
+
+root = generate_description({size}, {depth}, {fanout}, {locales})
+#----end_resource_section----
+
+#----begin_id_section----
+TBENCHMARK = root.GetId()
+#----end_id_section----
+"""
+"""
+Source of the synthetic plugin used for compile_plugin and build
+"""
+
+IMPORT_SOURCE = """import time
+
+start = time.perf_counter()
+
+{statement}
+
+print(time.perf_counter() - start)
+"""
+"""
+Source timing an import statement in a fresh interpreter
+"""
+
+IMPORTS = (
+    ("import_classes", "from bootstrap import Description, Container"),
+    ("import_io", "import bootstrap.io")
+)
+"""
+Import statements measured by the import benchmarks
+"""
+
+
+def measure(function, repeat):
+    """
+    This method measures the best wall time of the function.
+    :param function: callable
+    :param repeat: integer
+    :return: float
+    """
+    timings = []
+
+    for index in range(repeat):
+        start = time.perf_counter()
+
+        function()
+
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def measure_import(statement, repeat):
+    """
+    This method measures the best wall time of the import statement,
+    every run imports in a fresh interpreter.
+    :param statement: string
+    :param repeat: integer
+    :return: float
+    """
+    project_path = os.path.dirname(os.path.dirname(os.path.realpath(
+        __file__
+    )))
+
+    timings = []
+
+    for index in range(repeat):
+        timings.append(float(subprocess.check_output(
+            [
+                sys.executable, "-c",
+                IMPORT_SOURCE.format(statement=statement)
+            ],
+            cwd=project_path
+        )))
+
+    return min(timings)
+
+
+def run(size=1000, depth=3, fanout=4, locales=1, repeat=5):
+    """
+    This method measures every stage of a build of a synthetic
+    description.
+    :param size: integer
+    :param depth: integer
+    :param fanout: integer
+    :param locales: integer
+    :param repeat: integer
+    :return: dict
+    """
+    stages = {}
+
+    for name, statement in IMPORTS:
+        stages[name] = measure_import(statement, repeat)
+
+    stages["generate"] = measure(
+        lambda: generate_description(size, depth, fanout, locales), repeat
+    )
+
+    columns, template = generate_table(size, locales)
+
+    stages["build_table"] = measure(
+        lambda: build_table(columns, template), repeat
+    )
+
+    description = generate_description(size, depth, fanout, locales)
+    reduced = reduce_fused(description)
+
+    with tempfile.TemporaryDirectory() as directory:
+        plugin_file = os.path.join(directory, "tbenchmark.py")
+        destination_directory = os.path.join(directory, "dist")
+
+        with open(plugin_file, "w") as f:
+            f.write(PLUGIN_SOURCE.format(
+                size=size, depth=depth, fanout=fanout, locales=locales
+            ))
+
+        document_file = os.path.join(directory, "tbenchmark.json")
+
+        with open(document_file, "w") as f:
+            json.dump(dump_document(description), f)
+
+        stages["load_document"] = measure(
+            lambda: load_document(document_file, False), repeat
+        )
+        load_document(document_file)
+
+        stages["load_snapshot"] = measure(
+            lambda: load_document(document_file), repeat
+        )
+
+        catalog_file = os.path.join(directory, "tbenchmark.po")
+
+        stages["export_catalog"] = measure(
+            lambda: export_catalog(
+                description, catalog_file, translation="strings_us"
+            ), repeat
+        )
+        stages["import_catalogs"] = measure(
+            lambda: import_catalogs(
+                description, {"strings_us": catalog_file}
+            ), repeat
+        )
+
+        benchmarks = [
+            ("validate", lambda: validate_description(description)),
+            ("index", lambda: DescriptionIndex(description)),
+            ("reduce_header", lambda: reduce_header(description)),
+            ("reduce_resource", lambda: reduce_resource(description)),
+            ("reduce_strings", lambda: reduce_strings(description)),
+            ("reduce_fused", lambda: reduce_fused(description)),
+            ("render_header", lambda: render_header(reduced["header"])),
+            ("render_resource", lambda: render_resource(reduced["resource"])),
+            ("render_strings", lambda: render_strings(reduced["strings"])),
+            ("write_header", lambda: write_header(
+                description, destination_directory, "tbenchmark", reduced
+            )),
+            ("write_resource", lambda: write_resource(
+                description, destination_directory, "tbenchmark", reduced
+            )),
+            ("write_strings", lambda: write_strings(
+                description, destination_directory, "tbenchmark", reduced
+            )),
+            ("write_strings_thread", lambda: write_strings(
+                description, destination_directory, "tbenchmark", reduced,
+                parallel="thread"
+            )),
+            ("write_strings_process", lambda: write_strings(
+                description, destination_directory, "tbenchmark", reduced,
+                parallel="process"
+            )),
+            ("compile_plugin", lambda: compile_plugin(
+                plugin_file, destination_directory, "tbenchmark"
+            )),
+            ("build", lambda: build(
+                description, plugin_file, destination_directory,
+                "tbenchmark", True
+            )),
+            ("build_noop", lambda: build(
+                description, plugin_file, destination_directory, "tbenchmark"
+            ))
+        ]
+
+        for name, function in benchmarks:
+            stages[name] = measure(function, repeat)
+
+    return {
+        "bootstrap": bootstrap.__version__,
+        "python": platform.python_version(),
+        "parameters": {
+            "size": size,
+            "depth": depth,
+            "fanout": fanout,
+            "locales": locales,
+            "repeat": repeat
+        },
+        "stages": stages
+    }
+
+
+def compare(results, baseline, threshold=0.25):
+    """
+    This method compares the results to the baseline and lists all
+    stages slower than the baseline by more than the threshold.
+    :param results: dict
+    :param baseline: dict
+    :param threshold: float
+    :return: list
+    """
+    regressions = []
+
+    for name, seconds in sorted(results["stages"].items()):
+        seconds_baseline = baseline["stages"].get(name)
+
+        if not seconds_baseline:
+            continue
+
+        ratio = seconds / seconds_baseline
+
+        if ratio > 1 + threshold:
+            regressions.append({
+                "stage": name,
+                "seconds": seconds,
+                "baseline": seconds_baseline,
+                "ratio": ratio
+            })
+
+    return regressions
+
+
+def main(argv=None):
+    """
+    This method runs the benchmarks from the command line.
+    :param argv: list
+    :return: integer
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=4)
+    parser.add_argument("--locales", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="json file to write results to")
+    parser.add_argument("--compare", help="json file with baseline results")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="allowed slow down relative to the baseline"
+    )
+
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.size, args.depth, args.fanout, args.locales, args.repeat
+    )
+
+    for name, seconds in results["stages"].items():
+        print("{:<24} {:>10.2f} ms".format(name, seconds * 1000))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare, "r") as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold)
+
+    for regression in regressions:
+        print(
+            "{stage} regressed {ratio:.2f}x "
+            "({seconds:.4f}s vs {baseline:.4f}s)".format(**regression)
+        )
+
+    if regressions:
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,48 @@
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 __version__ = 1.0
 
-from bootstrap.classes.description import Description,\
-    Assignment,\
-    Group,\
-    Container
+import sys
 
-from bootstrap.classes.template import Template
+LAZY_ATTRIBUTES = {
+    "Description": "bootstrap.classes.description",
+    "Assignment": "bootstrap.classes.description",
+    "Group": "bootstrap.classes.description",
+    "Container": "bootstrap.classes.description",
+    "Template": "bootstrap.classes.template"
+}
+"""
+Modules of the attributes which are imported on first access
+"""
+
+
+def __getattr__(name):
+    """
+    This method imports the module of the lazy attribute on first access.
+    :param name: string
+    :return: object
+    """
+    module_name = LAZY_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+
+    value = getattr(__import__(module_name, fromlist=(name,)), name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    """
+    This method lists the attributes including the lazy ones.
+    :return: list
+    """
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    for name in LAZY_ATTRIBUTES:
+        __getattr__(name)
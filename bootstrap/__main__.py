@@ -0,0 +1,209 @@
+"""
+This module provides the command line interface
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import argparse
+import logging
+import sys
+import traceback
+
+from bootstrap.classes.registry import IdRegistry, IdCollisionError
+from bootstrap.workspace import load_workspace,\
+    build_workspace,\
+    validate_plugin
+from bootstrap.validation import format_diagnostic, ERROR
+from bootstrap.watch import Watcher
+
+
+def print_summary(results):
+    """
+    This method prints the summary of a workspace build.
+    :param results: list
+    :return: integer
+    """
+    failed = [x for x in results if not x["success"]]
+
+    for result in results:
+        if result["success"]:
+            report = result["report"]
+
+            print("{}: rebuilt {}, skipped {}".format(
+                result["filename"],
+                len(report["rebuilt"]),
+                len(report["skipped"])
+            ))
+        else:
+            print("{}: failed\n{}".format(result["filename"], result["error"]))
+
+    print("{} built, {} failed".format(
+        len(results) - len(failed), len(failed)
+    ))
+
+    return len(failed)
+
+
+def print_diagnostics(plugins):
+    """
+    This method validates the plugins of a workspace and prints their
+    diagnostics.
+    :param plugins: list
+    :return: integer
+    """
+    errors = 0
+
+    for plugin in plugins:
+        try:
+            diagnostics = validate_plugin(plugin)
+        except Exception:
+            print("{}: failed\n{}".format(
+                plugin["filename"], traceback.format_exc()
+            ))
+
+            errors += 1
+
+            continue
+
+        for diagnostic in diagnostics:
+            print("{}: {}".format(
+                plugin["filename"], format_diagnostic(diagnostic)
+            ))
+
+        errors += sum(1 for x in diagnostics if x["severity"] == ERROR)
+
+    print("{} errors".format(errors))
+
+    return errors
+
+
+def main(argv=None):
+    """
+    This method runs the command line interface.
+    :param argv: list
+    :return: integer
+    """
+    parser = argparse.ArgumentParser(prog="python -m bootstrap")
+
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    build_parser = subparsers.add_parser(
+        "build", help="build all plugins of a workspace"
+    )
+    build_parser.add_argument("workspace", help="workspace json file")
+    build_parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="number of worker processes, defaults to the cpu count"
+    )
+    build_parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="rebuild all artifacts regardless of the manifest"
+    )
+    build_parser.add_argument(
+        "-l", "--ledger", default=None,
+        help="json file keeping all ids ever assigned in the workspace"
+    )
+    build_parser.add_argument(
+        "-r", "--report-directory", default=None,
+        help="directory for json reports and chrome traces of every build"
+    )
+    build_parser.add_argument(
+        "-p", "--profile", action="store_true",
+        help="write cProfile stats to the report directory"
+    )
+    build_parser.add_argument(
+        "-m", "--trace-memory", action="store_true",
+        help="report the peak memory of every stage, requires python 3.9"
+    )
+    build_parser.add_argument(
+        "-c", "--cache-directory", default=None,
+        help="directory for caching rendered groups across builds"
+    )
+    build_parser.add_argument(
+        "-a", "--archive-directory", default=None,
+        help="directory for zip archives replacing destination directories"
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="rebuild plugins of a workspace on change"
+    )
+    watch_parser.add_argument("workspace", help="workspace json file")
+    watch_parser.add_argument(
+        "-i", "--interval", type=float, default=0.02,
+        help="polling interval in seconds"
+    )
+    watch_parser.add_argument(
+        "-d", "--debounce", type=float, default=0.02,
+        help="seconds without changes before rebuilding"
+    )
+    watch_parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="rebuild all artifacts regardless of the manifest"
+    )
+
+    validate_parser = subparsers.add_parser(
+        "validate", help="validate the descriptions of a workspace"
+    )
+    validate_parser.add_argument("workspace", help="workspace json file")
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    plugins = load_workspace(args.workspace)
+
+    if args.command == "validate":
+        if print_diagnostics(plugins):
+            return 1
+
+        return 0
+
+    if args.command == "watch":
+        watcher = Watcher(
+            plugins, args.interval, args.debounce, args.force
+        )
+
+        try:
+            watcher.Run(print_summary)
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
+    registry = IdRegistry(args.ledger)
+
+    if args.profile and args.report_directory is None:
+        parser.error("--profile requires --report-directory")
+
+    if args.trace_memory and args.report_directory is None:
+        parser.error("--trace-memory requires --report-directory")
+
+    if args.trace_memory and sys.version_info < (3, 9):
+        parser.error("--trace-memory requires python 3.9")
+
+    results = build_workspace(
+        plugins, args.jobs, args.force, registry, args.report_directory,
+        args.profile, args.cache_directory, args.archive_directory,
+        args.trace_memory
+    )
+
+    failed = print_summary(results)
+
+    try:
+        registry.Check()
+    except IdCollisionError as e:
+        print("id collisions\n{}".format(e))
+
+        return 1
+
+    registry.Save()
+
+    if failed:
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
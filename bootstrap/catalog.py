@@ -0,0 +1,389 @@
+"""
+This module provides methods for importing translations from gettext
+catalogs into the locales of descriptions and exporting catalogs
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import re
+
+from bootstrap.parser import ParseError, read_lines
+from bootstrap.utilities.tree import walk
+
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+"""
+Pattern for matching escape sequences of catalog strings
+"""
+
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\"": "\"", "\\": "\\"}
+"""
+Characters of the escape sequences of catalog strings
+"""
+
+UNESCAPES = str.maketrans({v: "\\" + k for k, v in ESCAPES.items()})
+"""
+Translation table of the characters of catalog strings to their escape
+sequences
+"""
+
+CATALOG_HEADER = """msgid ""
+msgstr ""
+"Content-Type: text/plain; charset={encoding}\\n"
+"Content-Transfer-Encoding: 8bit\\n"
+"Language: {language}\\n"
+"""
+"""
+Header entry of exported catalogs
+"""
+
+KEYWORDS = {
+    "msgctxt": "context",
+    "msgid": "id",
+    "msgid_plural": "plural",
+    "msgstr": "string",
+    "msgstr[0]": "string"
+}
+"""
+Fields of the entry of the catalog keywords
+"""
+
+
+def unquote(token, filename=None, line=None):
+    """
+    This method returns the unescaped contents of the quoted string.
+    :param token: string
+    :param filename: string
+    :param line: integer
+    :return: string
+    """
+    if len(token) < 2 or token[0] != "\"" or token[-1] != "\"":
+        raise ParseError("expected quoted string", filename, line)
+
+    token = token[1:-1]
+
+    if "\\" not in token:
+        return token
+
+    return ESCAPE_PATTERN.sub(
+        lambda x: ESCAPES.get(x.group(1), x.group(1)), token
+    )
+
+
+def quote(value):
+    """
+    This method returns the escaped and quoted string.
+    :param value: string
+    :return: string
+    """
+    return "\"{}\"".format(value.translate(UNESCAPES))
+
+
+def parse_catalog(lines, filename=None):
+    """
+    This method lazily yields the entries of the lines of a catalog, so
+    catalogs are read in a single pass without holding their lines.
+    Entries are dictionaries of the context, id, string, fuzzy flag and
+    line of the entry. Obsolete entries are left out, of plural strings
+    only the first is kept.
+    :param lines: iterable
+    :param filename: string
+    :return: generator
+    """
+    entry = {}
+    field = None
+    fuzzy = False
+
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+
+        if not line:
+            continue
+
+        if line[0] == "\"":
+            if field is None:
+                raise ParseError("unexpected string", filename, number)
+
+            entry[field].append(unquote(line, filename, number))
+
+            continue
+
+        if line[0] != "#":
+            keyword, _, token = line.partition(" ")
+        elif line.startswith("#~"):
+            continue
+        else:
+            keyword, token = None, None
+
+        if "string" in entry and (
+            keyword is None or not keyword.startswith("msgstr")
+        ):
+            yield create_entry(entry, fuzzy, filename)
+
+            entry = {}
+            field = None
+            fuzzy = False
+
+        if keyword is None:
+            if line.startswith("#,") and not fuzzy:
+                fuzzy = "fuzzy" in (x.strip() for x in line[2:].split(","))
+
+            continue
+
+        if keyword.startswith("msgstr[") and keyword != "msgstr[0]":
+            field = keyword
+        else:
+            field = KEYWORDS.get(keyword)
+
+        if field is None:
+            raise ParseError(
+                "unknown keyword {}".format(keyword), filename, number
+            )
+
+        if field in entry:
+            raise ParseError(
+                "repeated keyword {}".format(keyword), filename, number
+            )
+
+        entry.setdefault("line", number)
+        entry[field] = [unquote(token.strip(), filename, number)]
+
+    if entry:
+        yield create_entry(entry, fuzzy, filename)
+
+
+def create_entry(entry, fuzzy, filename=None):
+    """
+    This method joins the strings of the parsed entry.
+    :param entry: dict
+    :param fuzzy: boolean
+    :param filename: string
+    :return: dict
+    """
+    if "id" not in entry or "string" not in entry:
+        raise ParseError(
+            "expected msgid and msgstr", filename, entry.get("line")
+        )
+
+    context = entry.get("context")
+
+    return {
+        "context": None if context is None else "".join(context),
+        "id": "".join(entry["id"]),
+        "string": "".join(entry["string"]),
+        "fuzzy": fuzzy,
+        "line": entry["line"]
+    }
+
+
+def load_catalog(catalog_file, fuzzy=False, encoding="utf-8"):
+    """
+    This method streams the catalog file into a dictionary mapping the
+    description ids to their translations. The context of an entry is
+    taken as id, entries without context use their msgid as id. Entries
+    which are not translated, or fuzzy unless fuzzy is set, map to None.
+    The header entry is left out.
+    :param catalog_file: string
+    :param fuzzy: boolean
+    :param encoding: string
+    :return: dict
+    """
+    catalog = {}
+
+    entries = parse_catalog(read_lines(catalog_file, encoding), catalog_file)
+
+    for entry in entries:
+        description_id = entry["context"]
+
+        if description_id is None:
+            description_id = entry["id"]
+
+            if not description_id:
+                continue
+
+        if description_id in catalog:
+            raise ParseError(
+                "duplicate entry {}".format(description_id),
+                catalog_file, entry["line"]
+            )
+
+        if entry["string"] and (fuzzy or not entry["fuzzy"]):
+            catalog[description_id] = entry["string"]
+        else:
+            catalog[description_id] = None
+
+    return catalog
+
+
+def get_fallbacks(locales, fallbacks=None):
+    """
+    This method returns the fallback locales of every locale. Fallbacks
+    are a dictionary of the locales to try in order for every locale,
+    or a list of locales to try for all of them.
+    :param locales: iterable
+    :param fallbacks: mixed
+    :return: dict
+    """
+    if fallbacks is None:
+        return {x: [] for x in locales}
+
+    if isinstance(fallbacks, dict):
+        return {x: list(fallbacks.get(x, ())) for x in locales}
+
+    return {x: [y for y in fallbacks if y != x] for x in locales}
+
+
+def import_catalogs(description, catalogs, fallbacks=None, fuzzy=False,
+                    encoding="utf-8"):
+    """
+    This method merges the translations of the catalogs into the locales
+    of the descriptions in a single traversal. Catalogs map the locales
+    to catalog files or dictionaries as returned by load_catalog, so the
+    whole import is linear in the size of the catalogs and the tree.
+
+    A description is translated if it has an id and either locales or an
+    entry in one of the catalogs. Descriptions missing from the catalog
+    of a locale keep the string they have, or else take the string of
+    the first fallback locale found in its catalog or their locales.
+
+    The report maps every locale to the number of imported strings and
+    the ids missing from its catalog, filled from a fallback locale, or
+    present in the catalog without a description.
+    :param description: bootstrap.Description
+    :param catalogs: dict
+    :param fallbacks: mixed
+    :param fuzzy: boolean
+    :param encoding: string
+    :return: dict
+    """
+    catalogs = {
+        k: v if isinstance(v, dict) else load_catalog(v, fuzzy, encoding)
+        for k, v in catalogs.items()
+    }
+
+    locale_fallbacks = get_fallbacks(catalogs.keys(), fallbacks)
+
+    report = {
+        x: {"imported": 0, "missing": [], "fallback": [], "unused": []}
+        for x in catalogs
+    }
+
+    found = set()
+    visited = set()
+
+    stack = [description]
+
+    while stack:
+        item = stack.pop()
+
+        if id(item) in visited:
+            continue
+
+        visited.add(id(item))
+
+        if isinstance(item.value, list):
+            stack.extend(reversed(item.value))
+
+        description_id = item.id
+
+        if not description_id:
+            continue
+
+        locales = item.locales if isinstance(item.locales, dict) else None
+
+        if not locales and not any(
+            description_id in x for x in catalogs.values()
+        ):
+            continue
+
+        found.add(description_id)
+
+        if locales is None:
+            locales = item.locales = {}
+
+        for locale, catalog in catalogs.items():
+            locale_report = report[locale]
+
+            value = catalog.get(description_id)
+
+            if value is not None:
+                locales[locale] = value
+
+                locale_report["imported"] += 1
+
+                continue
+
+            locale_report["missing"].append(description_id)
+
+            if locales.get(locale) is not None:
+                continue
+
+            for fallback in locale_fallbacks[locale]:
+                value = catalogs.get(fallback, {}).get(description_id)
+
+                if value is None:
+                    value = locales.get(fallback)
+
+                if value is not None:
+                    locales[locale] = value
+
+                    locale_report["fallback"].append(description_id)
+
+                    break
+
+    for locale, catalog in catalogs.items():
+        report[locale]["unused"] = [x for x in catalog if x not in found]
+
+    return report
+
+
+def export_catalog(description, catalog_file, locale="strings_us",
+                   translation=None, encoding="utf-8"):
+    """
+    This method writes a catalog of the strings of the locale, where
+    the id of every description is the context of its entry. Without
+    translation locale the strings are left empty as in templates,
+    otherwise they are filled with the strings of the translation.
+    :param description: bootstrap.Description
+    :param catalog_file: string
+    :param locale: string
+    :param translation: string
+    :param encoding: string
+    :return: integer
+    """
+    count = 0
+
+    with open(catalog_file, "w", encoding=encoding, newline="\n") as f:
+        f.write(CATALOG_HEADER.format(
+            encoding=encoding.upper(),
+            language=(translation or "")[len("strings_"):]
+        ))
+
+        for item in iter_locale_items(description, locale):
+            value = ""
+
+            if translation is not None:
+                value = item.locales.get(translation) or ""
+
+            f.write("\nmsgctxt {}\nmsgid {}\nmsgstr {}\n".format(
+                quote(str(item.id)),
+                quote(str(item.locales[locale])),
+                quote(str(value))
+            ))
+
+            count += 1
+
+    return count
+
+
+def iter_locale_items(description, locale):
+    """
+    This method lazily yields the descriptions with a string of the
+    locale in the order of reduce_strings.
+    :param description: bootstrap.Description
+    :param locale: string
+    :return: generator
+    """
+    for item in walk(description):
+        if item.id and isinstance(item.locales, dict) and \
+                item.locales.get(locale) is not None:
+            yield item
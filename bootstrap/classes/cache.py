@@ -0,0 +1,206 @@
+"""
+This module provides generic RenderCache class
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import json
+import os
+import uuid
+
+MAX_SIZE = 64 * 1024 * 1024
+"""
+Default size limit of the cache directory in bytes
+"""
+
+SIZE_FILENAME = "size"
+"""
+Name of the file holding the size of the cache directory in bytes
+"""
+
+
+class RenderCache(object):
+    """
+    This class models a persistent cache of rendered subtrees
+
+    Records are stored as json files named after their key. Reading a
+    record updates its modification time, Prune removes the least
+    recently used records until the cache fits its size limit.
+
+    The size of the cache is kept in a size file and added to by Put, so
+    the cache directory is only walked once the records stored may push
+    the cache over its size limit. Records replaced by Put are counted
+    twice, which only makes the next walk happen earlier.
+    """
+
+    def __init__(self, directory, max_size=MAX_SIZE):
+        """
+        This method initializes a new instance of the RenderCache class.
+        :param directory: string
+        :param max_size: integer
+        :return:
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self.added = 0
+
+    def GetPath(self, key):
+        """
+        This method returns the path of the record file.
+        :param key: string
+        :return: string
+        """
+        return os.path.join(self.directory, key[:2], "{}.json".format(key))
+
+    def Get(self, key):
+        """
+        This method returns the record stored under key or None.
+        :param key: string
+        :return: dict
+        """
+        path = self.GetPath(key)
+
+        try:
+            with open(path, "r") as f:
+                record = json.load(f)
+        except (IOError, ValueError):
+            self.misses += 1
+
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+
+        return record
+
+    def Put(self, key, record):
+        """
+        This method stores the record under key. Records which can not be
+        serialized are not stored.
+        :param key: string
+        :param record: dict
+        :return: boolean
+        """
+        try:
+            contents = json.dumps(record)
+        except (TypeError, ValueError):
+            return False
+
+        path = self.GetPath(key)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temporary_file = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+
+        with open(temporary_file, "x") as f:
+            f.write(contents)
+
+        os.replace(temporary_file, path)
+
+        self.added += len(contents)
+
+        return True
+
+    def GetSizePath(self):
+        """
+        This method returns the path of the size file.
+        :return: string
+        """
+        return os.path.join(self.directory, SIZE_FILENAME)
+
+    def LoadSize(self):
+        """
+        This method returns the size stored in the size file or None.
+        :return: integer
+        """
+        try:
+            with open(self.GetSizePath(), "r") as f:
+                return int(f.read())
+        except (IOError, ValueError):
+            return None
+
+    def SaveSize(self, size):
+        """
+        This method atomically writes the size to the size file.
+        :param size: integer
+        :return:
+        """
+        path = self.GetSizePath()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        temporary_file = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+
+        with open(temporary_file, "x") as f:
+            f.write(str(size))
+
+        os.replace(temporary_file, path)
+
+    def Prune(self):
+        """
+        This method removes the least recently used records until the
+        cache fits its size limit. Without records stored since the last
+        call, or while the size file shows the cache fits its limit, the
+        cache directory is not walked.
+        :return: integer
+        """
+        if not self.added:
+            return 0
+
+        size = self.LoadSize()
+
+        if size is not None and size + self.added <= self.max_size:
+            self.SaveSize(size + self.added)
+
+            self.added = 0
+
+            return 0
+
+        records = []
+        size = 0
+
+        for root, directories, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+
+                path = os.path.join(root, name)
+
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                records.append((stat.st_mtime, stat.st_size, path))
+
+                size += stat.st_size
+
+        records.sort()
+
+        removed = 0
+
+        for mtime, record_size, path in records:
+            if size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            size -= record_size
+            removed += 1
+
+        self.SaveSize(size)
+
+        self.added = 0
+
+        return removed
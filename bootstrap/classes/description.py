@@ -4,7 +4,21 @@ This module provides generic Description classes and sugared classes
 
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
-import hashlib
+from sys import intern
+
+# collections.abc would import the whole collections package, the base
+# classes it exports are loaded with the interpreter already
+from _collections_abc import MutableMapping
+
+ID_MODULO = 10 ** 8
+"""
+Modulo applied to the hashed id
+"""
+
+ids_hashed = {}
+"""
+Cache of hashed ids by id string
+"""
 
 
 class IdError(Exception):
@@ -13,52 +27,278 @@ class IdError(Exception):
     """
 
 
+def hash_id(description_id):
+    """
+    This method hashes the id string as an integer.
+    Results are cached per distinct id string, hashlib is imported on
+    the first miss so importing descriptions stays cheap.
+    :param description_id: string
+    :return: integer
+    """
+    try:
+        return ids_hashed[description_id]
+    except KeyError:
+        pass
+
+    import hashlib
+
+    value = int.from_bytes(
+        hashlib.sha1(description_id.encode("utf-8")).digest(), "big"
+    ) % ID_MODULO
+
+    ids_hashed[description_id] = value
+
+    return value
+
+
+def hash_ids(description_ids):
+    """
+    This method hashes a batch of id strings as integers.
+    Every distinct id string is hashed once.
+    :param description_ids: list
+    :return: list
+    """
+    import hashlib
+
+    sha1 = hashlib.sha1
+
+    for description_id in set(description_ids).difference(ids_hashed):
+        ids_hashed[description_id] = int.from_bytes(
+            sha1(description_id.encode("utf-8")).digest(), "big"
+        ) % ID_MODULO
+
+    return [ids_hashed[x] for x in description_ids]
+
+
+DESCRIPTION_KEYS = ("id", "key", "value", "locales")
+"""
+Keys stored in the slots of a Description
+"""
+
+description_keys = frozenset(DESCRIPTION_KEYS)
+"""
+Set of keys stored in the slots of a Description
+"""
+
+
+class DescriptionConfig(MutableMapping):
+    """
+    This class models the config dictionary of a description
+
+    Reads and writes go to the fields of the description and its extra
+    dictionary, so changes through the config change the description.
+    The keys id, key, value and locales are always present, deleting one
+    of them resets it to None.
+    """
+
+    __slots__ = ("description",)
+
+    def __init__(self, description):
+        """
+        This method initializes a new instance of the DescriptionConfig
+        class.
+        :param description: bootstrap.Description
+        :return:
+        """
+        self.description = description
+
+    def __getitem__(self, name):
+        """
+        This method returns the field or extra value of the description.
+        :param name: string
+        :return: mixed
+        """
+        if name in description_keys:
+            return getattr(self.description, name)
+
+        extra = self.description.extra
+
+        if extra is None or name not in extra:
+            raise KeyError(name)
+
+        return extra[name]
+
+    def __setitem__(self, name, value):
+        """
+        This method sets the field or extra value of the description.
+        :param name: string
+        :param value: mixed
+        :return:
+        """
+        description = self.description
+
+        if name in description_keys:
+            if name == "key" and value.__class__ is str:
+                value = intern(value)
+
+            setattr(description, name, value)
+
+            return
+
+        if description.extra is None:
+            description.extra = {}
+
+        description.extra[name] = value
+
+    def __delitem__(self, name):
+        """
+        This method resets the field or removes the extra value of the
+        description.
+        :param name: string
+        :return:
+        """
+        description = self.description
+
+        if name in description_keys:
+            setattr(description, name, None)
+
+            return
+
+        if description.extra is None or name not in description.extra:
+            raise KeyError(name)
+
+        del description.extra[name]
+
+        if not description.extra:
+            description.extra = None
+
+    def __iter__(self):
+        """
+        This method iterates over the fields and extra keys.
+        :return: iterator
+        """
+        yield from DESCRIPTION_KEYS
+
+        if self.description.extra is not None:
+            yield from list(self.description.extra)
+
+    def __len__(self):
+        """
+        This method returns the number of fields and extra keys.
+        :return: integer
+        """
+        return len(DESCRIPTION_KEYS) + len(self.description.extra or ())
+
+    def __repr__(self):
+        """
+        This method implements the representation of the config.
+        :return: string
+        """
+        return repr(self.copy())
+
+    def copy(self):
+        """
+        This method returns the config as new dictionary.
+        :return: dict
+        """
+        description = self.description
+
+        config = {
+            "id": description.id,
+            "key": description.key,
+            "value": description.value,
+            "locales": description.locales
+        }
+
+        if description.extra is not None:
+            config.update(description.extra)
+
+        return config
+
+
 class Description(object):
     """
     This class models a generic description
     """
 
+    __slots__ = DESCRIPTION_KEYS + ("extra",)
+
     def __init__(self, config):
         """
         This method initializes a new instance of the Description class.
+        Keys other than id, key, value and locales are kept in extra.
         :param config: dict
         :return:
         """
-        default_config = {
-            "id": None,
-            "key": None,
-            "value": None,
-            "locales": None
-        }
+        get = config.get
+
+        key = get("key")
+
+        if key.__class__ is str:
+            key = intern(key)
+
+        self.id = get("id")
+        self.key = key
+        self.value = get("value")
+        self.locales = get("locales")
+        self.extra = None
 
-        self.config = {**default_config, **config}
+        if not config.keys() <= description_keys:
+            self.extra = {
+                x: y for x, y in config.items() if x not in description_keys
+            }
 
     def __getattr__(self, name):
         """
         This method implements __getattr__ for looking up
-        attributes from config dictionary.
+        attributes from the extra dictionary.
         :param name: string
         :return: mixed
         """
-        if name in self.config.keys():
-            return self.config[name]
+        if not name.startswith("__"):
+            try:
+                extra = object.__getattribute__(self, "extra")
+            except AttributeError:
+                extra = None
+
+            if extra is not None and name in extra:
+                return extra[name]
 
         raise AttributeError(
             "type object 'Description' has no attribute '{}'".format(name)
         )
 
+    @property
+    def config(self):
+        """
+        This method implements the config dictionary of the description,
+        changes through the config change the description.
+        :return: bootstrap.classes.description.DescriptionConfig
+        """
+        return DescriptionConfig(self)
+
+    @config.setter
+    def config(self, config):
+        """
+        This method replaces the fields and extra keys of the description
+        by the config.
+        :param config: dict
+        :return:
+        """
+        Description.__init__(self, dict(config))
+
     def GetId(self):
         """
         This method implements the hashing of the id attribute
-        as an integer.
+        as an integer. A fixed integer may be assigned by the id_value
+        key, ids marked as external have no integer of their own.
         :return: integer
         """
         if not self.id:
             raise IdError("No id has been assigned")
 
-        return int(
-            hashlib.sha1(self.id.encode('utf-8')).hexdigest(), 16
-        ) % (10 ** 8)
+        extra = self.extra
+
+        if extra is not None:
+            value = extra.get("id_value")
+
+            if value is not None:
+                return value
+
+            if extra.get("external"):
+                raise IdError("The id {} is external".format(self.id))
+
+        return hash_id(self.id)
 
 
 class Assignment(Description):
@@ -66,6 +306,8 @@ class Assignment(Description):
     This class provides sugar for an Assignment type Description
     """
 
+    __slots__ = ()
+
     def __init__(self, key=None, value=None, config=None):
         """
         This method initializes a new instance of the Assignment class.
@@ -76,13 +318,13 @@ class Assignment(Description):
         if config is None:
             config = {}
 
-        default_config = {
-            **config,
-            "key": key,
-            "value": value
-        }
+        super(Assignment, self).__init__(config)
+
+        if key.__class__ is str:
+            key = intern(key)
 
-        super(Assignment, self).__init__(default_config)
+        self.key = key
+        self.value = value
 
 
 class Group(Description):
@@ -90,6 +332,8 @@ class Group(Description):
     This class provides sugar for a Group type Description
     """
 
+    __slots__ = ()
+
     def __init__(self, description_id, config=None):
         """
         This method initializes a new instance of the Group class.
@@ -100,13 +344,10 @@ class Group(Description):
         if config is None:
             config = {}
 
-        default_config = {
-            **config,
-            "id": description_id,
-            "key": "GROUP"
-        }
+        super(Group, self).__init__(config)
 
-        super(Group, self).__init__(default_config)
+        self.id = description_id
+        self.key = "GROUP"
 
 
 class Container(Description):
@@ -114,6 +355,8 @@ class Container(Description):
     This class provides sugar for a Container type Description
     """
 
+    __slots__ = ()
+
     def __init__(self, description_id, config=None):
         """
         This method initializes a new instance of the Container class.
@@ -124,10 +367,7 @@ class Container(Description):
         if config is None:
             config = {}
 
-        default_config = {
-            **config,
-            "id": description_id,
-            "key": "CONTAINER"
-        }
+        super(Container, self).__init__(config)
 
-        super(Container, self).__init__(default_config)
\ No newline at end of file
+        self.id = description_id
+        self.key = "CONTAINER"
@@ -0,0 +1,374 @@
+"""
+This module provides generic DescriptionIndex class
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import gc
+
+from bootstrap.classes.description import IdError
+
+
+def get_name(description):
+    """
+    This method returns the id or else the key of the description as
+    used in paths.
+    :param description: bootstrap.Description
+    :return: string
+    """
+    name = description.id or description.key
+
+    return "?" if name is None else str(name)
+
+
+class DescriptionIndex(object):
+    """
+    This class models an index of the descriptions of a tree
+
+    The index is built in a single traversal and maps ids, hashed ids and
+    keys to their descriptions as well as every description to its
+    parents. A description placed in several containers is indexed once
+    and keeps all of its parents. Replace, Insert and Remove change the
+    tree and update the index for the changed subtrees only.
+    """
+
+    def __init__(self, description):
+        """
+        This method initializes a new instance of the DescriptionIndex
+        class. The garbage collector is paused while the tree is indexed
+        like in bootstrap.table.build_table.
+        :param description: bootstrap.Description
+        :return:
+        """
+        self.root = description
+
+        self.nodes = {}
+        self.parents = {}
+
+        self.ids = {}
+        self.values = {}
+        self.keys = {}
+
+        enabled = gc.isenabled()
+
+        gc.disable()
+
+        try:
+            self.Add(description)
+        finally:
+            if enabled:
+                gc.enable()
+
+    def __len__(self):
+        """
+        This method returns the number of distinct descriptions.
+        :return: integer
+        """
+        return len(self.nodes)
+
+    def __contains__(self, description):
+        """
+        This method checks whether the description is part of the tree.
+        :param description: bootstrap.Description
+        :return: boolean
+        """
+        return id(description) in self.nodes
+
+    def Add(self, description, parent=None):
+        """
+        This method indexes the description placed in parent along with
+        its children. Descriptions already indexed only gain the parent.
+        :param description: bootstrap.Description
+        :param parent: bootstrap.Description
+        :return:
+        """
+        nodes = self.nodes
+        nodes_parents = self.parents
+
+        stack = [(description, parent)]
+
+        while stack:
+            item, parent = stack.pop()
+
+            parents = nodes_parents.get(id(item))
+
+            if parents is not None:
+                if parent is not None:
+                    parents.append(parent)
+
+                continue
+
+            description_id = item.id
+            key = item.key
+            value = None
+
+            if description_id:
+                self.Link(self.ids, description_id, item)
+
+                try:
+                    value = item.GetId()
+                except (IdError, AttributeError):
+                    pass
+
+                if value is not None:
+                    self.Link(self.values, value, item)
+
+            if key is not None:
+                self.Link(self.keys, key, item)
+
+            nodes[id(item)] = (item, description_id, value, key)
+            nodes_parents[id(item)] = [] if parent is None else [parent]
+
+            if isinstance(item.value, list):
+                stack.extend((x, item) for x in reversed(item.value))
+
+    def Discard(self, description, parent=None):
+        """
+        This method removes the parent from the description and drops the
+        description along with its children from the index once it has
+        no parents left.
+        :param description: bootstrap.Description
+        :param parent: bootstrap.Description
+        :return:
+        """
+        stack = [(description, parent)]
+
+        while stack:
+            item, parent = stack.pop()
+
+            parents = self.parents.get(id(item))
+
+            if parents is None:
+                continue
+
+            if parent is not None:
+                for index, x in enumerate(parents):
+                    if x is parent:
+                        del parents[index]
+
+                        break
+
+            if parents:
+                continue
+
+            item, description_id, value, key = self.nodes.pop(id(item))
+
+            del self.parents[id(item)]
+
+            self.Unlink(self.ids, description_id, item)
+            self.Unlink(self.values, value, item)
+            self.Unlink(self.keys, key, item)
+
+            if isinstance(item.value, list):
+                stack.extend((x, item) for x in item.value)
+
+    def Link(self, mapping, name, description):
+        """
+        This method adds the description to the entry of mapping.
+        :param mapping: dict
+        :param name: mixed
+        :param description: bootstrap.Description
+        :return:
+        """
+        entry = mapping.get(name)
+
+        if entry is None:
+            mapping[name] = {id(description): description}
+        else:
+            entry[id(description)] = description
+
+    def Unlink(self, mapping, name, description):
+        """
+        This method removes the description from the entry of mapping.
+        :param mapping: dict
+        :param name: mixed
+        :param description: bootstrap.Description
+        :return:
+        """
+        entry = mapping.get(name)
+
+        if entry is None:
+            return
+
+        entry.pop(id(description), None)
+
+        if not entry:
+            del mapping[name]
+
+    def GetParents(self, description):
+        """
+        This method returns all parents of the description.
+        :param description: bootstrap.Description
+        :return: list
+        """
+        try:
+            return list(self.parents[id(description)])
+        except KeyError:
+            raise KeyError("description is not part of the index")
+
+    def Get(self, description_id):
+        """
+        This method returns the first description with the id or None.
+        :param description_id: string
+        :return: bootstrap.Description
+        """
+        return next(iter(self.ids.get(description_id, {}).values()), None)
+
+    def GetAll(self, description_id):
+        """
+        This method returns all descriptions with the id.
+        :param description_id: string
+        :return: list
+        """
+        return list(self.ids.get(description_id, {}).values())
+
+    def GetByValue(self, value):
+        """
+        This method returns the first description whose id hashes to the
+        value or None.
+        :param value: integer
+        :return: bootstrap.Description
+        """
+        return next(iter(self.values.get(value, {}).values()), None)
+
+    def GetByKey(self, key):
+        """
+        This method returns all descriptions with the key.
+        :param key: string
+        :return: list
+        """
+        return list(self.keys.get(key, {}).values())
+
+    def GetParent(self, description):
+        """
+        This method returns the first parent of the description or None.
+        :param description: bootstrap.Description
+        :return: bootstrap.Description
+        """
+        parents = self.GetParents(description)
+
+        return parents[0] if parents else None
+
+    def GetAncestors(self, description):
+        """
+        This method returns the parent of the description, its parent and
+        so on up to the root following the first parent of every
+        description.
+        :param description: bootstrap.Description
+        :return: list
+        """
+        ancestors = []
+
+        parent = self.GetParent(description)
+
+        while parent is not None:
+            ancestors.append(parent)
+
+            parent = self.GetParent(parent)
+
+        return ancestors
+
+    def GetPath(self, description):
+        """
+        This method returns the path of the description from the root
+        using the id or else the key of every description.
+        :param description: bootstrap.Description
+        :return: string
+        """
+        items = [description] + self.GetAncestors(description)
+
+        return "/".join(get_name(x) for x in reversed(items))
+
+    def Find(self, path):
+        """
+        This method returns all descriptions matching the path. Every
+        segment of the path matches the id or else the key of a
+        description, the first segment matches the root.
+        :param path: string
+        :return: list
+        """
+        segments = path.strip("/").split("/")
+
+        found = [self.root] if get_name(self.root) == segments[0] else []
+
+        for segment in segments[1:]:
+            found = [
+                child for item in found if isinstance(item.value, list)
+                for child in item.value if get_name(child) == segment
+            ]
+
+        return found
+
+    def Replace(self, description, replacement):
+        """
+        This method replaces the description with the replacement in all
+        of its parents, or as root, and updates the index for both
+        subtrees only. To update a description changed in place, replace
+        it with a copy.
+        :param description: bootstrap.Description
+        :param replacement: bootstrap.Description
+        :return:
+        """
+        parents = self.GetParents(description)
+
+        if not parents:
+            self.Discard(description)
+            self.Add(replacement)
+
+            self.root = replacement
+
+            return
+
+        for parent in {id(x): x for x in parents}.values():
+            for index, item in enumerate(parent.value):
+                if item is not description:
+                    continue
+
+                parent.value[index] = replacement
+
+                self.Add(replacement, parent)
+                self.Discard(description, parent)
+
+    def Insert(self, parent, description, position=None):
+        """
+        This method inserts the description into the children of parent
+        at position, or appends it, and indexes it.
+        :param parent: bootstrap.Description
+        :param description: bootstrap.Description
+        :param position: integer
+        :return:
+        """
+        if parent not in self:
+            raise KeyError("description is not part of the index")
+
+        if not isinstance(parent.value, list):
+            parent.value = []
+
+        if position is None:
+            parent.value.append(description)
+        else:
+            parent.value.insert(position, description)
+
+        self.Add(description, parent)
+
+    def Remove(self, description):
+        """
+        This method removes the description from all of its parents and
+        drops it from the index.
+        :param description: bootstrap.Description
+        :return:
+        """
+        parents = self.GetParents(description)
+
+        if not parents:
+            raise ValueError("the root can not be removed")
+
+        for parent in {id(x): x for x in parents}.values():
+            count = len(parent.value)
+
+            parent.value[:] = [
+                x for x in parent.value if x is not description
+            ]
+
+            for index in range(count - len(parent.value)):
+                self.Discard(description, parent)
@@ -0,0 +1,201 @@
+"""
+This module provides generic Instrumentation class
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+
+
+class Instrumentation(object):
+    """
+    This class models the instrumentation of the stages of a build
+    """
+
+    def __init__(self, trace_memory=False):
+        """
+        This method initializes a new instance of the Instrumentation class.
+        With trace_memory the peak memory of every stage is measured with
+        tracemalloc, which slows the build down considerably and requires
+        python 3.9 for resetting the peak.
+        :param trace_memory: boolean
+        :return:
+        """
+        if trace_memory:
+            import tracemalloc
+
+            if not hasattr(tracemalloc, "reset_peak"):
+                raise RuntimeError("tracing memory requires python 3.9")
+
+        self.trace_memory = trace_memory
+
+        self.origin = time.perf_counter()
+        self.stages = []
+
+        self.memory_lock = threading.Lock()
+        self.memory_stages = []
+
+    @contextmanager
+    def Stage(self, name, **data):
+        """
+        This method measures the stage executed inside the context.
+        The yielded dictionary may be updated with additional data
+        like node counts or bytes written.
+        :param name: string
+        :return: dict
+        """
+        memory = None
+
+        if self.trace_memory:
+            memory = self.StartMemory()
+
+        stage = {
+            "name": name,
+            "thread": threading.get_ident(),
+            "data": data
+        }
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            yield data
+        finally:
+            stage["start"] = wall_start - self.origin
+            stage["wall"] = time.perf_counter() - wall_start
+            stage["cpu"] = time.process_time() - cpu_start
+
+            if memory is not None:
+                stage["memory"] = self.StopMemory(memory)
+
+            self.stages.append(stage)
+
+    def UpdateMemory(self):
+        """
+        This method raises the peak of every open stage to the peak traced
+        memory since the last reset and resets the peak, so stages nested
+        in others do not lose the peak of the outer stages.
+        :return:
+        """
+        import tracemalloc
+
+        peak = tracemalloc.get_traced_memory()[1]
+
+        for memory in self.memory_stages:
+            memory[1] = max(memory[1], peak)
+
+        tracemalloc.reset_peak()
+
+    def StartMemory(self):
+        """
+        This method opens the memory measurement of a stage.
+        :return: list
+        """
+        import tracemalloc
+
+        with self.memory_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            self.UpdateMemory()
+
+            current = tracemalloc.get_traced_memory()[0]
+
+            memory = [current, current]
+
+            self.memory_stages.append(memory)
+
+            return memory
+
+    def StopMemory(self, memory):
+        """
+        This method closes the memory measurement of a stage and returns
+        its peak memory above the memory at its start.
+        :param memory: list
+        :return: integer
+        """
+        with self.memory_lock:
+            self.UpdateMemory()
+
+            self.memory_stages = [
+                x for x in self.memory_stages if x is not memory
+            ]
+
+            return memory[1] - memory[0]
+
+    def GetReport(self):
+        """
+        This method returns the measured stages in the order they started.
+        :return: dict
+        """
+        return {
+            "stages": sorted(self.stages, key=lambda x: x["start"])
+        }
+
+    def GetTrace(self):
+        """
+        This method returns the measured stages as chrome trace events.
+        :return: dict
+        """
+        process = os.getpid()
+
+        return {
+            "traceEvents": [
+                {
+                    "name": x["name"],
+                    "cat": "bootstrap",
+                    "ph": "X",
+                    "ts": x["start"] * 10 ** 6,
+                    "dur": x["wall"] * 10 ** 6,
+                    "pid": process,
+                    "tid": x["thread"],
+                    "args": {
+                        **x["data"],
+                        "cpu": x["cpu"],
+                        "memory": x.get("memory")
+                    }
+                }
+                for x in self.GetReport()["stages"]
+            ],
+            "displayTimeUnit": "ms"
+        }
+
+    def WriteReport(self, report_file):
+        """
+        This method writes the report as json.
+        :param report_file: string
+        :return:
+        """
+        with open(report_file, "w") as f:
+            json.dump(self.GetReport(), f, indent=2)
+
+    def WriteTrace(self, trace_file):
+        """
+        This method writes the chrome trace event file.
+        :param trace_file: string
+        :return:
+        """
+        with open(trace_file, "w") as f:
+            json.dump(self.GetTrace(), f)
+
+
+@contextmanager
+def measure(instrumentation, name, **data):
+    """
+    This method measures the stage if instrumentation is provided.
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param name: string
+    :return: dict
+    """
+    if instrumentation is None:
+        yield data
+
+        return
+
+    with instrumentation.Stage(name, **data) as stage:
+        yield stage
@@ -0,0 +1,493 @@
+"""
+This module provides generic Output class and in-memory and zip archive
+outputs
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import io
+import logging
+import os
+import sys
+import threading
+import uuid
+
+from bootstrap.classes.writer import Writer
+from bootstrap.utilities.manifest import load_manifest, save_manifest
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+    import msvcrt
+
+LOCK_FILENAME = ".bootstrap-lock"
+"""
+Name of the lock file in the destination directory
+"""
+
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+"""
+Timestamp of all archived files, which keeps archives reproducible
+"""
+
+logger = logging.getLogger(__name__)
+"""
+Logger for reporting written files
+"""
+
+
+class Output(object):
+    """
+    This class models the files written to a destination directory
+
+    Files are streamed to unique temporary files next to their
+    destination and moved into place by Commit, so readers never see
+    partially written files and concurrent builds never share a
+    temporary file.
+    """
+
+    def __init__(self, destination_directory, lock=False):
+        """
+        This method initializes a new instance of the Output class.
+        With lock the destination directory is locked while the output is
+        used as context manager.
+        :param destination_directory: string
+        :param lock: boolean
+        :return:
+        """
+        self.destination_directory = destination_directory
+        self.lock = lock
+        self.lock_path = None
+
+        self.directories = set()
+        self.pending = []
+
+        self.lock_file = None
+
+    def __enter__(self):
+        """
+        This method locks the destination directory if requested.
+        :return: bootstrap.classes.output.Output
+        """
+        if self.lock:
+            self.Lock()
+
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        This method commits all pending files unless an exception
+        occurred, in which case they are discarded.
+        :return: boolean
+        """
+        try:
+            if exception_type is None:
+                self.Commit()
+            else:
+                self.Discard()
+        finally:
+            self.Unlock()
+
+        return False
+
+    def AssertDirectory(self, directory):
+        """
+        This method creates the directory unless it was already created
+        by this output.
+        :param directory: string
+        :return:
+        """
+        if directory in self.directories:
+            return
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.directories.add(directory)
+
+    def Lock(self):
+        """
+        This method blocks until the lock file of the output is locked.
+        :return:
+        """
+        if self.lock_file is not None:
+            return
+
+        lock_path = self.lock_path
+
+        if lock_path is None:
+            lock_path = os.path.join(
+                self.destination_directory, LOCK_FILENAME
+            )
+
+        self.AssertDirectory(os.path.dirname(lock_path))
+
+        self.lock_file = open(lock_path, "a")
+
+        if fcntl is not None:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    def Unlock(self):
+        """
+        This method releases the lock of the lock file of the output.
+        :return:
+        """
+        if self.lock_file is None:
+            return
+
+        if fcntl is not None:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.lock_file.seek(0)
+
+            msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+        self.lock_file.close()
+        self.lock_file = None
+
+    def LoadManifest(self):
+        """
+        This method loads the manifest of the previous build.
+        :return: dict
+        """
+        return load_manifest(self.destination_directory)
+
+    def SaveManifest(self, manifest):
+        """
+        This method saves the manifest of the build.
+        :param manifest: dict
+        :return:
+        """
+        save_manifest(self.destination_directory, manifest)
+
+    def Write(self, relative_path, stream, previous_hash=None):
+        """
+        This method streams the contents to a temporary file.
+        The file is dropped if its hash equals the previous hash and the
+        destination file exists, otherwise it is moved into place on
+        Commit. Returns the hash, the size and whether it is pending.
+        :param relative_path: string
+        :param stream: callable
+        :param previous_hash: string
+        :return: tuple
+        """
+        destination_file = os.path.join(
+            self.destination_directory, relative_path
+        )
+
+        directory = os.path.dirname(destination_file)
+
+        self.AssertDirectory(directory)
+
+        temporary_file = os.path.join(directory, ".{}.{}.tmp".format(
+            os.path.basename(destination_file), uuid.uuid4().hex
+        ))
+
+        temporary_object = open(temporary_file, "x")
+
+        try:
+            with temporary_object as f:
+                writer = Writer(f)
+
+                stream(writer)
+        except BaseException:
+            os.remove(temporary_file)
+
+            raise
+
+        contents_hash = writer.GetHash()
+
+        if contents_hash == previous_hash \
+                and os.path.isfile(destination_file):
+            os.remove(temporary_file)
+
+            logger.info("unchanged %s", destination_file)
+
+            return contents_hash, writer.size, False
+
+        self.pending.append((temporary_file, destination_file))
+
+        return contents_hash, writer.size, True
+
+    def Commit(self):
+        """
+        This method moves all pending files into place.
+        :return: list
+        """
+        destination_files = []
+
+        for temporary_file, destination_file in self.pending:
+            os.replace(temporary_file, destination_file)
+
+            logger.info("done writing %s", destination_file)
+
+            destination_files.append(destination_file)
+
+        self.pending = []
+
+        return destination_files
+
+    def Discard(self):
+        """
+        This method removes all pending files.
+        :return:
+        """
+        for temporary_file, destination_file in self.pending:
+            if os.path.isfile(temporary_file):
+                os.remove(temporary_file)
+
+        self.pending = []
+
+
+class MemoryOutput(Output):
+    """
+    This class models files written to a dictionary
+
+    Files are kept as strings by their slash separated relative path.
+    Nothing is written to disk, builds into a memory output always
+    rebuild every file.
+    """
+
+    def __init__(self, files=None):
+        """
+        This method initializes a new instance of the MemoryOutput class.
+        :param files: dict
+        :return:
+        """
+        super(MemoryOutput, self).__init__(None)
+
+        if files is None:
+            files = {}
+
+        self.files = files
+
+    def LoadManifest(self):
+        """
+        This method returns an empty manifest.
+        :return: dict
+        """
+        return {}
+
+    def SaveManifest(self, manifest):
+        """
+        This method does nothing as memory outputs are not kept.
+        :param manifest: dict
+        :return:
+        """
+
+    def Write(self, relative_path, stream, previous_hash=None):
+        """
+        This method streams the contents to a string which is added to
+        files on Commit. Returns the hash, the size and whether it is
+        pending.
+        :param relative_path: string
+        :param stream: callable
+        :param previous_hash: string
+        :return: tuple
+        """
+        relative_path = relative_path.replace(os.sep, "/")
+
+        writer = Writer(io.StringIO())
+
+        stream(writer)
+
+        self.pending.append((relative_path, writer.file_object.getvalue()))
+
+        return writer.GetHash(), writer.size, True
+
+    def Commit(self):
+        """
+        This method adds all pending files to files.
+        :return: list
+        """
+        relative_paths = []
+
+        for relative_path, contents in self.pending:
+            self.files[relative_path] = contents
+
+            relative_paths.append(relative_path)
+
+        self.pending = []
+
+        return relative_paths
+
+    def Discard(self):
+        """
+        This method drops all pending files.
+        :return:
+        """
+        self.pending = []
+
+
+class ZipOutput(Output):
+    """
+    This class models files written to a zip archive
+
+    Files are streamed into a temporary archive next to the archive file
+    in a single pass, which is moved into place by Commit. Files are
+    stored below prefix inside the archive. Builds into an archive always
+    rebuild every file.
+    """
+
+    def __init__(self, archive_file, prefix="", lock=False,
+                 compression=None):
+        """
+        This method initializes a new instance of the ZipOutput class.
+        With lock the archive is locked by a lock file named after it
+        while the output is used as context manager, archives next to it
+        are not affected. Without compression files are deflated.
+        :param archive_file: string
+        :param prefix: string
+        :param lock: boolean
+        :param compression: integer
+        :return:
+        """
+        # imported here as most builds are not archived
+        import zipfile
+
+        if compression is None:
+            compression = zipfile.ZIP_DEFLATED
+
+        super(ZipOutput, self).__init__(
+            os.path.dirname(os.path.abspath(archive_file)), lock
+        )
+
+        self.archive_file = archive_file
+        self.lock_path = "{}.lock".format(os.path.abspath(archive_file))
+        self.prefix = prefix.strip("/")
+        self.compression = compression
+
+        self.archive = None
+        self.temporary_file = None
+
+        self.write_lock = threading.Lock()
+
+    def LoadManifest(self):
+        """
+        This method returns an empty manifest.
+        :return: dict
+        """
+        return {}
+
+    def SaveManifest(self, manifest):
+        """
+        This method does nothing as the archive holds no manifest.
+        :param manifest: dict
+        :return:
+        """
+
+    def Open(self):
+        """
+        This method opens the temporary archive unless already opened.
+        :return: zipfile.ZipFile
+        """
+        if self.archive is not None:
+            return self.archive
+
+        self.AssertDirectory(self.destination_directory)
+
+        self.temporary_file = os.path.join(
+            self.destination_directory, ".{}.{}.tmp".format(
+                os.path.basename(self.archive_file), uuid.uuid4().hex
+            )
+        )
+
+        import zipfile
+
+        self.archive = zipfile.ZipFile(
+            self.temporary_file, "x", self.compression
+        )
+
+        return self.archive
+
+    def Write(self, relative_path, stream, previous_hash=None):
+        """
+        This method streams the contents into the archive. Returns the
+        hash, the size and whether it is pending. Files are written one
+        at a time, concurrent calls wait for each other.
+        :param relative_path: string
+        :param stream: callable
+        :param previous_hash: string
+        :return: tuple
+        """
+        with self.write_lock:
+            return self.WriteArchive(relative_path, stream)
+
+    def WriteArchive(self, relative_path, stream):
+        """
+        This method streams the contents into the archive.
+        :param relative_path: string
+        :param stream: callable
+        :return: tuple
+        """
+        import zipfile
+
+        archive = self.Open()
+
+        name = "/".join(
+            x for x in (self.prefix, relative_path.replace(os.sep, "/")) if x
+        )
+
+        info = zipfile.ZipInfo(name, ZIP_DATE_TIME)
+        info.compress_type = self.compression
+        info.external_attr = 0o644 << 16
+
+        if sys.version_info < (3, 6):
+            writer = Writer(io.StringIO())
+
+            stream(writer)
+
+            archive.writestr(
+                info, writer.file_object.getvalue().encode("utf-8")
+            )
+        else:
+            with io.TextIOWrapper(
+                archive.open(info, "w"), encoding="utf-8", newline=""
+            ) as f:
+                writer = Writer(f)
+
+                stream(writer)
+
+        self.pending.append(name)
+
+        return writer.GetHash(), writer.size, True
+
+    def Commit(self):
+        """
+        This method closes the archive and moves it into place unless
+        nothing was written since the last commit.
+        :return: list
+        """
+        if self.archive is None:
+            return []
+
+        names = self.pending
+
+        self.archive.close()
+
+        os.replace(self.temporary_file, self.archive_file)
+
+        logger.info("done writing %s", self.archive_file)
+
+        self.archive = None
+        self.temporary_file = None
+        self.pending = []
+
+        return names
+
+    def Discard(self):
+        """
+        This method closes and removes the temporary archive.
+        :return:
+        """
+        if self.archive is not None:
+            self.archive.close()
+
+            os.remove(self.temporary_file)
+
+        self.archive = None
+        self.temporary_file = None
+        self.pending = []
@@ -0,0 +1,157 @@
+"""
+This module provides a registry for detecting id collisions
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import json
+import os
+
+from bootstrap.classes.description import IdError, hash_ids
+
+
+class IdCollisionError(IdError):
+    """
+    ID Collision Error Exception class
+    """
+
+
+class IdRegistry(object):
+    """
+    This class models a registry of id strings and their integers
+    """
+
+    def __init__(self, ledger_file=None):
+        """
+        This method initializes a new instance of the IdRegistry class.
+        The ledger keeps every integer ever assigned, so an integer of an
+        id that has been removed is not silently reused by another id.
+        :param ledger_file: string
+        :return:
+        """
+        self.ledger_file = ledger_file
+
+        self.ids = {}
+        self.owners = {}
+        self.sources = {}
+        self.collisions = []
+
+        self.ledger = {}
+
+        if ledger_file is not None and os.path.isfile(ledger_file):
+            with open(ledger_file, "r") as f:
+                self.ledger = json.load(f)
+
+        self.ledger_owners = {y: x for x, y in self.ledger.items()}
+
+    def Update(self, description_ids, source=None, values=None):
+        """
+        This method registers the id strings and records collisions with
+        ids registered before or kept in the ledger. Values are the
+        integers of the ids, ids without a value are hashed.
+        :param description_ids: list
+        :param source: string
+        :param values: list
+        :return: list
+        """
+        if values is None:
+            values = hash_ids(description_ids)
+        elif None in values:
+            hashed = iter(hash_ids([
+                x for x, y in zip(description_ids, values) if y is None
+            ]))
+
+            values = [next(hashed) if x is None else x for x in values]
+
+        for description_id, value in zip(description_ids, values):
+            if description_id in self.ids:
+                continue
+
+            self.ids[description_id] = value
+            self.sources[description_id] = source
+
+            owner = self.owners.get(value)
+
+            if owner is None:
+                owner = self.ledger_owners.get(value)
+
+                if owner == description_id:
+                    owner = None
+
+            if owner is None:
+                self.owners[value] = description_id
+
+                continue
+
+            self.collisions.append({
+                "value": value,
+                "ids": [owner, description_id],
+                "sources": [self.sources.get(owner), source]
+            })
+
+        return values
+
+    def Register(self, description, source=None):
+        """
+        This method registers the ids of the description and its children.
+        Ids are registered with the integer GetId returns for them, so
+        fixed integers are checked as well and external ids are left out.
+        :param description: bootstrap.Description
+        :param source: string
+        :return: list
+        """
+        description_ids = []
+        values = []
+
+        stack = [description]
+
+        while stack:
+            item = stack.pop()
+
+            if isinstance(item.value, list):
+                stack.extend(reversed(item.value))
+
+            if not item.id:
+                continue
+
+            value = None
+
+            if item.extra is not None:
+                try:
+                    value = item.GetId()
+                except IdError:
+                    continue
+
+            description_ids.append(item.id)
+            values.append(value)
+
+        return self.Update(description_ids, source, values)
+
+    def Check(self):
+        """
+        This method raises an IdCollisionError for recorded collisions.
+        :return:
+        """
+        if not self.collisions:
+            return
+
+        raise IdCollisionError("\n".join(
+            "{} and {} both hash to {}".format(
+                *(collision["ids"] + [collision["value"]])
+            )
+            for collision in self.collisions
+        ))
+
+    def Save(self):
+        """
+        This method saves all registered ids to the ledger file.
+        :return:
+        """
+        if self.ledger_file is None:
+            return
+
+        for description_id, value in self.ids.items():
+            self.ledger.setdefault(description_id, value)
+
+        with open(self.ledger_file, "w") as f:
+            json.dump(self.ledger, f, indent=2, sort_keys=True)
@@ -6,6 +6,13 @@ __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
 import re
 
+from string import Formatter
+
+FORMAT_PATTERN = re.compile(r"\{(\w+)\}", re.MULTILINE)
+"""
+Pattern for finding format groups in a template line
+"""
+
 
 class Template(object):
     """
@@ -20,6 +27,10 @@ class Template(object):
         """
         self.template_string = template_string
 
+        self.lines = [
+            Template.CompileLine(x) for x in template_string.split("\n")
+        ]
+
     @classmethod
     def PrepareData(cls, data):
         """
@@ -35,6 +46,81 @@ class Template(object):
 
         return dataPrepared
 
+    @classmethod
+    def CompileLine(cls, line):
+        """
+        This method compiles a template line into its literal segments,
+        placeholder slots and indentation level.
+
+        Lines using format features other than plain named placeholders
+        are kept as is and rendered by RenderLine.
+        :param line: string
+        :return: tuple
+        """
+        literals = [""]
+        names = []
+
+        try:
+            for literal, name, spec, conversion in Formatter().parse(line):
+                literals[-1] += literal
+
+                if name is None:
+                    continue
+
+                if spec or conversion or name.isdigit() \
+                        or not re.fullmatch(r"\w+", name):
+                    raise ValueError("unsupported placeholder")
+
+                names.append(name)
+                literals.append("")
+        except ValueError:
+            return (line, None, None, None)
+
+        if names != re.findall(FORMAT_PATTERN, line):
+            return (line, None, None, None)
+
+        indentation = len(line) - len(line.lstrip())
+
+        return (
+            line,
+            "\n" + " " * indentation if indentation else None,
+            tuple(literals),
+            tuple(names)
+        )
+
+    @classmethod
+    def RenderLine(cls, line, data):
+        """
+        This method renders a single template line without compiling it.
+        :param line: string
+        :param data: dict
+        :return: string
+        """
+        groups = re.findall(FORMAT_PATTERN, line)
+
+        # remove format groups where no data is provided
+        for group in groups:
+            if group not in data.keys() or data[group] is None:
+                line = line.replace("{{{}}}".format(group), "")
+
+                line = line.strip()
+
+        if line:
+            # get indentation level
+            indentation = len(line) - len(line.lstrip())
+
+            # populate with data
+            dataPrepared = Template.PrepareData(data)
+
+            lineFormatted = line.format(**dataPrepared)
+
+            # add indentation
+            line = lineFormatted.replace(
+                "\n", "\n{}".format(" " * indentation)
+            )
+
+        return line
+
     def Render(self, data=None):
         """Render the template with the provided data.
 
@@ -47,34 +133,97 @@ class Template(object):
         if data is None:
             data = {}
 
-        formatPattern = re.compile(r"\{(\w+)\}", re.MULTILINE)
-
         lines = []
 
-        for line in self.template_string.split("\n"):
-            groups = re.findall(formatPattern, line)
+        for line, indentation, literals, names in self.lines:
+            if literals is None:
+                lines.append(Template.RenderLine(line, data))
+
+                continue
+
+            if not names:
+                lines.append(literals[0])
+
+                continue
+
+            values = []
+            dropped = False
 
-            # remove format groups where no data is provided
-            for group in groups:
-                if group not in data.keys() or data[group] is None:
-                    line = line.replace("{{{}}}".format(group), "")
+            for name in names:
+                value = data.get(name)
 
-                    line = line.strip()
+                if value is None:
+                    dropped = True
+                elif isinstance(value, list):
+                    value = "\n".join(value)
+                else:
+                    value = format(value, "")
 
-            if line:
-                # get indentation level
-                indentation = len(line) - len(line.lstrip())
+                values.append(value)
 
-                # populate with data
-                dataPrepared = Template.PrepareData(data)
+            if dropped:
+                lines.append(Template.JoinDropped(literals, values))
 
-                lineFormatted = line.format(**dataPrepared)
+                continue
 
-                # add indentation
-                line = lineFormatted.replace(
-                    "\n", "\n{}".format(" " * indentation)
-                )
+            parts = [literals[0]]
 
-            lines.append(line)
+            for value, literal in zip(values, literals[1:]):
+                if indentation is not None:
+                    value = value.replace("\n", indentation)
+
+                parts.append(value)
+                parts.append(literal)
+
+            lines.append("".join(parts))
 
         return "\n".join(lines)
+
+    def RenderParts(self, data, name):
+        """
+        This method renders the template around the placeholder name.
+        Returns the text before and after the placeholder as well as the
+        indentation Render would apply to new lines of its value.
+        :param data: dict
+        :param name: string
+        :return: tuple
+        """
+        head, tail = self.Render({**data, name: "\x00"}).split("\x00", 1)
+
+        for line, indentation, literals, names in self.lines:
+            if not names or name not in names:
+                continue
+
+            if indentation is None or any(
+                data.get(x) is None for x in names if x != name
+            ):
+                return head, tail, ""
+
+            return head, tail, indentation[1:]
+
+        return head, tail, ""
+
+    @classmethod
+    def JoinDropped(cls, literals, values):
+        """
+        This method joins a compiled line where placeholders without
+        data are removed and the line is stripped.
+        :param literals: tuple
+        :param values: list
+        :return: string
+        """
+        parts = [literals[0]]
+
+        for value, literal in zip(values, literals[1:]):
+            if value is None:
+                parts[-1] += literal
+
+                continue
+
+            parts.append(value)
+            parts.append(literal)
+
+        parts[0] = parts[0].lstrip()
+        parts[-1] = parts[-1].rstrip()
+
+        return "".join(parts)
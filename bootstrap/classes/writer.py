@@ -0,0 +1,67 @@
+"""
+This module provides generic Writer class
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import hashlib
+
+
+class Writer(object):
+    """
+    This class models a writer streaming indented text to a file object
+    """
+
+    def __init__(self, file_object):
+        """
+        This method initializes a new instance of the Writer class.
+        :param file_object: file
+        :return:
+        """
+        self.file_object = file_object
+
+        self.digest = hashlib.sha1()
+        self.size = 0
+
+        self.indentation = "\n"
+        self.indentations = []
+
+    def Write(self, text):
+        """
+        This method writes the text indenting every new line.
+        :param text: string
+        :return:
+        """
+        if self.indentations and "\n" in text:
+            text = text.replace("\n", self.indentation)
+
+        data = text.encode("utf-8")
+
+        self.digest.update(data)
+        self.size += len(data)
+
+        self.file_object.write(text)
+
+    def Indent(self, indentation):
+        """
+        This method increases the indentation of all following lines.
+        :param indentation: string
+        :return:
+        """
+        self.indentations.append(self.indentation)
+
+        self.indentation += indentation
+
+    def Dedent(self):
+        """
+        This method restores the previous indentation.
+        :return:
+        """
+        self.indentation = self.indentations.pop()
+
+    def GetHash(self):
+        """
+        This method returns the hash of all text written.
+        :return: string
+        """
+        return self.digest.hexdigest()
@@ -0,0 +1,314 @@
+"""
+This module provides methods for loading descriptions from json and toml
+documents
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import gc
+import json
+import marshal
+import os
+import sys
+import uuid
+
+import bootstrap
+from bootstrap.classes.description import Description
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import toml as tomllib
+    except ImportError:
+        tomllib = None
+
+SNAPSHOT_EXTENSION = ".snapshot"
+"""
+Extension appended to the document filename for its snapshot
+"""
+
+SNAPSHOT_VERSION = 1
+"""
+Version of the snapshot format
+"""
+
+
+class DocumentError(Exception):
+    """
+    Document Error Exception class
+    """
+
+
+def parse_document(document_file):
+    """
+    This method parses the json or toml document.
+    :param document_file: string
+    :return: dict
+    """
+    with open(document_file, "rb") as f:
+        contents = f.read().decode("utf-8")
+
+    if document_file.endswith(".toml"):
+        if tomllib is None:
+            raise DocumentError(
+                "reading {} requires python 3.11 or the toml package".format(
+                    document_file
+                )
+            )
+
+        return tomllib.loads(contents)
+
+    return json.loads(contents)
+
+
+def build_description(document):
+    """
+    This method builds the Description tree from the parsed document.
+    Every node is a dictionary with the config of a Description, a list
+    value holds the nodes of its children.
+    :param document: dict
+    :return: bootstrap.Description
+    """
+    description_root = None
+
+    stack = [(document, None, "")]
+
+    while stack:
+        node, siblings, path = stack.pop()
+
+        if not isinstance(node, dict):
+            raise DocumentError("{} is not a description".format(path or "/"))
+
+        children = node.get("value")
+
+        if isinstance(children, list):
+            description = Description({**node, "value": []})
+
+            stack.extend(
+                (x, description.value, "{}/value/{}".format(path, index))
+                for index, x in reversed(list(enumerate(children)))
+            )
+        else:
+            description = Description(node)
+
+        if siblings is None:
+            description_root = description
+        else:
+            siblings.append(description)
+
+    return description_root
+
+
+def dump_document(description):
+    """
+    This method converts the Description tree into a document which can
+    be saved as json or toml.
+    :param description: bootstrap.Description
+    :return: dict
+    """
+    document_root = None
+
+    stack = [(description, None)]
+
+    while stack:
+        item, siblings = stack.pop()
+
+        node = {
+            x: y for x, y in item.config.copy().items() if y is not None
+        }
+
+        if isinstance(item.value, list):
+            node["value"] = []
+
+            stack.extend((x, node["value"]) for x in reversed(item.value))
+
+        if siblings is None:
+            document_root = node
+        else:
+            siblings.append(node)
+
+    return document_root
+
+
+def dump_columns(description):
+    """
+    This method flattens the Description tree into columns of its fields
+    in depth first order along with the index of every parent.
+    :param description: bootstrap.Description
+    :return: tuple
+    """
+    ids = []
+    keys = []
+    values = []
+    locales = []
+    extras = []
+    parents = []
+    containers = []
+
+    stack = [(description, -1)]
+
+    while stack:
+        item, parent = stack.pop()
+
+        index = len(ids)
+
+        ids.append(item.id)
+        keys.append(item.key)
+        locales.append(item.locales)
+        extras.append(item.extra)
+        parents.append(parent)
+
+        if isinstance(item.value, list):
+            values.append(None)
+            containers.append(index)
+
+            stack.extend((x, index) for x in reversed(item.value))
+        else:
+            values.append(item.value)
+
+    return ids, keys, values, locales, extras, parents, containers
+
+
+def load_columns(columns):
+    """
+    This method rebuilds the Description tree from its columns. The
+    instances are filled in directly instead of being initialized, which
+    makes this considerably faster than building the tree from a document.
+    :param columns: tuple
+    :return: bootstrap.Description
+    """
+    ids, keys, values, locales, extras, parents, containers = columns
+
+    new = object.__new__
+
+    items = [new(Description) for x in ids]
+
+    for item, item_id, key, value, item_locales, extra in zip(
+        items, ids, keys, values, locales, extras
+    ):
+        item.id = item_id
+        item.key = key
+        item.value = value
+        item.locales = item_locales
+        item.extra = extra
+
+    for index in containers:
+        items[index].value = []
+
+    for item, parent in zip(items, parents):
+        if parent >= 0:
+            items[parent].value.append(item)
+
+    return items[0]
+
+
+def get_signature(document_file):
+    """
+    This method returns the signature a snapshot of the document has to
+    match to be loaded instead of the document.
+    :param document_file: string
+    :return: tuple
+    """
+    stat = os.stat(document_file)
+
+    return (
+        SNAPSHOT_VERSION,
+        bootstrap.__version__,
+        tuple(sys.version_info[:2]),
+        stat.st_size,
+        stat.st_mtime_ns
+    )
+
+
+def load_snapshot(snapshot_file, signature):
+    """
+    This method loads the Description tree from the snapshot unless
+    it is missing or its signature does not match. The file is read at
+    once, as marshal.load reads file objects in small chunks, and the
+    garbage collector is paused while the tree is restored, like in
+    bootstrap.table.build_table.
+    :param snapshot_file: string
+    :param signature: tuple
+    :return: bootstrap.Description
+    """
+    try:
+        with open(snapshot_file, "rb") as f:
+            contents = f.read()
+    except IOError:
+        return None
+
+    enabled = gc.isenabled()
+
+    gc.disable()
+
+    try:
+        try:
+            snapshot_signature, columns = marshal.loads(contents)
+        except (EOFError, ValueError, TypeError):
+            return None
+
+        if snapshot_signature != signature:
+            return None
+
+        return load_columns(columns)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def save_snapshot(snapshot_file, signature, description):
+    """
+    This method saves the snapshot of the Description tree. Trees holding
+    values marshal can not store and unwritable directories are skipped.
+    :param snapshot_file: string
+    :param signature: tuple
+    :param description: bootstrap.Description
+    :return: boolean
+    """
+    try:
+        contents = marshal.dumps((signature, dump_columns(description)))
+    except ValueError:
+        return False
+
+    temporary_file = "{}.{}.tmp".format(snapshot_file, uuid.uuid4().hex)
+
+    try:
+        with open(temporary_file, "xb") as f:
+            f.write(contents)
+
+        os.replace(temporary_file, snapshot_file)
+    except OSError:
+        if os.path.isfile(temporary_file):
+            os.remove(temporary_file)
+
+        return False
+
+    return True
+
+
+def load_document(document_file, snapshot=True):
+    """
+    This method loads the Description tree from the json or toml
+    document. Unless snapshot is False a snapshot of the tree is kept
+    next to the document and loaded instead while the document is
+    unchanged.
+    :param document_file: string
+    :param snapshot: boolean
+    :return: bootstrap.Description
+    """
+    if not snapshot:
+        return build_description(parse_document(document_file))
+
+    snapshot_file = document_file + SNAPSHOT_EXTENSION
+
+    signature = get_signature(document_file)
+
+    description = load_snapshot(snapshot_file, signature)
+
+    if description is None:
+        description = build_description(parse_document(document_file))
+
+        save_snapshot(snapshot_file, signature, description)
+
+    return description
@@ -5,20 +5,48 @@ This module provides methods for compiling the plugin
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
 
+import json
+import logging
 import os
 
-from imp import load_source
+from io import StringIO
 
 import bootstrap
-from bootstrap.reducers.res import reduce_resource
-from bootstrap.reducers.h import reduce_header
-from bootstrap.reducers.str import reduce_strings
+from bootstrap.reducers.fused import reduce_fused
 
-from bootstrap.render.res import render_resource
-from bootstrap.render.h import render_header
-from bootstrap.render.str import render_strings
+from bootstrap.render.res import stream_resource
+from bootstrap.render.h import stream_header
+from bootstrap.render.str import stream_strings
 
+from bootstrap.classes.output import Output
+from bootstrap.classes.writer import Writer
+from bootstrap.classes.instrumentation import measure
+
+from bootstrap.validation import validate_description,\
+    format_diagnostic,\
+    ValidationError,\
+    ERROR
 from bootstrap.utilities.path import assert_directories
+from bootstrap.utilities.sections import get_id_names,\
+    resolve_ids,\
+    compile_lines
+from bootstrap.utilities.imports import load_source,\
+    parse_imports,\
+    find_module,\
+    find_local_modules,\
+    get_package
+from bootstrap.utilities.manifest import hash_contents,\
+    hash_file,\
+    fingerprint_description,\
+    fingerprint_nodes,\
+    get_plugin_manifest,\
+    is_current
+from bootstrap.utilities.tree import walk
+
+logger = logging.getLogger(__name__)
+"""
+Logger for reporting build progress
+"""
 
 COMMENT_C = "// "
 """
@@ -37,181 +65,810 @@ PREFIX = "generated by bootstrap for c4d version {}".format(
 Prefix to prepend to compiled files
 """
 
+BUNDLE_PREAMBLE = """import os as _bootstrap_os
+import sys as _bootstrap_sys
+import types as _bootstrap_types
+
+
+def _bootstrap_module(name, path):
+    module = _bootstrap_types.ModuleType(name)
+    module.__file__ = _bootstrap_os.path.join(
+        _bootstrap_os.path.dirname(_bootstrap_os.path.abspath(__file__)),
+        path
+    )
+
+    if _bootstrap_os.path.basename(path) == "__init__.py":
+        module.__path__ = [_bootstrap_os.path.dirname(module.__file__)]
+        module.__package__ = name
+    else:
+        module.__package__ = name.rpartition(".")[0]
+
+    _bootstrap_sys.modules[name] = module
+
+
+def _bootstrap_exec(name, path, source):
+    module = _bootstrap_sys.modules[name]
+
+    exec(compile(source, path, "exec"), module.__dict__)
+
+    parent, _, child = name.rpartition(".")
+
+    if parent in _bootstrap_sys.modules:
+        setattr(_bootstrap_sys.modules[parent], child, module)
+"""
+"""
+Code prepended to bundled plugins for registering the bundled modules.
+All modules are registered before any is executed, as modules are
+executed in dependency order and so before the packages they belong to.
+"""
+
+STAGES = ("header", "resource", "strings", "plugin")
+"""
+Build stages tracked in the manifest
+"""
+
+PARALLEL_MODES = ("sequential", "thread", "process")
+"""
+Modes of writing the string files of the locales
+"""
+
+STRINGS_THREAD_ENTRIES = 5000
+"""
+Number of string entries from which locales are written on a thread pool
+"""
+
+STRINGS_PROCESS_ENTRIES = 100000
+"""
+Number of string entries from which locales are rendered on a process pool
+"""
+
+in_worker = False
+"""
+Whether the process is a worker of a process pool run by run_worker
+"""
+
+
+def write_stream(destination_directory, relative_path, stream,
+                 outputs=None, instrumentation=None, output=None):
+    """
+    This method streams the contents to the destination file unless the
+    destination file already holds the same contents according to
+    outputs.
+
+    Without output the file is moved into place right away, otherwise
+    it is moved into place when the output is committed.
+    :param destination_directory: string
+    :param relative_path: string
+    :param stream: callable
+    :param outputs: dict
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param output: bootstrap.classes.output.Output
+    :return: string
+    """
+    if output is None:
+        with Output(destination_directory) as output:
+            return write_stream(
+                destination_directory, relative_path, stream, outputs,
+                instrumentation, output
+            )
+
+    previous_hash = None
+
+    if outputs is not None:
+        previous_hash = outputs.get(relative_path)
 
-def write_resource(description, destination_directory, filename):
+    with measure(instrumentation, "write", path=relative_path) as stage:
+        contents_hash, stage["bytes"], stage["written"] = output.Write(
+            relative_path, stream, previous_hash
+        )
+
+    if outputs is not None:
+        outputs[relative_path] = contents_hash
+
+    return relative_path
+
+
+def write_contents(destination_directory, relative_path, contents,
+                   outputs=None, instrumentation=None, output=None):
+    """
+    This method writes the contents to the destination file unless
+    the file already holds the same contents according to outputs.
+    :param destination_directory: string
+    :param relative_path: string
+    :param contents: string
+    :param outputs: dict
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param output: bootstrap.classes.output.Output
+    :return: string
+    """
+    return write_stream(
+        destination_directory,
+        relative_path,
+        lambda writer: writer.Write(contents),
+        outputs,
+        instrumentation,
+        output
+    )
+
+
+def write_resource(description, destination_directory, filename,
+                   reduced=None, outputs=None, instrumentation=None,
+                   output=None):
     """
     This method compiles the description to a resource file.
     :param description: bootstrap.Description
     :param destination_directory: string
     :param filename: string
-    :return:
+    :param reduced: dict
+    :param outputs: dict
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param output: bootstrap.classes.output.Output
+    :return: list
     """
-    destination_file = os.path.join(
-        destination_directory, "res/description",
-        "{}.res".format(filename)
-    )
-
-    contents = render_resource(reduce_resource(description))
+    if reduced is None:
+        reduced = reduce_fused(description, ("resource",))
 
-    contents = "\n".join([COMMENT_C + PREFIX, contents])
+    relative_path = os.path.join("res/description", "{}.res".format(filename))
 
-    assert_directories(destination_file, True)
+    def stream(writer):
+        writer.Write(COMMENT_C + PREFIX + "\n")
 
-    with open(destination_file, "w") as f:
-        f.write(contents)
+        stream_resource(reduced["resource"], writer)
 
-    print("done writing {}".format(destination_file))
+    return [
+        write_stream(
+            destination_directory, relative_path, stream, outputs,
+            instrumentation, output
+        )
+    ]
 
 
-def write_header(description, destination_directory, filename):
+def write_header(description, destination_directory, filename,
+                 reduced=None, outputs=None, instrumentation=None,
+                 output=None):
     """
     This method compiles the description to a header file.
     :param description: bootstrap.Description
     :param destination_directory: string
     :param filename: string
-    :return:
+    :param reduced: dict
+    :param outputs: dict
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param output: bootstrap.classes.output.Output
+    :return: list
     """
-    destination_file = os.path.join(
-        destination_directory, "res/description",
-        "{}.h".format(filename)
-    )
+    if reduced is None:
+        reduced = reduce_fused(description, ("header",))
 
-    contents = render_header(reduce_header(description))
+    relative_path = os.path.join("res/description", "{}.h".format(filename))
 
-    contents = "\n".join([COMMENT_C + PREFIX, contents])
+    def stream(writer):
+        writer.Write(COMMENT_C + PREFIX + "\n")
 
-    assert_directories(destination_file, True)
+        stream_header(reduced["header"], writer)
 
-    with open(destination_file, "w") as f:
-        f.write(contents)
+    return [
+        write_stream(
+            destination_directory, relative_path, stream, outputs,
+            instrumentation, output
+        )
+    ]
+
+
+def get_parallel_mode(strings_reduced, parallel=None):
+    """
+    This method chooses how the string files of the locales are written.
+    Unless parallel names one of the modes, small tables and single cpu
+    machines are written sequentially, large tables are rendered on a
+    process pool and all other tables are written on a thread pool.
+    Workers of a process pool are never asked to start another pool,
+    which is known for workers started by run_worker and daemon
+    processes.
+    :param strings_reduced: dict
+    :param parallel: string
+    :return: string
+    """
+    if parallel is not None:
+        if parallel not in PARALLEL_MODES:
+            raise ValueError("unknown parallel mode {}".format(parallel))
 
-    print("done writing {}".format(destination_file))
+        return parallel
 
+    workers = min(len(strings_reduced), os.cpu_count() or 1)
 
-def write_strings(description, destination_directory, filename):
+    entries = sum(len(x) for x in strings_reduced.values())
+
+    if workers < 2 or entries < STRINGS_THREAD_ENTRIES:
+        return "sequential"
+
+    if entries < STRINGS_PROCESS_ENTRIES or in_worker:
+        return "thread"
+
+    # imported here as most tables are too small for a process pool
+    from multiprocessing import current_process
+
+    if not current_process().daemon:
+        return "process"
+
+    return "thread"
+
+
+def run_worker(function, *args):
+    """
+    This method marks the process as worker of a process pool and calls
+    the function, so builds on the worker do not start process pools of
+    their own. Workers of ProcessPoolExecutor are not daemon processes,
+    so their tasks are submitted through this method.
+    :param function: callable
+    :return: mixed
+    """
+    global in_worker
+
+    in_worker = True
+
+    return function(*args)
+
+
+def render_locale(locale_reduced):
+    """
+    This method renders the string file of a single locale.
+    :param locale_reduced: list
+    :return: string
+    """
+    contents = StringIO()
+
+    writer = Writer(contents)
+    writer.Write(COMMENT_C + PREFIX + "\n")
+
+    stream_strings(locale_reduced, writer)
+
+    return contents.getvalue()
+
+
+def write_strings(description, destination_directory, filename,
+                  reduced=None, outputs=None, instrumentation=None,
+                  output=None, parallel=None):
     """
     This method compiles the description to string files.
+
+    The locales are written sequentially, on a thread pool or rendered
+    on a process pool according to get_parallel_mode. Every mode writes
+    the same files.
     :param description: bootstrap.Description
     :param destination_directory: string
     :param filename: string
-    :return:
+    :param reduced: dict
+    :param outputs: dict
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param output: bootstrap.classes.output.Output
+    :param parallel: string
+    :return: list
     """
-    strings_rendered = render_strings(reduce_strings(description))
+    if reduced is None:
+        reduced = reduce_fused(description, ("strings",))
 
-    for key, contents in strings_rendered.items():
-        destination_file = os.path.join(
-            destination_directory, "res", key, "description",
-            "{}.str".format(filename)
-        )
+    strings_reduced = reduced["strings"]
 
-        contents = "\n".join([COMMENT_C + PREFIX, contents])
+    relative_paths = [
+        os.path.join("res", key, "description", "{}.str".format(filename))
+        for key in strings_reduced
+    ]
 
-        assert_directories(destination_file, True)
+    def write_locale(relative_path, locale_reduced):
+        def stream(writer):
+            writer.Write(COMMENT_C + PREFIX + "\n")
 
-        with open(destination_file, "w") as f:
-            f.write(contents)
+            stream_strings(locale_reduced, writer)
+
+        return write_stream(
+            destination_directory, relative_path, stream, outputs,
+            instrumentation, output
+        )
 
-        print("done writing {}".format(destination_file))
+    mode = get_parallel_mode(strings_reduced, parallel)
+
+    workers = max(min(len(strings_reduced), os.cpu_count() or 1), 1)
+
+    if mode == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(
+                write_locale, relative_paths, strings_reduced.values()
+            ))
+
+    if mode == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as executor:
+            return [
+                write_contents(
+                    destination_directory, relative_path, contents, outputs,
+                    instrumentation, output
+                )
+                for relative_path, contents in zip(
+                    relative_paths,
+                    executor.map(render_locale, strings_reduced.values())
+                )
+            ]
+
+    return [
+        write_locale(relative_path, locale_reduced)
+        for relative_path, locale_reduced in zip(
+            relative_paths, strings_reduced.values()
+        )
+    ]
 
 
-def compile_plugin(plugin_file, destination_directory, filename):
+def load_ids(plugin_file, lines, static=True):
     """
-    This method compiles the python plugin to a cinema 4d pyp file.
+    This method resolves the values of the id section. Unless static is
+    False the plugin is not executed, load_source is used as a fallback
+    when the id section can not be resolved statically.
     :param plugin_file: string
-    :param destination_directory: string
-    :param filename: string
-    :return:
+    :param lines: list
+    :param static: boolean
+    :return: dict
     """
+    names = get_id_names(lines)
+
+    if static:
+        try:
+            values = resolve_ids(plugin_file, lines)
+
+            if all(x in values for x in names):
+                return values
+        except Exception:
+            pass
+
     plugin_filename, plugin_fileextension = os.path.splitext(
         os.path.basename(plugin_file)
     )
 
+    module = load_source(plugin_filename, plugin_file)
+
+    return {x: getattr(module, x) for x in names}
+
+
+def compile_plugin(plugin_file, destination_directory, filename,
+                   outputs=None, static=True, instrumentation=None,
+                   output=None):
+    """
+    This method compiles the python plugin to a cinema 4d pyp file.
+    :param plugin_file: string
+    :param destination_directory: string
+    :param filename: string
+    :param outputs: dict
+    :param static: boolean
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param output: bootstrap.classes.output.Output
+    :return: list
+    """
     with open(plugin_file, "r") as input_file:
         lines = input_file.read().split("\n")
 
-        lines_computed = []
+    with measure(instrumentation, "load_ids", path=plugin_file):
+        values = load_ids(plugin_file, lines, static)
+
+    lines_computed = compile_lines(lines, values, COMMENT_PYTHON + PREFIX)
+
+    return [
+        write_contents(
+            destination_directory,
+            "{}.pyp".format(filename),
+            "\n".join(lines_computed),
+            outputs,
+            instrumentation,
+            output
+        )
+    ]
+
 
-        ignore_lines = False
-        id_section = False
+def collect_modules(plugin_file, static=True):
+    """
+    This method follows the local imports of the plugin and compiles
+    every module found, keeping its line numbers. Imports inside
+    bootstrap sections are not followed.
+    :param plugin_file: string
+    :param static: boolean
+    :return: list
+    """
+    plugin_directory = os.path.dirname(os.path.abspath(plugin_file))
 
-        module = load_source(plugin_filename, plugin_file)
+    modules = []
+    visited = set()
 
-        for line in lines:
-            # id section
-            if line.startswith("#----begin_id_section----"):
-                id_section = True
+    def visit(name, module_file):
+        visited.add(module_file)
 
-                lines_computed.append(COMMENT_PYTHON + PREFIX)
+        with open(module_file, "r") as f:
+            lines = f.read().split("\n")
 
-                continue
+        lines_computed = compile_lines(
+            lines,
+            load_ids(module_file, lines, static),
+            COMMENT_PYTHON + PREFIX,
+            True
+        )
 
-            if line.startswith("#----end_id_section----"):
-                id_section = False
+        package = None
 
-                continue
+        if name is not None:
+            package = get_package(name, module_file)
 
-            if id_section:
-                if line.startswith("#"):
-                    continue
+        names = sorted(parse_imports(
+            "\n".join(lines_computed), module_file, package
+        ))
 
-                if not line:
+        for imported_name in names:
+            parts = imported_name.split(".")
+
+            for index in range(len(parts)):
+                dependency_name = ".".join(parts[:index + 1])
+
+                dependency_file = find_module(
+                    dependency_name, plugin_directory
+                )
+
+                if dependency_file is None \
+                        or dependency_file in visited:
                     continue
 
-                variables = [x.strip() for x in line.split("=")]
+                visit(dependency_name, dependency_file)
 
-                if variables:
-                    variableName = variables[0]
+        modules.append({
+            "name": name,
+            "file": module_file,
+            "path": os.path.relpath(module_file, plugin_directory),
+            "lines": lines_computed
+        })
 
-                    lines_computed.append(
-                        "{} = {}".format(
-                            variableName,
-                            getattr(module, variableName)
-                        )
-                    )
+    visit(None, os.path.abspath(plugin_file))
 
-                continue
+    return modules
 
-            # skip bootstrap lines
-            if line.startswith("#----begin"):
-                ignore_lines = True
 
-                continue
+def bundle_plugin(plugin_file, destination_directory, filename,
+                  outputs=None, static=True, instrumentation=None,
+                  output=None):
+    """
+    This method compiles the python plugin and all local modules it
+    imports to a single cinema 4d pyp file. Modules are registered
+    first and then executed in dependency order. A source map is written
+    next to the pyp file which maps every line of the bundle back to its
+    original file.
+    :param plugin_file: string
+    :param destination_directory: string
+    :param filename: string
+    :param outputs: dict
+    :param static: boolean
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param output: bootstrap.classes.output.Output
+    :return: list
+    """
+    with measure(instrumentation, "collect_modules", path=plugin_file):
+        modules = collect_modules(plugin_file, static)
 
-            if line.startswith("#----end"):
-                ignore_lines = False
+    lines_computed = [COMMENT_PYTHON + PREFIX] \
+        + BUNDLE_PREAMBLE.rstrip("\n").split("\n")
 
-                continue
+    source_map = {
+        "version": 1,
+        "file": "{}.pyp".format(filename),
+        "sources": [x["path"] for x in modules],
+        "modules": [],
+        "lines": [None] * len(lines_computed)
+    }
 
-            if not ignore_lines:
-                lines_computed.append(line)
+    lines_computed += [""]
 
-        compiled_plugin_file = os.path.join(
-            destination_directory, "{}.pyp".format(filename)
-        )
+    for module in modules[:-1]:
+        lines_computed.append("_bootstrap_module({!r}, {!r})".format(
+            module["name"], module["path"]
+        ))
 
-        assert_directories(compiled_plugin_file, True)
+    for index, module in enumerate(modules[:-1]):
+        lines_computed += ["", ""]
 
-        with open(compiled_plugin_file, "w") as output_file:
-            output_file.write("\n".join(lines_computed))
+        source_map["modules"].append({
+            "name": module["name"],
+            "source": index,
+            "line": len(lines_computed) + 1
+        })
 
-        print("done writing {}".format(compiled_plugin_file))
+        lines_computed.append("_bootstrap_exec({!r}, {!r}, {!r})".format(
+            module["name"], module["path"], "\n".join(module["lines"])
+        ))
 
+    lines_computed += ["", ""]
 
-def build(description, plugin_file, destination_directory, filename):
+    source_map["lines"] += [None] * (
+        len(lines_computed) - len(source_map["lines"])
+    )
+
+    for number, line in enumerate(modules[-1]["lines"]):
+        lines_computed.append(line)
+
+        source_map["lines"].append([len(modules) - 1, number + 1])
+
+    return [
+        write_contents(
+            destination_directory,
+            "{}.pyp".format(filename),
+            "\n".join(lines_computed),
+            outputs,
+            instrumentation,
+            output
+        ),
+        write_contents(
+            destination_directory,
+            "{}.pyp.map".format(filename),
+            json.dumps(source_map),
+            outputs,
+            instrumentation,
+            output
+        )
+    ]
+
+
+def build(description, plugin_file, destination_directory, filename,
+          force=False, registry=None, bundle=False, instrumentation=None,
+          profile=None, lock=False, cache=None, validate=True,
+          output=None, parallel=None):
     """
     This method compiles all necessary plugin files.
+
+    Stages whose inputs have not changed since the last build according
+    to the manifest in the destination directory are skipped. The
+    manifest keeps the stages of every plugin built into the destination
+    directory by filename. With lock the destination directory is locked
+    for the whole build so several processes can build into the same
+    directory. With cache rendered group subtrees are reused across
+    builds. Unless validate is False the description is validated first,
+    errors raise ValidationError and warnings are logged and reported.
+
+    Files are written to the destination directory unless an output like
+    bootstrap.classes.output.MemoryOutput or ZipOutput is given, which
+    then replaces the destination directory and lock. Parallel chooses
+    how the string files are written, see get_parallel_mode.
     :param description: bootstrap.Description
     :param plugin_file: string
     :param destination_directory: string
     :param filename: string
-    :return:
+    :param force: boolean
+    :param registry: bootstrap.classes.registry.IdRegistry
+    :param bundle: boolean
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param profile: string
+    :param lock: boolean
+    :param cache: bootstrap.classes.cache.RenderCache
+    :param validate: boolean
+    :param output: bootstrap.classes.output.Output
+    :param parallel: string
+    :return: dict
+    """
+    if output is None:
+        output = Output(destination_directory, lock)
+
+    with output:
+        arguments = (
+            description, plugin_file, filename, output, force, registry,
+            bundle, instrumentation, cache, validate, parallel
+        )
+
+        if profile is None:
+            return build_stages(*arguments)
+
+        # imported here as most builds are not profiled
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+        try:
+            return profiler.runcall(build_stages, *arguments)
+        finally:
+            assert_directories(profile, True)
+
+            profiler.dump_stats(profile)
+
+
+def build_stages(description, plugin_file, filename, output, force=False,
+                 registry=None, bundle=False, instrumentation=None,
+                 cache=None, validate=True, parallel=None):
+    """
+    This method runs the build stages for build writing to output.
+    :param description: bootstrap.Description
+    :param plugin_file: string
+    :param filename: string
+    :param output: bootstrap.classes.output.Output
+    :param force: boolean
+    :param registry: bootstrap.classes.registry.IdRegistry
+    :param bundle: boolean
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param cache: bootstrap.classes.cache.RenderCache
+    :param validate: boolean
+    :param parallel: string
+    :return: dict
     """
-    write_header(description, destination_directory, filename)
+    destination_directory = output.destination_directory
+
+    diagnostics = []
+
+    if validate:
+        with measure(instrumentation, "validate") as data:
+            diagnostics = validate_description(description)
+
+            data["diagnostics"] = len(diagnostics)
+
+        errors = [x for x in diagnostics if x["severity"] == ERROR]
+
+        if errors:
+            raise ValidationError(errors)
+
+        for diagnostic in diagnostics:
+            logger.warning(format_diagnostic(diagnostic))
+
+    if registry is not None:
+        with measure(instrumentation, "register"):
+            registry.Register(description, filename)
+            registry.Check()
+
+    manifest = {}
+
+    with measure(instrumentation, "manifest"):
+        if not force:
+            manifest = output.LoadManifest()
 
-    write_resource(description, destination_directory, filename)
+    if manifest.get("version") != bootstrap.__version__:
+        manifest = {}
 
-    write_strings(description, destination_directory, filename)
+    manifest = get_plugin_manifest(manifest, filename)
 
-    compile_plugin(plugin_file, destination_directory, filename)
+    with measure(instrumentation, "fingerprint") as data:
+        fingerprint = fingerprint_description(description)
+
+        plugin_hash = hash_file(plugin_file)
+
+        if instrumentation is not None:
+            data["nodes"] = sum(1 for _ in walk(description))
+
+    inputs = {
+        "header": [fingerprint],
+        "resource": [fingerprint],
+        "strings": [fingerprint],
+        "plugin": [fingerprint, plugin_hash]
+    }
+
+    if bundle:
+        inputs["plugin"] += ["bundle"] + [
+            hash_file(x) for x in find_local_modules(plugin_file)
+        ]
+
+    stages = manifest.get("stages", {})
+
+    stages_computed = {}
+
+    report = {
+        "rebuilt": [],
+        "skipped": [],
+        "diagnostics": diagnostics
+    }
+
+    for stage in STAGES:
+        input_hash = hash_contents(
+            "\n".join([PREFIX, stage, filename] + inputs[stage])
+        )
 
-    return True
+        if is_current(manifest, destination_directory, stage, input_hash):
+            stages_computed[stage] = stages[stage]
+
+            for relative_path in stages[stage]["outputs"]:
+                logger.info("skipped writing %s", os.path.join(
+                    destination_directory, relative_path
+                ))
+
+                report["skipped"].append(relative_path)
+
+            continue
+
+        stages_computed[stage] = {
+            "input": input_hash
+        }
+
+    forms = [x for x in STAGES[:3] if "outputs" not in stages_computed[x]]
+
+    reduced = None
+
+    if forms:
+        with measure(instrumentation, "reduce", forms=forms) as data:
+            if cache is None:
+                reduced = reduce_fused(description, forms)
+            else:
+                # imported here as most builds run without a cache
+                from bootstrap.reducers.cached import reduce_cached
+
+                reduced = reduce_cached(
+                    description, cache, forms,
+                    fingerprints=fingerprint_nodes(description)
+                )
+
+                data["hits"] = cache.hits
+                data["misses"] = cache.misses
+
+            if "header" in reduced:
+                data["header"] = len(reduced["header"])
+
+            if "strings" in reduced:
+                data["locales"] = len(reduced["strings"])
+
+    writers = {
+        "header": write_header,
+        "resource": write_resource
+    }
+
+    for stage in STAGES:
+        if "outputs" in stages_computed[stage]:
+            continue
+
+        outputs = {}
+
+        if isinstance(stages.get(stage), dict):
+            outputs.update(stages[stage].get("outputs", {}))
+
+        with measure(instrumentation, stage):
+            if stage == "plugin" and bundle:
+                relative_paths = bundle_plugin(
+                    plugin_file, destination_directory, filename, outputs,
+                    instrumentation=instrumentation, output=output
+                )
+            elif stage == "plugin":
+                relative_paths = compile_plugin(
+                    plugin_file, destination_directory, filename, outputs,
+                    instrumentation=instrumentation, output=output
+                )
+            elif stage == "strings":
+                relative_paths = write_strings(
+                    description, destination_directory, filename, reduced,
+                    outputs, instrumentation, output, parallel
+                )
+            else:
+                relative_paths = writers[stage](
+                    description, destination_directory, filename, reduced,
+                    outputs, instrumentation, output
+                )
+
+        stages_computed[stage]["outputs"] = {
+            x: outputs[x] for x in relative_paths
+        }
+
+        report["rebuilt"] += relative_paths
+
+    with measure(instrumentation, "commit", files=len(output.pending)):
+        output.Commit()
+
+    if cache is not None:
+        with measure(instrumentation, "prune_cache") as data:
+            data["removed"] = cache.Prune()
+
+    with measure(instrumentation, "save_manifest"):
+        # reloaded as other plugins may have been built meanwhile
+        manifest = output.LoadManifest()
+
+        plugins = manifest.get("plugins")
+
+        if manifest.get("version") != bootstrap.__version__ or \
+                not isinstance(plugins, dict):
+            plugins = {}
+
+        plugins[filename] = {
+            "description": fingerprint,
+            "plugin": plugin_hash,
+            "stages": stages_computed
+        }
+
+        output.SaveManifest({
+            "version": bootstrap.__version__,
+            "plugins": plugins
+        })
+
+    return report
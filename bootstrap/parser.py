@@ -0,0 +1,431 @@
+"""
+This module provides methods for parsing resource, header and string
+files into Description trees
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import os
+import re
+
+from bootstrap.classes.description import Description
+
+TOKEN_PATTERN = re.compile(
+    r"//|/\*|\"(?:[^\"\\]|\\.)*\"|[{};=,]|[^\s{};=,\"/]+|/"
+)
+"""
+Pattern for finding the tokens of a line
+"""
+
+LOCALE_PATTERN = re.compile(r"^strings_\w+$")
+"""
+Pattern for matching locale directories
+"""
+
+
+class ParseError(Exception):
+    """
+    Parse Error Exception class
+    """
+
+    def __init__(self, message, filename=None, line=None):
+        """
+        This method initializes a new instance of the ParseError class.
+        :param message: string
+        :param filename: string
+        :param line: integer
+        :return:
+        """
+        super(ParseError, self).__init__(
+            "{}:{}: {}".format(filename or "<input>", line or 0, message)
+        )
+
+        self.filename = filename
+        self.line = line
+
+
+def tokenize(lines, preprocessor=False):
+    """
+    This method yields the tokens of the lines along with their line
+    number. Comments are skipped, with preprocessor lines starting with
+    a hash are skipped as well.
+    :param lines: iterable
+    :param preprocessor: boolean
+    :return: generator
+    """
+    comment = False
+
+    for number, line in enumerate(lines, 1):
+        position = 0
+
+        if preprocessor and not comment and line.lstrip().startswith("#"):
+            continue
+
+        while position is not None:
+            if comment:
+                end = line.find("*/", position)
+
+                if end < 0:
+                    break
+
+                comment = False
+                position = end + 2
+
+            for match in TOKEN_PATTERN.finditer(line, position):
+                token = match.group()
+
+                if token == "//":
+                    position = None
+
+                    break
+
+                if token == "/*":
+                    comment = True
+                    position = match.end()
+
+                    break
+
+                yield token, number
+            else:
+                position = None
+
+
+def parse_header(lines, filename=None):
+    """
+    This method parses the enum of a header file into a dictionary
+    mapping the names to their values, which are None where the enum
+    does not assign a value.
+    :param lines: iterable
+    :param filename: string
+    :return: dict
+    """
+    ids = {}
+
+    tokens = []
+    inside = False
+
+    for token, number in tokenize(lines, True):
+        if not inside:
+            inside = token == "{"
+
+            continue
+
+        if token != "," and token != "}":
+            tokens.append(token)
+
+            continue
+
+        if tokens:
+            if len(tokens) == 2 or len(tokens) > 1 and tokens[1] != "=":
+                raise ParseError(
+                    "expected = after {}".format(tokens[0]), filename, number
+                )
+
+            ids[tokens[0]] = " ".join(tokens[2:]) or None
+
+            tokens = []
+
+        inside = token == ","
+
+    return ids
+
+
+def resolve_header(ids):
+    """
+    This method resolves the values of the enum parsed by parse_header
+    to integers. Names without value follow the previous value like in
+    C, values referencing a name take its value. Values which can not be
+    resolved, and names following them without value, are None.
+    :param ids: dict
+    :return: dict
+    """
+    values = {}
+
+    value = -1
+
+    for name, expression in ids.items():
+        if expression is None:
+            value = None if value is None else value + 1
+        elif expression in values:
+            value = values[expression]
+        else:
+            try:
+                value = int(expression, 0)
+            except ValueError:
+                value = None
+
+        values[name] = value
+
+    return values
+
+
+def create_node(tokens, ids, children=None):
+    """
+    This method creates the Description for the tokens of a statement.
+    The first token is taken as id of a description without key if it is
+    a known id not assigned before. Otherwise the second token is taken
+    as id if the statement opens a block or it is a known id not assigned
+    before. Assigned ids are removed from ids.
+    :param tokens: list
+    :param ids: set
+    :param children: list
+    :return: bootstrap.Description
+    """
+    if tokens[0] in ids:
+        ids.discard(tokens[0])
+
+        return Description({
+            "id": tokens[0],
+            "value": " ".join(tokens[1:]) or children
+        })
+
+    config = {"key": tokens[0], "value": children}
+
+    if len(tokens) > 1 and (children is not None or tokens[1] in ids):
+        ids.discard(tokens[1])
+
+        config["id"] = tokens[1]
+
+        if len(tokens) > 2:
+            config["value"] = " ".join(tokens[2:])
+    elif len(tokens) > 1:
+        config["value"] = " ".join(tokens[1:])
+
+    return Description(config)
+
+
+def parse_resource(lines, ids=None, filename=None):
+    """
+    This method parses a resource file into a Description tree. Names
+    listed in ids are recognized as ids of statements without a block.
+    :param lines: iterable
+    :param ids: dict
+    :param filename: string
+    :return: bootstrap.Description
+    """
+    ids = set(ids or ())
+
+    roots = []
+
+    stack = [roots]
+    tokens = []
+
+    for token, number in tokenize(lines):
+        if token == "{":
+            if not tokens:
+                raise ParseError("expected name before {", filename, number)
+
+            if len(tokens) > 2:
+                raise ParseError(
+                    "unexpected {} before {{".format(tokens[2]),
+                    filename,
+                    number
+                )
+
+            node = create_node(tokens, ids, [])
+
+            stack[-1].append(node)
+            stack.append(node.value)
+
+            tokens = []
+        elif token == ";" or token == "}":
+            if tokens:
+                stack[-1].append(create_node(tokens, ids))
+
+                tokens = []
+
+            if token == "}":
+                if len(stack) == 1:
+                    raise ParseError("unexpected }", filename, number)
+
+                stack.pop()
+        else:
+            tokens.append(token)
+
+    if len(stack) > 1 or tokens:
+        raise ParseError("unexpected end of file", filename)
+
+    if len(roots) != 1:
+        raise ParseError(
+            "expected a single container, found {}".format(len(roots)),
+            filename
+        )
+
+    return roots[0]
+
+
+def parse_strings(lines, filename=None):
+    """
+    This method parses the string table of a string file into a
+    dictionary mapping the ids to their strings. The strings of cycles
+    nested in a block after the id, and optionally the string, of their
+    parameter are collected as well.
+    :param lines: iterable
+    :param filename: string
+    :return: dict
+    """
+    strings = {}
+
+    tokens = []
+    depth = 0
+
+    for token, number in tokenize(lines):
+        if not depth:
+            if token == "{":
+                depth = 1
+
+            continue
+
+        if token == "{":
+            if depth > 1 or not tokens or len(tokens) > 2:
+                raise ParseError("unexpected {", filename, number)
+
+            if len(tokens) > 1:
+                add_string(strings, tokens, filename, number)
+
+            tokens = []
+            depth = 2
+
+            continue
+
+        if token == "}":
+            if depth == 1:
+                break
+
+            if tokens:
+                raise ParseError("expected ; before }", filename, number)
+
+            depth = 1
+
+            continue
+
+        if token != ";":
+            tokens.append(token)
+
+            continue
+
+        add_string(strings, tokens, filename, number)
+
+        tokens = []
+
+    return strings
+
+
+def add_string(strings, tokens, filename=None, line=None):
+    """
+    This method adds the string of the tokens of an entry to strings.
+    :param strings: dict
+    :param tokens: list
+    :param filename: string
+    :param line: integer
+    :return:
+    """
+    if len(tokens) < 2 or not tokens[1].startswith("\""):
+        raise ParseError("expected id and string", filename, line)
+
+    strings[tokens[0]] = "".join(x[1:-1] for x in tokens[1:])
+
+
+def merge_strings(description, locale, strings):
+    """
+    This method assigns the strings of the locale to the descriptions
+    with matching ids.
+    :param description: bootstrap.Description
+    :param locale: string
+    :param strings: dict
+    :return:
+    """
+    stack = [description]
+
+    while stack:
+        item = stack.pop()
+
+        if item.id in strings:
+            if not isinstance(item.locales, dict):
+                item.locales = {}
+
+            item.locales[locale] = strings[item.id]
+
+        if isinstance(item.value, list):
+            stack.extend(item.value)
+
+
+def assign_ids(description, values):
+    """
+    This method assigns the resolved header values to the descriptions,
+    so GetId returns the numbers of the header instead of hashed ids.
+    Ids missing from the header are defined elsewhere, for instance by
+    Cinema 4D, and are marked as external to keep them out of the
+    rendered header.
+    :param description: bootstrap.Description
+    :param values: dict
+    :return:
+    """
+    stack = [description]
+
+    while stack:
+        item = stack.pop()
+
+        if item.id:
+            if item.id not in values:
+                item.extra = dict(item.extra or {}, external=True)
+            elif values[item.id] is not None:
+                item.extra = dict(item.extra or {}, id_value=values[item.id])
+
+        if isinstance(item.value, list):
+            stack.extend(item.value)
+
+
+def read_lines(path, encoding="utf-8"):
+    """
+    This method yields the lines of the file.
+    :param path: string
+    :param encoding: string
+    :return: generator
+    """
+    with open(path, "r", encoding=encoding) as f:
+        for line in f:
+            yield line
+
+
+def import_resources(directory, filename, encoding="utf-8"):
+    """
+    This method imports the resource, header and string files of the
+    plugin in the res directory into a single Description tree. The
+    values of the header are kept, see assign_ids.
+    :param directory: string
+    :param filename: string
+    :param encoding: string
+    :return: bootstrap.Description
+    """
+    header_file = os.path.join(
+        directory, "description", "{}.h".format(filename)
+    )
+
+    resource_file = os.path.join(
+        directory, "description", "{}.res".format(filename)
+    )
+
+    ids = {}
+
+    if os.path.isfile(header_file):
+        ids = parse_header(read_lines(header_file, encoding), header_file)
+
+    description = parse_resource(
+        read_lines(resource_file, encoding), ids, resource_file
+    )
+
+    if os.path.isfile(header_file):
+        assign_ids(description, resolve_header(ids))
+
+    for locale in sorted(os.listdir(directory)):
+        strings_file = os.path.join(
+            directory, locale, "description", "{}.str".format(filename)
+        )
+
+        if LOCALE_PATTERN.match(locale) and os.path.isfile(strings_file):
+            merge_strings(description, locale, parse_strings(
+                read_lines(strings_file, encoding), strings_file
+            ))
+
+    return description
@@ -0,0 +1,154 @@
+"""
+This module provides methods for reducing Description while reusing
+subtrees rendered by previous builds
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import bootstrap
+
+from bootstrap.classes.description import IdError
+from bootstrap.reducers.fused import FORMS
+from bootstrap.render.res import render_resource
+from bootstrap.utilities.manifest import hash_contents, fingerprint_nodes
+
+CACHED_KEYS = ("GROUP",)
+"""
+Keys of the descriptions whose subtrees are cached
+"""
+
+
+def reduce_cached(description, cache, forms=FORMS, locales=None,
+                  fingerprints=None):
+    """
+    This method reduces Description instance like reduce_fused but looks
+    up every group subtree in the cache by its fingerprint. Groups found
+    in the cache are not traversed, groups not found are stored. Records
+    are kept in memory as well, so equal groups within the description
+    are read from the cache once.
+
+    The reduced resource contains the rendered groups as fragments with
+    empty values, which are written as is by stream_resource.
+    :param description: bootstrap.Description
+    :param cache: bootstrap.classes.cache.RenderCache
+    :param forms: tuple
+    :param locales: list
+    :param fingerprints: dict
+    :return: dict
+    """
+    if locales is None:
+        locales = []
+
+        if isinstance(description.locales, dict):
+            locales = list(description.locales.keys())
+
+    if fingerprints is None:
+        fingerprints = fingerprint_nodes(description)
+
+    salt = hash_contents(repr((bootstrap.__version__, locales)))
+
+    header = []
+    strings = {key: [] for key in locales}
+
+    records = {}
+
+    data_root = None
+
+    stack = [(description, None)]
+
+    while stack:
+        item, siblings = stack.pop()
+
+        if item is None:
+            data, key, header_start, strings_start = siblings
+
+            data["fragment"] = render_resource(data)
+
+            records[key] = {
+                "resource": data["fragment"],
+                "header": [
+                    [x["key"], x["value"]] for x in header[header_start:]
+                ],
+                "strings": {
+                    locale: [
+                        [x["key"], x["value"]]
+                        for x in entries[strings_start[locale]:]
+                    ]
+                    for locale, entries in strings.items()
+                }
+            }
+
+            cache.Put(key, records[key])
+
+            continue
+
+        data = {
+            "id": item.id,
+            "key": item.key,
+            "value": item.value
+        }
+
+        if siblings is None:
+            data_root = data
+        else:
+            siblings.append(data)
+
+        key = None
+
+        if item.key in CACHED_KEYS and isinstance(item.value, list):
+            key = hash_contents(salt + fingerprints[id(item)])
+
+            if key not in records:
+                records[key] = cache.Get(key)
+
+            record = records[key]
+
+            if record is not None:
+                header.extend(
+                    {"key": x[0], "value": x[1]} for x in record["header"]
+                )
+
+                for locale, entries in strings.items():
+                    entries.extend(
+                        {"key": x[0], "value": x[1]}
+                        for x in record["strings"].get(locale, [])
+                    )
+
+                data["value"] = []
+                data["fragment"] = record["resource"]
+
+                continue
+
+            stack.append((None, (
+                data, key, len(header),
+                {locale: len(x) for locale, x in strings.items()}
+            )))
+
+        try:
+            header.append({
+                "key": item.id,
+                "value": item.GetId()
+            })
+        except IdError:
+            pass
+
+        if strings and isinstance(item.locales, dict):
+            for locale, value in item.locales.items():
+                if locale in strings:
+                    strings[locale].append({
+                        "key": item.id,
+                        "value": value
+                    })
+
+        if isinstance(item.value, list):
+            data["value"] = []
+
+            stack.extend((x, data["value"]) for x in reversed(item.value))
+
+    reduced = {
+        "header": header,
+        "resource": data_root,
+        "strings": strings
+    }
+
+    return {x: reduced[x] for x in forms}
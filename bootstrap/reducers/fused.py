@@ -0,0 +1,183 @@
+"""
+This module provides methods for reducing Description to headers,
+resource and locales at once
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+from bootstrap.classes.description import IdError
+from bootstrap.utilities.tree import find_shared_nodes
+
+FORMS = ("header", "resource", "strings")
+"""
+Reduced forms produced by default
+"""
+
+
+def reduce_nodes(description, header, strings, resource=True,
+                 fingerprints=None):
+    """
+    This method reduces Description instance and its children while
+    collecting header and locales entries. The tree is traversed with an
+    explicit stack so its depth is not limited by the recursion limit.
+
+    Subtrees occurring more than once are reduced once, later occurrences
+    share the reduced dictionary and copy the collected entries. Without
+    fingerprints only the same instance is recognized, with fingerprints
+    structurally equal subtrees are shared as well.
+    :param description: bootstrap.Description
+    :param header: list
+    :param strings: dict
+    :param resource: boolean
+    :param fingerprints: dict
+    :return: dict
+    """
+    data_root = None
+
+    shared = find_shared_nodes(description, fingerprints)
+    reduced = {}
+
+    stack = [(description, None)]
+
+    while stack:
+        item, siblings = stack.pop()
+
+        if item is None:
+            key, data, header_start, strings_start = siblings
+
+            reduced[key] = (
+                data,
+                None if header is None else (header_start, len(header)),
+                {
+                    locale: (start, len(strings[locale]))
+                    for locale, start in strings_start.items()
+                }
+            )
+
+            continue
+
+        key = None
+
+        if shared and isinstance(item.value, list):
+            if fingerprints is None:
+                key = id(item)
+            else:
+                key = fingerprints[id(item)]
+
+            if key in reduced:
+                data, header_range, strings_ranges = reduced[key]
+
+                if header_range is not None:
+                    header.extend(header[header_range[0]:header_range[1]])
+
+                for locale, (start, end) in strings_ranges.items():
+                    strings[locale].extend(strings[locale][start:end])
+
+                if siblings is not None:
+                    siblings.append(data)
+
+                continue
+
+            if key in shared:
+                header_start = None
+
+                if header is not None:
+                    header_start = len(header)
+
+                strings_start = {}
+
+                if strings:
+                    strings_start = {
+                        locale: len(x) for locale, x in strings.items()
+                    }
+            else:
+                key = None
+
+        if header is not None:
+            try:
+                header.append({
+                    "key": item.id,
+                    "value": item.GetId()
+                })
+            except IdError:
+                pass
+
+        if strings and isinstance(item.locales, dict):
+            for locale, value in item.locales.items():
+                if locale in strings:
+                    strings[locale].append({
+                        "key": item.id,
+                        "value": value
+                    })
+
+        data = None
+
+        if resource:
+            data = {
+                "id": item.id,
+                "key": item.key,
+                "value": item.value
+            }
+
+            if siblings is None:
+                data_root = data
+            else:
+                siblings.append(data)
+
+        if not isinstance(item.value, list):
+            continue
+
+        children = None
+
+        if resource:
+            children = data["value"] = []
+
+        if key is not None:
+            stack.append((None, (key, data, header_start, strings_start)))
+
+        stack.extend((x, children) for x in reversed(item.value))
+
+    return data_root
+
+
+def reduce_fused(description, forms=FORMS, locales=None, fingerprints=None):
+    """
+    This method reduces Description instance to header, resource and
+    locales in a single traversal.
+    :param description: bootstrap.Description
+    :param forms: tuple
+    :param locales: list
+    :param fingerprints: dict
+    :return: dict
+    """
+    header = None
+    strings = None
+
+    if "header" in forms:
+        header = []
+
+    if "strings" in forms:
+        if locales is None:
+            locales = []
+
+            if isinstance(description.locales, dict):
+                locales = list(description.locales.keys())
+
+        strings = {key: [] for key in locales}
+
+    resource = reduce_nodes(
+        description, header, strings, "resource" in forms, fingerprints
+    )
+
+    data = {}
+
+    if header is not None:
+        data["header"] = header
+
+    if resource is not None:
+        data["resource"] = resource
+
+    if strings is not None:
+        data["strings"] = strings
+
+    return data
@@ -5,26 +5,33 @@ This module provides methods for reducing Description to headers
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
 from bootstrap.classes.description import IdError
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.utilities.tree import walk
 
 
-def reduce_header(description):
+def iter_header(description):
     """
-    This method reduces Description instance to nested header dictionary.
+    This method lazily yields the header entries of Description instance
+    and its children in the order of reduce_header.
     :param description: bootstrap.Description
-    :return: dict
+    :return: generator
     """
-    data = []
+    for item in walk(description):
+        try:
+            value = item.GetId()
+        except IdError:
+            continue
 
-    try:
-        data.append({
-            "key": description.id,
-            "value": description.GetId()
-        })
-    except IdError:
-        pass
+        yield {
+            "key": item.id,
+            "value": value
+        }
 
-    if isinstance(description.value, list):
-        for item in description.value:
-            data = data + list(filter(None, reduce_header(item)))
 
-    return data
+def reduce_header(description):
+    """
+    This method reduces Description instance to nested header dictionary.
+    :param description: bootstrap.Description
+    :return: dict
+    """
+    return reduce_fused(description, ("header",))["header"]
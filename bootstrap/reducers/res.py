@@ -4,6 +4,8 @@ This module provides methods for reducing Description to resource
 
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
+from bootstrap.reducers.fused import reduce_fused
+
 
 def reduce_resource(description):
     """
@@ -11,14 +13,4 @@ def reduce_resource(description):
     :param description: bootstrap.Description
     :return: dict
     """
-    data = {
-        "id": description.id,
-        "key": description.key
-    }
-
-    if isinstance(description.value, list):
-        data["value"] = [reduce_resource(x) for x in description.value]
-    else:
-        data["value"] = description.value
-
-    return data
+    return reduce_fused(description, ("resource",))["resource"]
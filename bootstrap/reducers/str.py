@@ -4,6 +4,25 @@ This module provides methods for reducing Description to locales
 
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.utilities.tree import walk
+
+
+def iter_strings(description, locale):
+    """
+    This method lazily yields the locale entries of Description instance
+    and its children in the order of reduce_strings.
+    :param description: bootstrap.Description
+    :param locale: string
+    :return: generator
+    """
+    for item in walk(description):
+        if isinstance(item.locales, dict) and locale in item.locales:
+            yield {
+                "key": item.id,
+                "value": item.locales[locale]
+            }
+
 
 def reduce_strings(description, locale=None):
     """
@@ -12,27 +31,8 @@ def reduce_strings(description, locale=None):
     :return: dict
     """
     if locale is None:
-        locales = {}
-
-        if isinstance(description.locales, dict):
-            for key, value in description.locales.items():
-                locales[key] = reduce_strings(description, key)
-
-        return locales
-
-    locales = []
-
-    if isinstance(description.locales, dict):
-        if locale in description.locales.keys():
-            locales.append({
-                "key": description.id,
-                "value": description.locales[locale]
-            })
+        return reduce_fused(description, ("strings",))["strings"]
 
-    if isinstance(description.value, list):
-        for item in description.value:
-            locales = locales + list(
-                filter(None, reduce_strings(item, locale))
-            )
+    strings = reduce_fused(description, ("strings",), [locale])["strings"]
 
-    return locales
+    return strings[locale]
@@ -4,7 +4,10 @@ This module provides methods for rendering headers
 
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
+from io import StringIO
+
 from bootstrap.classes.template import Template
+from bootstrap.classes.writer import Writer
 
 header_container = Template(
     """#ifndef _Oatom_H_
@@ -28,14 +31,37 @@ Template for rendering variable assignment
 """
 
 
+def stream_header(header_reduced, writer):
+    """
+    This method applies template rendering to the provided input and
+    streams the result to the writer.
+    :param header_reduced: list
+    :param writer: bootstrap.classes.writer.Writer
+    :return:
+    """
+    head, tail, indentation = header_container.RenderParts({}, "value")
+
+    writer.Write(head)
+    writer.Indent(indentation)
+
+    for index, item in enumerate(header_reduced):
+        if index:
+            writer.Write("\n")
+
+        writer.Write(header_assignment.Render(item))
+
+    writer.Dedent()
+    writer.Write(tail)
+
+
 def render_header(header_reduced):
     """
     This method applies template rendering to the provided input.
     :param header_reduced: dict
     :return: string
     """
-    data = {
-        "value": [header_assignment.Render(x) for x in header_reduced]
-    }
+    contents = StringIO()
+
+    stream_header(header_reduced, Writer(contents))
 
-    return header_container.Render(data)
+    return contents.getvalue()
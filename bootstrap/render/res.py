@@ -4,7 +4,10 @@ This module provides methods for rendering resources
 
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
+from io import StringIO
+
 from bootstrap.classes.template import Template
+from bootstrap.classes.writer import Writer
 
 resource_container = Template(
     """{key} {id}
@@ -22,17 +25,118 @@ Template for rendering variable assignment
 """
 
 
+def find_shared(resource_reduced):
+    """
+    This method finds the containers referenced more than once in the
+    reduced resource. Shared containers are not traversed again, so this
+    takes time proportional to the number of distinct containers.
+    :param resource_reduced: dict
+    :return: set
+    """
+    visited = set()
+    shared = set()
+
+    stack = [resource_reduced]
+
+    while stack:
+        item = stack.pop()
+
+        if not isinstance(item["value"], list) or "fragment" in item:
+            continue
+
+        if id(item) in visited:
+            shared.add(id(item))
+
+            continue
+
+        visited.add(id(item))
+
+        stack.extend(item["value"])
+
+    return shared
+
+
+def stream_resource(resource_reduced, writer, shared=None, fragments=None):
+    """
+    This method applies template rendering to the provided input and
+    streams the result to the writer. The tree is traversed with an
+    explicit stack so its depth is not limited by the recursion limit.
+
+    Items holding a fragment are written as is instead of rendered.
+    Containers referenced more than once are rendered once and their
+    fragment is reused with the indentation of every occurrence.
+    :param resource_reduced: dict
+    :param writer: bootstrap.classes.writer.Writer
+    :param shared: set
+    :param fragments: dict
+    :return:
+    """
+    if shared is None:
+        shared = find_shared(resource_reduced)
+
+    if fragments is None:
+        fragments = {}
+
+    stack = [(resource_reduced, True, None)]
+
+    while stack:
+        item, first, tail = stack.pop()
+
+        if item is None:
+            writer.Dedent()
+            writer.Write(tail)
+
+            continue
+
+        if not first:
+            writer.Write("\n")
+
+        if "fragment" in item:
+            writer.Write(item["fragment"])
+
+            continue
+
+        if shared and id(item) in shared and item is not resource_reduced:
+            if id(item) not in fragments:
+                contents = StringIO()
+
+                stream_resource(item, Writer(contents), shared, fragments)
+
+                fragments[id(item)] = contents.getvalue()
+
+            writer.Write(fragments[id(item)])
+
+            continue
+
+        if not isinstance(item["value"], list):
+            writer.Write(
+                "{};".format(resource_assignment.Render(item).strip())
+            )
+
+            continue
+
+        head, tail, indentation = resource_container.RenderParts(
+            item, "value"
+        )
+
+        writer.Write(head)
+        writer.Indent(indentation)
+
+        stack.append((None, True, tail))
+        stack.extend(
+            (x, index == 0, None)
+            for index, x in reversed(list(enumerate(item["value"])))
+        )
+
+
 def render_resource(resource_reduced):
     """
     This method applies template rendering to the provided input.
     :param resource_reduced: dict
     :return: string
     """
-    data = {**resource_reduced}
-
-    if isinstance(data["value"], list):
-        data["value"] = [render_resource(x) for x in data["value"]]
+    contents = StringIO()
 
-        return resource_container.Render(data)
+    stream_resource(resource_reduced, Writer(contents))
 
-    return "{};".format(resource_assignment.Render(data).strip())
+    return contents.getvalue()
@@ -4,7 +4,10 @@ This module provides methods for rendering locales
 
 __author__ = "Bernhard Esperester <bernhard@esperester.de>"
 
+from io import StringIO
+
 from bootstrap.classes.template import Template
+from bootstrap.classes.writer import Writer
 
 locales_container = Template(
     """STRINGTABLE {id}
@@ -23,6 +26,31 @@ Template for rendering variable assignment
 """
 
 
+def stream_strings(locale_reduced, writer):
+    """
+    This method applies template rendering to the reduced entries of a
+    single locale and streams the result to the writer.
+    :param locale_reduced: list
+    :param writer: bootstrap.classes.writer.Writer
+    :return:
+    """
+    head, tail, indentation = locales_container.RenderParts(
+        {"id": locale_reduced[0]["key"]}, "value"
+    )
+
+    writer.Write(head)
+    writer.Indent(indentation)
+
+    for index, item in enumerate(locale_reduced):
+        if index:
+            writer.Write("\n")
+
+        writer.Write(locales_assignment.Render(item))
+
+    writer.Dedent()
+    writer.Write(tail)
+
+
 def render_strings(strings_reduced):
     """
     This method applies template rendering to the provided input.
@@ -32,11 +60,10 @@ def render_strings(strings_reduced):
     locales = {}
 
     for key, value in strings_reduced.items():
-        data = {
-            "id": value[0]["key"],
-            "value": "\n".join([locales_assignment.Render(x) for x in value])
-        }
+        contents = StringIO()
+
+        stream_strings(value, Writer(contents))
 
-        locales[key] = locales_container.Render(data)
+        locales[key] = contents.getvalue()
 
     return locales
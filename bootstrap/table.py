@@ -0,0 +1,241 @@
+"""
+This module provides methods for building descriptions from columnar
+tables
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import csv
+import gc
+
+from itertools import repeat
+from sys import intern
+
+from bootstrap.classes.description import Description
+
+
+class TableError(Exception):
+    """
+    Table Error Exception class
+    """
+
+
+class Column(object):
+    """
+    This class models the reference of a template to a column
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        """
+        This method initializes a new instance of the Column class.
+        :param name: string
+        :return:
+        """
+        self.name = name
+
+    def __repr__(self):
+        """
+        This method implements the representation of the column.
+        :return: string
+        """
+        return "Column({!r})".format(self.name)
+
+
+def get_columns(table):
+    """
+    This method converts the table to a dictionary of equally long lists.
+    Tables are dictionaries of sequences or numpy arrays, or numpy record
+    arrays. Numpy values are converted to python values.
+    :param table: mixed
+    :return: dict
+    """
+    dtype = getattr(table, "dtype", None)
+
+    if dtype is not None and dtype.names:
+        table = {x: table[x] for x in dtype.names}
+
+    columns = {}
+
+    for name, column in table.items():
+        tolist = getattr(column, "tolist", None)
+
+        if tolist is not None:
+            columns[name] = tolist()
+        else:
+            columns[name] = list(column)
+
+    if len(set(len(x) for x in columns.values())) > 1:
+        raise TableError("columns differ in length: {}".format(", ".join(
+            "{} {}".format(x, len(y)) for x, y in sorted(columns.items())
+        )))
+
+    return columns
+
+
+def load_csv(csv_file, converters=None, encoding="utf-8", **kwargs):
+    """
+    This method loads the columns of a csv file with a header row. Empty
+    cells are None, all other cells are strings unless a converter is
+    given for their column. Further keyword arguments are passed to
+    csv.reader.
+    :param csv_file: string
+    :param converters: dict
+    :param encoding: string
+    :return: dict
+    """
+    with open(csv_file, "r", encoding=encoding, newline="") as f:
+        rows = csv.reader(f, **kwargs)
+
+        try:
+            names = next(rows)
+        except StopIteration:
+            return {}
+
+        cells = list(zip(*rows))
+
+    columns = {}
+
+    for index, name in enumerate(names):
+        column = [x or None for x in cells[index]] if cells else []
+
+        converter = (converters or {}).get(name)
+
+        if converter is not None:
+            column = [None if x is None else converter(x) for x in column]
+
+        columns[name] = column
+
+    return columns
+
+
+def resolve(value, columns, size):
+    """
+    This method returns an iterable of the value of every row, which is
+    the column the value references or the value repeated.
+    :param value: mixed
+    :param columns: dict
+    :param size: integer
+    :return: iterable
+    """
+    if value.__class__ is not Column:
+        return repeat(value, size)
+
+    try:
+        return columns[value.name]
+    except KeyError:
+        raise TableError("unknown column {}".format(value.name))
+
+
+def resolve_dict(template, columns, size):
+    """
+    This method returns the dictionary of every row. Keys whose value is
+    None in a row are left out of its dictionary.
+    :param template: dict
+    :param columns: dict
+    :param size: integer
+    :return: list
+    """
+    keys = list(template.keys())
+
+    values = [resolve(template[x], columns, size) for x in keys]
+
+    rows = zip(*values) if values else repeat((), size)
+
+    if any(isinstance(x, list) and None in x for x in values):
+        return [
+            {x: y for x, y in zip(keys, row) if y is not None}
+            for row in rows
+        ]
+
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def build_nodes(template, columns, size):
+    """
+    This method builds the description of every row from the template.
+    :param template: bootstrap.Description
+    :param columns: dict
+    :param size: integer
+    :return: list
+    """
+    if isinstance(template, dict):
+        template = Description(template)
+
+    if not isinstance(template, Description):
+        raise TableError("{!r} is not a description".format(template))
+
+    ids = resolve(template.id, columns, size)
+    keys = resolve(template.key, columns, size)
+
+    if template.key.__class__ is Column:
+        keys = [intern(x) if x.__class__ is str else x for x in keys]
+
+    if isinstance(template.value, list):
+        children = [
+            build_nodes(x, columns, size) for x in template.value
+        ]
+
+        if children:
+            values = list(map(list, zip(*children)))
+        else:
+            values = [[] for x in range(size)]
+    else:
+        values = resolve(template.value, columns, size)
+
+    if isinstance(template.locales, dict):
+        locales = resolve_dict(template.locales, columns, size)
+    else:
+        locales = resolve(template.locales, columns, size)
+
+    if template.extra is not None:
+        extras = resolve_dict(template.extra, columns, size)
+    else:
+        extras = repeat(None, size)
+
+    new = object.__new__
+    cls = template.__class__
+
+    items = list(map(new, repeat(cls, size)))
+
+    for item, item_id, key, value, item_locales, extra in zip(
+        items, ids, keys, values, locales, extras
+    ):
+        item.id = item_id
+        item.key = key
+        item.value = value
+        item.locales = item_locales
+        item.extra = extra
+
+    return items
+
+
+def build_table(table, template):
+    """
+    This method builds a description for every row of the table in one
+    batch. The template is a Description or config dictionary whose
+    fields, children, locales and extra keys may reference the columns
+    of the table by Column instances, all other values are shared by
+    every row. Children may be config dictionaries as well.
+
+    The garbage collector is paused while building, as the many new
+    instances would otherwise trigger collections which do not find
+    anything to collect.
+    :param table: mixed
+    :param template: bootstrap.Description
+    :return: list
+    """
+    columns = get_columns(table)
+
+    size = len(next(iter(columns.values()), ()))
+
+    enabled = gc.isenabled()
+
+    gc.disable()
+
+    try:
+        return build_nodes(template, columns, size)
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,199 @@
+"""
+This module provides methods for following the imports of a plugin
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import ast
+import os
+import sys
+
+from importlib.machinery import SourceFileLoader
+from importlib.util import resolve_name,\
+    spec_from_file_location,\
+    module_from_spec
+
+
+def load_source(name, module_file):
+    """
+    This method loads the module from its source file under name like
+    the deprecated imp.load_source.
+    :param name: string
+    :param module_file: string
+    :return: module
+    """
+    loader = SourceFileLoader(name, module_file)
+
+    spec = spec_from_file_location(name, module_file, loader=loader)
+
+    module = module_from_spec(spec)
+
+    sys.modules[name] = module
+
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+
+        raise
+
+    return module
+
+
+def local_modules(directory, names=None):
+    """
+    This method maps the files of the loaded modules inside the
+    directory to their module names. Without names all loaded modules
+    are checked.
+    :param directory: string
+    :param names: iterable
+    :return: dict
+    """
+    directory = os.path.join(os.path.realpath(directory), "")
+
+    if names is None:
+        names = list(sys.modules.keys())
+
+    modules = {}
+
+    for name in names:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+
+        if not module_file:
+            continue
+
+        module_file = os.path.realpath(module_file)
+
+        if module_file.startswith(directory):
+            modules[module_file] = name
+
+    return modules
+
+
+def parse_imports(source, filename="<unknown>", package=None):
+    """
+    This method lists the names of all modules imported by the source.
+    :param source: string
+    :param filename: string
+    :param package: string
+    :return: set
+    """
+    tree = ast.parse(source, filename)
+
+    names = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(x.name for x in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            name = node.module or ""
+
+            if node.level:
+                if not package:
+                    continue
+
+                name = resolve_name("." * node.level + name, package)
+
+            names.add(name)
+            names.update("{}.{}".format(name, x.name) for x in node.names)
+
+    return names
+
+
+def imported_modules(module_file, package=None):
+    """
+    This method lists the names of all modules imported by the module file.
+    :param module_file: string
+    :param package: string
+    :return: set
+    """
+    with open(module_file, "r") as f:
+        return parse_imports(f.read(), module_file, package)
+
+
+def find_module(name, directory):
+    """
+    This method finds the file of the module inside the directory.
+    :param name: string
+    :param directory: string
+    :return: string
+    """
+    path = os.path.join(directory, *name.split("."))
+
+    for module_file in [path + ".py", os.path.join(path, "__init__.py")]:
+        if os.path.isfile(module_file):
+            return module_file
+
+    return None
+
+
+def get_module_name(module_file, directory):
+    """
+    This method returns the name of the module file inside the directory.
+    :param module_file: string
+    :param directory: string
+    :return: string
+    """
+    path, extension = os.path.splitext(
+        os.path.relpath(module_file, directory)
+    )
+
+    names = path.split(os.sep)
+
+    if names[-1] == "__init__":
+        names = names[:-1]
+
+    return ".".join(names)
+
+
+def get_package(name, module_file):
+    """
+    This method returns the package the module belongs to.
+    :param name: string
+    :param module_file: string
+    :return: string
+    """
+    if os.path.basename(module_file) == "__init__.py":
+        return name
+
+    return name.rpartition(".")[0]
+
+
+def find_local_modules(module_file):
+    """
+    This method lists the files of all modules inside the directory of
+    the module file which it imports directly or indirectly.
+    :param module_file: string
+    :return: list
+    """
+    directory = os.path.dirname(os.path.abspath(module_file))
+
+    module_files = []
+    visited = set([os.path.abspath(module_file)])
+
+    stack = [(None, os.path.abspath(module_file))]
+
+    while stack:
+        name, module_file = stack.pop()
+
+        package = None
+
+        if name is not None:
+            package = get_package(name, module_file)
+
+        for imported_name in sorted(imported_modules(module_file, package)):
+            parts = imported_name.split(".")
+
+            for index in range(len(parts)):
+                dependency_name = ".".join(parts[:index + 1])
+                dependency_file = find_module(dependency_name, directory)
+
+                if dependency_file is None or dependency_file in visited:
+                    continue
+
+                visited.add(dependency_file)
+                module_files.append(dependency_file)
+
+                stack.append((dependency_name, dependency_file))
+
+    return module_files
@@ -0,0 +1,222 @@
+"""
+This module provides methods for tracking build inputs and outputs
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import hashlib
+import json
+import os
+import uuid
+
+from bootstrap.utilities.tree import walk
+
+MANIFEST_FILENAME = ".bootstrap-manifest.json"
+"""
+Filename of the manifest in the destination directory
+"""
+
+
+def hash_contents(contents):
+    """
+    This method hashes the provided contents.
+    :param contents: string
+    :return: string
+    """
+    if isinstance(contents, str):
+        contents = contents.encode("utf-8")
+
+    return hashlib.sha1(contents).hexdigest()
+
+
+def hash_file(path):
+    """
+    This method hashes the contents of the file.
+    :param path: string
+    :return: string
+    """
+    with open(path, "rb") as f:
+        return hash_contents(f.read())
+
+
+def fingerprint_description(description):
+    """
+    This method computes a fingerprint of the description and its children.
+    :param description: bootstrap.Description
+    :return: string
+    """
+    digest = hashlib.sha1()
+
+    for item in walk(description):
+        value = item.value
+
+        if isinstance(value, list):
+            value = len(value)
+
+        digest.update(repr(describe_node(item, value)).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def describe_id(description):
+    """
+    This method returns the fixed integer and external flag of the id
+    of the description, which GetId takes over hashing the id, or None.
+    :param description: bootstrap.Description
+    :return: tuple
+    """
+    extra = description.extra
+
+    if extra is None:
+        return None
+
+    value = extra.get("id_value")
+    external = bool(extra.get("external"))
+
+    if value is None and not external:
+        return None
+
+    return value, external
+
+
+def describe_node(description, value):
+    """
+    This method returns the fields of the description identifying it.
+    :param description: bootstrap.Description
+    :param value: mixed
+    :return: tuple
+    """
+    locales = None
+
+    if isinstance(description.locales, dict):
+        locales = sorted(description.locales.items())
+
+    return description.id, description.key, value, locales, \
+        describe_id(description)
+
+
+def fingerprint_nodes(description, fingerprints=None):
+    """
+    This method computes a structural fingerprint for the description and
+    every child having children itself. The fingerprint combines id, key,
+    value, locales and fixed id of the node and its children, so equal
+    subtrees get equal fingerprints. Fingerprints are keyed by the id of
+    the node.
+    :param description: bootstrap.Description
+    :param fingerprints: dict
+    :return: dict
+    """
+    if fingerprints is None:
+        fingerprints = {}
+
+    stack = [(description, False)]
+
+    while stack:
+        item, visited = stack.pop()
+
+        if id(item) in fingerprints:
+            continue
+
+        value = item.value
+
+        if isinstance(value, list):
+            if not visited:
+                stack.append((item, True))
+                stack.extend(
+                    (x, False) for x in value if isinstance(x.value, list)
+                )
+
+                continue
+
+            value = [
+                fingerprints[id(x)] if isinstance(x.value, list)
+                else describe_node(x, x.value)
+                for x in value
+            ]
+
+        fingerprints[id(item)] = hash_contents(
+            repr(describe_node(item, value))
+        )
+
+    return fingerprints
+
+
+def load_manifest(destination_directory):
+    """
+    This method loads the manifest from the destination directory.
+    :param destination_directory: string
+    :return: dict
+    """
+    manifest_file = os.path.join(destination_directory, MANIFEST_FILENAME)
+
+    try:
+        with open(manifest_file, "r") as f:
+            manifest = json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+    if not isinstance(manifest, dict):
+        return {}
+
+    return manifest
+
+
+def save_manifest(destination_directory, manifest):
+    """
+    This method saves the manifest to the destination directory
+    replacing the previous manifest atomically.
+    :param destination_directory: string
+    :param manifest: dict
+    :return:
+    """
+    manifest_file = os.path.join(destination_directory, MANIFEST_FILENAME)
+
+    temporary_file = "{}.{}.tmp".format(manifest_file, uuid.uuid4().hex)
+
+    with open(temporary_file, "x") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    os.replace(temporary_file, manifest_file)
+
+
+def get_plugin_manifest(manifest, filename):
+    """
+    This method returns the entry of the plugin in the manifest. The
+    manifest is shared by all plugins built into the destination
+    directory and keeps an entry for each of them.
+    :param manifest: dict
+    :param filename: string
+    :return: dict
+    """
+    plugins = manifest.get("plugins")
+
+    if not isinstance(plugins, dict):
+        return {}
+
+    entry = plugins.get(filename)
+
+    if not isinstance(entry, dict):
+        return {}
+
+    return entry
+
+
+def is_current(manifest, destination_directory, stage, input_hash):
+    """
+    This method checks whether the stage has been built from the same
+    input and all of its outputs still exist.
+    :param manifest: dict of the plugin, see get_plugin_manifest
+    :param destination_directory: string
+    :param stage: string
+    :param input_hash: string
+    :return: boolean
+    """
+    entry = manifest.get("stages", {}).get(stage)
+
+    if not isinstance(entry, dict) or entry.get("input") != input_hash:
+        return False
+
+    return all(
+        os.path.isfile(os.path.join(destination_directory, x))
+        for x in entry.get("outputs", {})
+    )
@@ -21,4 +21,4 @@ def assert_directories(path, is_file_path=False):
         directory_path = dirname(path)
 
     if not isdir(directory_path):
-        makedirs(directory_path)
+        makedirs(directory_path, exist_ok=True)
@@ -0,0 +1,194 @@
+"""
+This module provides methods for working with the sections of a plugin
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import ast
+import os
+import sys
+
+RESOURCE_SECTION = "resource_section"
+"""
+Name of the section defining the descriptions
+"""
+
+ID_SECTION = "id_section"
+"""
+Name of the section defining the ids
+"""
+
+
+def get_section(lines, name):
+    """
+    This method returns the lines of the section with their line numbers.
+    :param lines: list
+    :param name: string
+    :return: list
+    """
+    section = []
+
+    inside = False
+
+    for index, line in enumerate(lines):
+        if line.startswith("#----begin_{}----".format(name)):
+            inside = True
+
+            continue
+
+        if line.startswith("#----end_{}----".format(name)):
+            inside = False
+
+            continue
+
+        if inside:
+            section.append((index + 1, line))
+
+    return section
+
+
+def get_source(section):
+    """
+    This method joins the section to source code which keeps the line
+    numbers of the plugin file.
+    :param section: list
+    :return: string
+    """
+    lines = []
+
+    for number, line in section:
+        lines += [""] * (number - len(lines) - 1)
+
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def get_id_names(lines):
+    """
+    This method lists the variable names assigned in the id section.
+    :param lines: list
+    :return: list
+    """
+    names = []
+
+    for number, line in get_section(lines, ID_SECTION):
+        if line.startswith("#") or not line:
+            continue
+
+        names.append(line.split("=")[0].strip())
+
+    return names
+
+
+def resolve_ids(plugin_file, lines):
+    """
+    This method resolves the id section without executing the plugin.
+    Only the resource section is executed, the id section assignments
+    are parsed with ast and evaluated against its namespace.
+    :param plugin_file: string
+    :param lines: list
+    :return: dict
+    """
+    namespace = {
+        "__name__": "__bootstrap_resource_section__",
+        "__file__": plugin_file
+    }
+
+    path = list(sys.path)
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(plugin_file)))
+
+    try:
+        exec(compile(
+            get_source(get_section(lines, RESOURCE_SECTION)),
+            plugin_file,
+            "exec"
+        ), namespace)
+    finally:
+        sys.path[:] = path
+
+    tree = ast.parse(
+        get_source(get_section(lines, ID_SECTION)), plugin_file
+    )
+
+    values = {}
+
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1 \
+                or not isinstance(node.targets[0], ast.Name):
+            continue
+
+        expression = node.value
+
+        if isinstance(expression, ast.Call) and not expression.args \
+                and not expression.keywords \
+                and isinstance(expression.func, ast.Attribute) \
+                and expression.func.attr == "GetId" \
+                and isinstance(expression.func.value, ast.Name):
+            value = namespace[expression.func.value.id].GetId()
+        else:
+            value = eval(compile(
+                ast.Expression(expression), plugin_file, "eval"
+            ), namespace)
+
+        namespace[node.targets[0].id] = value
+        values[node.targets[0].id] = value
+
+    return values
+
+
+def compile_lines(lines, values, id_header, keep_lines=False):
+    """
+    This method removes all bootstrap sections from the lines and
+    injects the values of the id section. With keep_lines removed lines
+    are replaced by empty lines so line numbers are kept.
+    :param lines: list
+    :param values: dict
+    :param id_header: string
+    :param keep_lines: boolean
+    :return: list
+    """
+    lines_computed = []
+
+    ignore_lines = False
+    id_section = False
+
+    for line in lines:
+        # id section
+        if line.startswith("#----begin_id_section----"):
+            id_section = True
+
+            lines_computed.append(id_header)
+
+            continue
+
+        if line.startswith("#----end_id_section----"):
+            id_section = False
+
+        elif id_section:
+            if line and not line.startswith("#"):
+                variableName = line.split("=")[0].strip()
+
+                lines_computed.append(
+                    "{} = {}".format(variableName, values[variableName])
+                )
+
+                continue
+
+        # skip bootstrap lines
+        elif line.startswith("#----begin"):
+            ignore_lines = True
+
+        elif line.startswith("#----end"):
+            ignore_lines = False
+
+        elif not ignore_lines:
+            lines_computed.append(line)
+
+            continue
+
+        if keep_lines:
+            lines_computed.append("")
+
+    return lines_computed
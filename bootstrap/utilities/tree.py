@@ -0,0 +1,62 @@
+"""
+This module provides methods for traversing Description trees
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+
+def walk(description):
+    """
+    This method yields the description and all of its children in
+    depth first order without recursion.
+    :param description: bootstrap.Description
+    :return: generator
+    """
+    stack = [description]
+
+    while stack:
+        item = stack.pop()
+
+        yield item
+
+        if isinstance(item.value, list):
+            stack.extend(reversed(item.value))
+
+
+def find_shared_nodes(description, fingerprints=None):
+    """
+    This method finds the descriptions with children occurring more than
+    once in the tree. Without fingerprints they are identified by the id
+    of the instance, with fingerprints by their structure. Subtrees are
+    not traversed again, so this takes time proportional to the number
+    of distinct descriptions.
+    :param description: bootstrap.Description
+    :param fingerprints: dict
+    :return: set
+    """
+    visited = set()
+    shared = set()
+
+    if not isinstance(description.value, list):
+        return shared
+
+    stack = [description]
+
+    while stack:
+        item = stack.pop()
+
+        if fingerprints is None:
+            key = id(item)
+        else:
+            key = fingerprints[id(item)]
+
+        if key in visited:
+            shared.add(key)
+
+            continue
+
+        visited.add(key)
+
+        stack.extend(x for x in item.value if isinstance(x.value, list))
+
+    return shared
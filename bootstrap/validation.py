@@ -0,0 +1,241 @@
+"""
+This module provides methods for validating descriptions before they are
+compiled
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+from bootstrap.classes.description import Description, hash_id
+
+ERROR = "error"
+"""
+Severity of diagnostics which break the compiled plugin
+"""
+
+WARNING = "warning"
+"""
+Severity of diagnostics which may be intended
+"""
+
+
+class ValidationError(Exception):
+    """
+    Validation Error Exception class
+    """
+
+    def __init__(self, diagnostics):
+        """
+        This method initializes a new instance of the ValidationError class.
+        :param diagnostics: list
+        :return:
+        """
+        super(ValidationError, self).__init__("\n".join(
+            format_diagnostic(x) for x in diagnostics
+        ))
+
+        self.diagnostics = diagnostics
+
+
+def format_diagnostic(diagnostic):
+    """
+    This method formats the diagnostic as a single line.
+    :param diagnostic: dict
+    :return: string
+    """
+    return "{}: {}: {} [{}]".format(
+        diagnostic["path"],
+        diagnostic["severity"],
+        diagnostic["message"],
+        diagnostic["code"]
+    )
+
+
+def get_path(item, parents):
+    """
+    This method returns the path of the description from the root using
+    the id or else the key of every description.
+    :param item: bootstrap.Description
+    :param parents: tuple
+    :return: string
+    """
+    names = []
+
+    while item is not None:
+        name = getattr(item, "id", None) or getattr(item, "key", None)
+
+        names.append(str(name) if name is not None else "?")
+
+        item, parents = parents or (None, None)
+
+    return "/".join(reversed(names))
+
+
+def is_hashed(item):
+    """
+    This method checks whether the integer of the id of the description
+    is hashed rather than fixed or external.
+    :param item: bootstrap.Description
+    :return: boolean
+    """
+    extra = item.extra
+
+    if extra is None:
+        return True
+
+    return extra.get("id_value") is None and not extra.get("external")
+
+
+def validate_description(description, locales=None):
+    """
+    This method validates the description in a single traversal and
+    returns the diagnostics found. Ids are checked for duplicates and
+    colliding integers with hash indexes, the coverage of every locale
+    is kept as a bitset over the localized descriptions.
+
+    Checks are made for duplicate ids, hashed ids of the same integer,
+    locales without id, locales which are not rendered, descriptions
+    missing some of the rendered locales, repeated instances, children
+    which are not descriptions and the name of the string tables.
+    :param description: bootstrap.Description
+    :param locales: list
+    :return: list
+    """
+    diagnostics = []
+
+    def report(severity, code, message, item, parents):
+        diagnostics.append({
+            "severity": severity,
+            "code": code,
+            "message": message,
+            "id": getattr(item, "id", None),
+            "path": get_path(item, parents)
+        })
+
+    if locales is None:
+        locales = []
+
+        if isinstance(description.locales, dict):
+            locales = list(description.locales.keys())
+
+    if locales and not description.id:
+        report(
+            ERROR, "stringtable_name",
+            "the root has no id to name the string tables",
+            description, None
+        )
+
+    ids = {}
+    values = {}
+    visited = set()
+
+    localized = []
+    coverage = {x: bytearray() for x in locales}
+
+    stack = [(description, None)]
+
+    while stack:
+        item, parents = stack.pop()
+
+        if not isinstance(item, Description):
+            report(
+                ERROR, "invalid_child",
+                "{!r} is not a description".format(item), item, parents
+            )
+
+            continue
+
+        if id(item) in visited:
+            report(
+                WARNING, "repeated_description",
+                "the description is placed more than once", item, parents
+            )
+
+            continue
+
+        visited.add(id(item))
+
+        description_id = item.id
+
+        if description_id:
+            if description_id in ids:
+                report(
+                    ERROR, "duplicate_id",
+                    "the id {} is assigned more than once".format(
+                        description_id
+                    ),
+                    item, parents
+                )
+            elif is_hashed(item):
+                ids[description_id] = item
+
+                value = hash_id(description_id)
+
+                if value in values:
+                    report(
+                        WARNING, "id_collision",
+                        "the id {} hashes to {} like {}".format(
+                            description_id, value, values[value]
+                        ),
+                        item, parents
+                    )
+                else:
+                    values[value] = description_id
+            else:
+                ids[description_id] = item
+
+        if isinstance(item.locales, dict) and item.locales:
+            if not description_id:
+                report(
+                    ERROR, "locales_without_id",
+                    "the locales can not be rendered without id",
+                    item, parents
+                )
+            else:
+                index = len(localized)
+
+                localized.append((item, parents))
+
+                for bits in coverage.values():
+                    if not index & 7:
+                        bits.append(0)
+
+                for locale in item.locales:
+                    bits = coverage.get(locale)
+
+                    if bits is None:
+                        report(
+                            WARNING, "unrendered_locale",
+                            "the locale {} is not a locale of the root".format(
+                                locale
+                            ),
+                            item, parents
+                        )
+
+                        continue
+
+                    bits[index >> 3] |= 1 << (index & 7)
+
+        if isinstance(item.value, list):
+            parent = (item, parents)
+
+            stack.extend((x, parent) for x in reversed(item.value))
+
+    for locale, bits in coverage.items():
+        for offset, byte in enumerate(bits):
+            if byte == 255:
+                continue
+
+            for bit in range(8):
+                index = (offset << 3) + bit
+
+                if index >= len(localized) or byte & (1 << bit):
+                    continue
+
+                item, parents = localized[index]
+
+                report(
+                    WARNING, "missing_locale",
+                    "the locale {} is missing".format(locale), item, parents
+                )
+
+    return diagnostics
@@ -0,0 +1,233 @@
+"""
+This module provides methods for rebuilding plugins on change
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import os
+import sys
+import time
+import traceback
+
+from bootstrap.io import build
+from bootstrap.workspace import load_description
+from bootstrap.utilities.imports import imported_modules,\
+    local_modules
+
+
+def source_files(directory):
+    """
+    This method maps the files of all python sources inside the
+    directory to None, as their module names are not known.
+    :param directory: string
+    :return: dict
+    """
+    directory = os.path.realpath(directory)
+
+    sources = {}
+
+    for root, directories, filenames in os.walk(directory):
+        directories[:] = [x for x in directories if not x.startswith(".")]
+
+        for filename in filenames:
+            if filename.endswith(".py"):
+                sources[os.path.join(root, filename)] = None
+
+    return sources
+
+
+class Watcher(object):
+    """
+    This class models a warm build process rebuilding plugins on change
+    """
+
+    def __init__(self, plugins, interval=0.02, debounce=0.02, force=False):
+        """
+        This method initializes a new instance of the Watcher class.
+        :param plugins: list
+        :param interval: float
+        :param debounce: float
+        :param force: boolean
+        :return:
+        """
+        self.plugins = plugins
+        self.interval = interval
+        self.debounce = debounce
+        self.force = force
+
+        self.dependencies = [{} for x in plugins]
+        self.mtimes = {}
+
+    def Stat(self, paths):
+        """
+        This method looks up the modification times of the paths.
+        :param paths: iterable
+        :return: dict
+        """
+        mtimes = {}
+
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+
+        return mtimes
+
+    def Build(self, index):
+        """
+        This method builds the plugin and records its local modules.
+        Local modules failing to import are missing from sys.modules, so
+        a failed build keeps watching the modules of the previous build,
+        or all sources of the plugin directory if there is none.
+        :param index: integer
+        :return: dict
+        """
+        plugin = self.plugins[index]
+        plugin_file = os.path.realpath(plugin["plugin_file"])
+        plugin_directory = os.path.dirname(plugin_file)
+
+        if plugin_directory not in sys.path:
+            sys.path.insert(0, plugin_directory)
+
+        result = {
+            "filename": plugin["filename"],
+            "success": False,
+            "report": None,
+            "error": None
+        }
+
+        try:
+            result["report"] = build(
+                load_description(plugin),
+                plugin["plugin_file"],
+                plugin["destination_directory"],
+                plugin["filename"],
+                self.force,
+                bundle=plugin.get("bundle", False)
+            )
+
+            result["success"] = True
+        except Exception:
+            result["error"] = traceback.format_exc()
+
+        dependencies = local_modules(plugin_directory)
+        dependencies[plugin_file] = None
+
+        if not result["success"]:
+            previous = self.dependencies[index]
+
+            if not previous:
+                previous = source_files(plugin_directory)
+
+            for module_file, name in previous.items():
+                dependencies.setdefault(module_file, name)
+
+        self.dependencies[index] = dependencies
+        self.mtimes.update(self.Stat(dependencies.keys()))
+
+        return result
+
+    def Changed(self):
+        """
+        This method lists all watched files modified since the last scan.
+        :return: set
+        """
+        mtimes = self.Stat(self.mtimes.keys())
+
+        changed = set(
+            x for x, y in mtimes.items() if self.mtimes.get(x) != y
+        )
+
+        self.mtimes.update(mtimes)
+
+        return changed
+
+    def Evict(self, changed):
+        """
+        This method unloads changed local modules and all local modules
+        importing them, unchanged modules stay loaded.
+        :param changed: set
+        :return:
+        """
+        modules = {}
+
+        for dependencies in self.dependencies:
+            for module_file, name in dependencies.items():
+                if name is not None:
+                    modules[name] = module_file
+
+        evicted = set(x for x, y in modules.items() if y in changed)
+
+        imports = {}
+
+        for name, module_file in modules.items():
+            module = sys.modules.get(name)
+
+            try:
+                imports[name] = imported_modules(
+                    module_file, getattr(module, "__package__", None)
+                )
+            except (OSError, SyntaxError):
+                imports[name] = set()
+
+        while True:
+            dependents = set(
+                x for x, y in imports.items()
+                if x not in evicted and y & evicted
+            )
+
+            if not dependents:
+                break
+
+            evicted |= dependents
+
+        for name in evicted:
+            sys.modules.pop(name, None)
+
+    def Poll(self):
+        """
+        This method rebuilds all plugins affected by changed files.
+        Changes are collected until no file has been modified for the
+        debounce interval.
+        :return: list
+        """
+        changed = self.Changed()
+
+        if not changed:
+            return []
+
+        while True:
+            time.sleep(self.debounce)
+
+            changed_again = self.Changed()
+
+            if not changed_again:
+                break
+
+            changed |= changed_again
+
+        self.Evict(changed)
+
+        return [
+            self.Build(index)
+            for index, dependencies in enumerate(self.dependencies)
+            if changed.intersection(dependencies.keys())
+        ]
+
+    def Run(self, callback=None):
+        """
+        This method builds all plugins and rebuilds them on change
+        until interrupted.
+        :param callback: callable
+        :return:
+        """
+        results = [self.Build(x) for x in range(len(self.plugins))]
+
+        while True:
+            if results and callback is not None:
+                callback(results)
+
+            time.sleep(self.interval)
+
+            results = self.Poll()
@@ -0,0 +1,334 @@
+"""
+This module provides methods for building a workspace of plugins
+"""
+
+__author__ = "Bernhard Esperester <bernhard@esperester.de>"
+
+import json
+import os
+import sys
+import traceback
+
+from concurrent.futures import ProcessPoolExecutor
+
+from bootstrap.io import build, run_worker
+from bootstrap.classes.registry import IdRegistry
+from bootstrap.classes.cache import RenderCache
+from bootstrap.classes.output import ZipOutput
+from bootstrap.classes.instrumentation import Instrumentation
+from bootstrap.validation import validate_description
+from bootstrap.utilities.imports import load_source,\
+    local_modules
+
+PLUGIN_KEYS = (
+    "plugin_file",
+    "description",
+    "destination_directory",
+    "filename"
+)
+"""
+Keys required for every plugin in a workspace
+"""
+
+
+class WorkspaceError(Exception):
+    """
+    Workspace Error Exception class
+    """
+
+
+def load_workspace(workspace_file):
+    """
+    This method loads the plugins listed in the workspace file.
+    Relative paths are resolved against the directory of the workspace.
+    :param workspace_file: string
+    :return: list
+    """
+    with open(workspace_file, "r") as f:
+        config = json.load(f)
+
+    root_directory = os.path.dirname(os.path.abspath(workspace_file))
+
+    plugins = []
+
+    for index, item in enumerate(config.get("plugins", [])):
+        missing = [x for x in PLUGIN_KEYS if x not in item]
+
+        if missing:
+            raise WorkspaceError(
+                "plugin {} is missing {}".format(index, ", ".join(missing))
+            )
+
+        plugins.append({
+            **item,
+            "plugin_file": os.path.join(root_directory, item["plugin_file"]),
+            "destination_directory": os.path.join(
+                root_directory, item["destination_directory"]
+            )
+        })
+
+    return plugins
+
+
+def load_description(plugin):
+    """
+    This method loads the plugin module and looks up its description.
+    :param plugin: dict
+    :return: bootstrap.Description
+    """
+    plugin_file = plugin["plugin_file"]
+
+    plugin_filename, plugin_fileextension = os.path.splitext(
+        os.path.basename(plugin_file)
+    )
+
+    module = load_source(plugin_filename, plugin_file)
+
+    description = module
+
+    for name in plugin["description"].split("."):
+        description = getattr(description, name)
+
+    return description
+
+
+def build_plugin(plugin, force=False, report_directory=None,
+                 profile=False, cache_directory=None, archive_directory=None,
+                 trace_memory=False):
+    """
+    This method builds a single plugin of the workspace.
+    Modules of the plugin directory are unloaded afterwards so plugins
+    sharing a process do not see each other's modules.
+
+    The destination directory is locked during the build as several
+    plugins may share it.
+
+    With a report directory the stages of the build are measured and
+    written as json report and chrome trace named after the plugin,
+    with profile the cProfile stats are written next to them and with
+    trace_memory the reports include the peak memory of every stage. With a
+    cache directory rendered group subtrees are shared across plugins
+    and builds. With an archive directory the plugin is written to a zip
+    archive named after the plugin instead of its destination directory.
+    Archives are not locked, as every archive is written to a temporary
+    file and moved into place, so plugins are archived in parallel.
+    :param plugin: dict
+    :param force: boolean
+    :param report_directory: string
+    :param profile: boolean
+    :param cache_directory: string
+    :param archive_directory: string
+    :param trace_memory: boolean
+    :return: dict
+    """
+    plugin_directory = os.path.dirname(plugin["plugin_file"])
+
+    modules = set(sys.modules.keys())
+    path = list(sys.path)
+
+    sys.path.insert(0, plugin_directory)
+
+    registry = IdRegistry()
+
+    instrumentation = None
+    profile_file = None
+    cache = None
+    output = None
+
+    if cache_directory is not None:
+        cache = RenderCache(cache_directory)
+
+    if archive_directory is not None:
+        output = ZipOutput(
+            os.path.join(
+                archive_directory, "{}.zip".format(plugin["filename"])
+            ),
+            plugin["filename"]
+        )
+
+    if report_directory is not None:
+        instrumentation = Instrumentation(trace_memory)
+
+        if profile:
+            profile_file = os.path.join(
+                report_directory, "{}.prof".format(plugin["filename"])
+            )
+
+    result = {
+        "filename": plugin["filename"],
+        "success": False,
+        "report": None,
+        "error": None,
+        "ids": {}
+    }
+
+    try:
+        result["report"] = build(
+            load_description(plugin),
+            plugin["plugin_file"],
+            plugin["destination_directory"],
+            plugin["filename"],
+            force,
+            registry,
+            plugin.get("bundle", False),
+            instrumentation,
+            profile_file,
+            True,
+            cache,
+            output=output
+        )
+
+        result["success"] = True
+        result["ids"] = registry.ids
+    except Exception:
+        result["error"] = traceback.format_exc()
+    finally:
+        sys.path[:] = path
+
+        unload_modules(modules, plugin_directory)
+
+    if instrumentation is not None:
+        write_reports(instrumentation, report_directory, plugin["filename"])
+
+    return result
+
+
+def validate_plugin(plugin):
+    """
+    This method validates the description of a single plugin of the
+    workspace without building it.
+    :param plugin: dict
+    :return: list
+    """
+    plugin_directory = os.path.dirname(plugin["plugin_file"])
+
+    modules = set(sys.modules.keys())
+    path = list(sys.path)
+
+    sys.path.insert(0, plugin_directory)
+
+    try:
+        return validate_description(load_description(plugin))
+    finally:
+        sys.path[:] = path
+
+        unload_modules(modules, plugin_directory)
+
+
+def unload_modules(modules, directory):
+    """
+    This method unloads the modules inside the directory which were
+    loaded since the names of the loaded modules were taken. Other
+    modules imported by a plugin, like those of the standard library,
+    stay loaded so the next plugin does not import them again.
+    :param modules: set
+    :param directory: string
+    :return:
+    """
+    names = set(sys.modules.keys()) - modules
+
+    for name in local_modules(directory, names).values():
+        sys.modules.pop(name, None)
+
+
+def write_reports(instrumentation, report_directory, filename):
+    """
+    This method writes the json report and chrome trace of a build.
+    :param instrumentation: bootstrap.classes.instrumentation.Instrumentation
+    :param report_directory: string
+    :param filename: string
+    :return:
+    """
+    if not os.path.isdir(report_directory):
+        os.makedirs(report_directory, exist_ok=True)
+
+    instrumentation.WriteReport(
+        os.path.join(report_directory, "{}.json".format(filename))
+    )
+    instrumentation.WriteTrace(
+        os.path.join(report_directory, "{}.trace.json".format(filename))
+    )
+
+
+def build_workspace(plugins, jobs=None, force=False, registry=None,
+                    report_directory=None, profile=False,
+                    cache_directory=None, archive_directory=None,
+                    trace_memory=False):
+    """
+    This method builds all plugins of the workspace in parallel.
+    Ids of all plugins are registered with the registry afterwards to
+    detect collisions across the workspace.
+    :param plugins: list
+    :param jobs: integer
+    :param force: boolean
+    :param registry: bootstrap.classes.registry.IdRegistry
+    :param report_directory: string
+    :param profile: boolean
+    :param cache_directory: string
+    :param archive_directory: string
+    :param trace_memory: boolean
+    :return: list
+    """
+    if jobs == 1:
+        results = [
+            build_plugin(
+                x, force, report_directory, profile, cache_directory,
+                archive_directory, trace_memory
+            )
+            for x in plugins
+        ]
+    else:
+        results = build_parallel(
+            plugins, jobs, force, report_directory, profile, cache_directory,
+            archive_directory, trace_memory
+        )
+
+    if registry is not None:
+        for result in results:
+            registry.Update(
+                list(result["ids"].keys()), result["filename"],
+                list(result["ids"].values())
+            )
+
+    return results
+
+
+def build_parallel(plugins, jobs=None, force=False, report_directory=None,
+                   profile=False, cache_directory=None,
+                   archive_directory=None, trace_memory=False):
+    """
+    This method builds the plugins on a pool of worker processes.
+    :param plugins: list
+    :param jobs: integer
+    :param force: boolean
+    :param report_directory: string
+    :param profile: boolean
+    :param cache_directory: string
+    :param archive_directory: string
+    :param trace_memory: boolean
+    :return: list
+    """
+    results = []
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                run_worker, build_plugin, x, force, report_directory,
+                profile, cache_directory, archive_directory, trace_memory
+            )
+            for x in plugins
+        ]
+
+        for plugin, future in zip(plugins, futures):
+            try:
+                results.append(future.result())
+            except Exception:
+                results.append({
+                    "filename": plugin["filename"],
+                    "success": False,
+                    "report": None,
+                    "error": traceback.format_exc(),
+                    "ids": {}
+                })
+
+    return results
@@ -1,8 +1,11 @@
+import logging
 import os
 
 from bootstrap.io import build
 from tmyplugin import root
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 root_path = os.path.dirname(os.path.realpath(__file__))
 
 plugin_file = os.path.join(root_path, "tmyplugin.py")
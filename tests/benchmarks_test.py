@@ -0,0 +1,29 @@
+"""Test benchmarks module."""
+
+import unittest
+
+from benchmarks.run import IMPORTS, run
+
+
+class TestBenchmarksMethods(unittest.TestCase):
+
+    def test_run(self):
+        results = run(size=10, repeat=1)
+
+        self.assertEqual(results["parameters"]["size"], 10)
+        self.assertEqual(set(results["stages"]), {x for x, y in IMPORTS} | {
+            "generate", "build_table", "load_document", "load_snapshot",
+            "export_catalog", "import_catalogs", "validate", "index",
+            "reduce_header", "reduce_resource", "reduce_strings",
+            "reduce_fused", "render_header", "render_resource",
+            "render_strings", "write_header", "write_resource",
+            "write_strings", "write_strings_thread",
+            "write_strings_process", "compile_plugin", "build", "build_noop"
+        })
+
+        for name, seconds in results["stages"].items():
+            self.assertGreaterEqual(seconds, 0, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
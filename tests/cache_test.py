@@ -0,0 +1,151 @@
+"""Test cache module."""
+
+import unittest
+import os
+import tempfile
+
+from unittest import mock
+
+from bootstrap import Description, Assignment, Container, Group
+from bootstrap.io import build
+from bootstrap.classes.cache import RenderCache
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.reducers.cached import reduce_cached
+from bootstrap.render.res import render_resource
+from bootstrap.render.str import render_strings
+from tests.io_test import create_plugin
+
+
+def create_description(name):
+    """Create a container sharing its settings group with others."""
+    settings = Group("SETTINGS", {
+        "value": [
+            Group("SAMPLING", {
+                "value": [
+                    Description({
+                        "id": "SAMPLES",
+                        "key": "LONG",
+                        "value": [Assignment("MIN", 1)],
+                        "locales": {"strings_us": "Samples"}
+                    })
+                ],
+                "locales": {"strings_us": "Sampling"}
+            })
+        ],
+        "locales": {"strings_us": "Settings"}
+    })
+
+    return Container(name, {
+        "value": [
+            Assignment("NAME", name),
+            settings
+        ],
+        "locales": {"strings_us": name}
+    })
+
+
+class TestRenderCache(unittest.TestCase):
+
+    def test_reduce_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = RenderCache(directory)
+
+            for name in ("Tfirst", "Tsecond"):
+                description = create_description(name)
+
+                expected = reduce_fused(description)
+                reduced = reduce_cached(description, cache)
+
+                self.assertEqual(reduced["header"], expected["header"])
+                self.assertEqual(
+                    render_resource(reduced["resource"]),
+                    render_resource(expected["resource"])
+                )
+                self.assertEqual(
+                    render_strings(reduced["strings"]),
+                    render_strings(expected["strings"])
+                )
+
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(cache.misses, 2)
+
+            group = reduced["resource"]["value"][1]
+
+            self.assertIn("fragment", group)
+            self.assertEqual(group["value"], [])
+
+    def test_prune(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = RenderCache(directory, 120)
+
+            for index, key in enumerate(("aa01", "bb02", "cc03")):
+                cache.Put(key, {"resource": "x" * 40})
+
+                os.utime(cache.GetPath(key), (index, index))
+
+            cache.Get("aa01")
+
+            self.assertEqual(cache.Prune(), 1)
+            self.assertIsNone(cache.Get("bb02"))
+            self.assertIsNotNone(cache.Get("aa01"))
+            self.assertIsNotNone(cache.Get("cc03"))
+
+            self.assertEqual(cache.LoadSize(), 112)
+
+    def test_prune_size(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = RenderCache(directory, 1000)
+
+            with mock.patch("os.walk") as walk:
+                self.assertEqual(cache.Prune(), 0)
+
+                walk.assert_not_called()
+
+            cache.Put("aa01", {"resource": "x" * 40})
+
+            self.assertEqual(cache.Prune(), 0)
+            self.assertEqual(cache.LoadSize(), 56)
+
+            cache = RenderCache(directory, 100)
+
+            cache.Put("bb02", {"resource": "x" * 20})
+
+            with mock.patch("os.walk") as walk:
+                self.assertEqual(cache.Prune(), 0)
+
+                walk.assert_not_called()
+
+            self.assertEqual(cache.LoadSize(), 92)
+
+            cache.Put("cc03", {"resource": "x" * 20})
+
+            os.utime(cache.GetPath("aa01"), (0, 0))
+
+            self.assertEqual(cache.Prune(), 1)
+            self.assertIsNone(cache.Get("aa01"))
+            self.assertEqual(cache.LoadSize(), 72)
+
+    def test_build(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+
+            for name in ("cached", "uncached"):
+                build(
+                    module.root, plugin_file,
+                    os.path.join(directory, name), "tmyplugin",
+                    cache=RenderCache(os.path.join(directory, "cache"))
+                    if name == "cached" else None
+                )
+
+            for path in ("tmyplugin.res", "tmyplugin.h"):
+                files = [
+                    os.path.join(directory, x, "res", "description", path)
+                    for x in ("cached", "uncached")
+                ]
+
+                with open(files[0]) as a, open(files[1]) as b:
+                    self.assertEqual(a.read(), b.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""Test catalog module."""
+
+import unittest
+import os
+import tempfile
+
+from bootstrap import Description, Assignment, Container
+from bootstrap.catalog import parse_catalog,\
+    load_catalog,\
+    import_catalogs,\
+    export_catalog
+from bootstrap.parser import ParseError
+
+CATALOG = """# German translation
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+#: Tmyplugin/STRENGTH
+msgctxt "STRENGTH"
+msgid "Strength"
+msgstr "Stärke "
+"(\\"max\\")"
+
+#, fuzzy
+msgctxt "OFFSET"
+msgid "Offset"
+msgstr "Versatz"
+
+msgctxt "COUNT"
+msgid "Item"
+msgid_plural "Items"
+msgstr[0] "Element"
+msgstr[1] "Elemente"
+
+msgctxt "REMOVED"
+msgid "Removed"
+msgstr "Entfernt"
+
+#~ msgctxt "OBSOLETE"
+#~ msgid "Obsolete"
+#~ msgstr "Veraltet"
+"""
+
+
+def create_root():
+    """Create a plugin description with english strings."""
+    return Container("Tmyplugin", {
+        "value": [
+            Assignment("NAME", "Tmyplugin"),
+            Description({
+                "id": "STRENGTH",
+                "key": "REAL",
+                "locales": {"strings_us": "Strength \"max\""}
+            }),
+            Description({
+                "id": "OFFSET",
+                "key": "REAL",
+                "locales": {"strings_us": "Offset", "strings_de": "Abstand"}
+            }),
+            Description({
+                "id": "COUNT",
+                "key": "LONG",
+                "locales": {"strings_us": "Item"}
+            }),
+            Description({
+                "id": "ANGLE",
+                "key": "REAL",
+                "locales": {"strings_us": "Angle"}
+            })
+        ],
+        "locales": {"strings_us": "My plugin"}
+    })
+
+
+class TestCatalogMethods(unittest.TestCase):
+
+    def test_parse_catalog(self):
+        entries = list(parse_catalog(CATALOG.splitlines(True)))
+
+        self.assertEqual(len(entries), 5)
+        self.assertEqual(entries[1]["string"], "Stärke (\"max\")")
+        self.assertEqual(entries[1]["line"], 7)
+        self.assertTrue(entries[2]["fuzzy"])
+        self.assertFalse(entries[3]["fuzzy"])
+        self.assertEqual(entries[3]["string"], "Element")
+
+        with self.assertRaises(ParseError):
+            list(parse_catalog(["msgid \"A\"\n", "msgfoo \"B\"\n"]))
+
+        with self.assertRaises(ParseError):
+            list(parse_catalog(["msgid \"A\"\n"]))
+
+    def test_import_catalogs(self):
+        root = create_root()
+
+        with tempfile.TemporaryDirectory() as directory:
+            catalog_file = os.path.join(directory, "de.po")
+
+            with open(catalog_file, "w", encoding="utf-8") as f:
+                f.write(CATALOG)
+
+            self.assertIsNone(load_catalog(catalog_file)["OFFSET"])
+
+            report = import_catalogs(
+                root, {
+                    "strings_de": catalog_file,
+                    "strings_fr": {"ANGLE": "Angle", "STRENGTH": None}
+                },
+                {"strings_de": ["strings_us"], "strings_fr": ["strings_de"]}
+            )
+
+        strength, offset, count, angle = root.value[1:]
+
+        self.assertEqual(count.locales["strings_de"], "Element")
+        self.assertEqual(offset.locales["strings_de"], "Abstand")
+        self.assertEqual(angle.locales["strings_de"], "Angle")
+        self.assertEqual(strength.locales["strings_fr"], "Stärke (\"max\")")
+        self.assertEqual(offset.locales["strings_fr"], "Abstand")
+        self.assertEqual(root.locales["strings_fr"], "My plugin")
+
+        self.assertEqual(report["strings_de"], {
+            "imported": 2,
+            "missing": ["Tmyplugin", "OFFSET", "ANGLE"],
+            "fallback": ["Tmyplugin", "ANGLE"],
+            "unused": ["REMOVED"]
+        })
+        self.assertEqual(report["strings_fr"]["imported"], 1)
+        self.assertEqual(report["strings_fr"]["unused"], [])
+
+    def test_export_catalog(self):
+        root = create_root()
+
+        with tempfile.TemporaryDirectory() as directory:
+            template_file = os.path.join(directory, "tmyplugin.pot")
+            catalog_file = os.path.join(directory, "de.po")
+
+            self.assertEqual(export_catalog(root, template_file), 5)
+            self.assertEqual(export_catalog(
+                root, catalog_file, translation="strings_de"
+            ), 5)
+
+            template = load_catalog(template_file)
+            catalog = load_catalog(catalog_file)
+
+            with open(template_file, encoding="utf-8") as f:
+                entries = list(parse_catalog(f))
+
+        self.assertEqual(list(template), [
+            "Tmyplugin", "STRENGTH", "OFFSET", "COUNT", "ANGLE"
+        ])
+        self.assertEqual(set(template.values()), {None})
+        self.assertEqual(entries[2]["id"], "Strength \"max\"")
+        self.assertEqual(catalog["OFFSET"], "Abstand")
+
+        import_catalogs(root, {"strings_it": catalog}, ["strings_us"])
+
+        self.assertEqual(root.value[2].locales["strings_it"], "Abstand")
+        self.assertEqual(
+            root.value[1].locales["strings_it"], "Strength \"max\""
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
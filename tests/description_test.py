@@ -0,0 +1,96 @@
+"""Test description module."""
+
+import unittest
+import os
+import pickle
+import subprocess
+import sys
+
+from bootstrap import Description, Assignment, Group, Container
+
+project_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+IMPORT_SOURCE = """import sys
+
+from bootstrap import Description, Container
+
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+class TestDescriptionMethods(unittest.TestCase):
+
+    def test_attributes(self):
+        description = Description({
+            "id": "STRENGTH",
+            "key": "REAL",
+            "custom": True
+        })
+
+        self.assertEqual(description.id, "STRENGTH")
+        self.assertIsNone(description.value)
+        self.assertTrue(description.custom)
+        self.assertEqual(description.config["custom"], True)
+        self.assertRaises(AttributeError, getattr, description, "missing")
+        self.assertFalse(hasattr(description, "__dict__"))
+
+    def test_config(self):
+        description = Description({"id": "STRENGTH", "key": "REAL"})
+
+        description.config["custom"] = True
+        description.config.update({"key": "LONG", "locales": {"a": "b"}})
+
+        self.assertTrue(description.custom)
+        self.assertEqual(description.key, "LONG")
+        self.assertEqual(description.locales, {"a": "b"})
+        self.assertEqual(dict(description.config), {
+            "id": "STRENGTH",
+            "key": "LONG",
+            "value": None,
+            "locales": {"a": "b"},
+            "custom": True
+        })
+
+        del description.config["custom"]
+        del description.config["locales"]
+
+        self.assertIsNone(description.extra)
+        self.assertIsNone(description.locales)
+        self.assertNotIn("custom", description.config)
+
+        description.config = {"id": "OFFSET", "other": 1}
+
+        self.assertEqual(description.id, "OFFSET")
+        self.assertIsNone(description.key)
+        self.assertEqual(description.config["other"], 1)
+
+    def test_sugar(self):
+        assignment = Assignment("NAME", "Tmyplugin", {"key": "OTHER"})
+        group = Group("SETTINGS", {"value": [assignment]})
+        container = Container("Tmyplugin", {"locales": {"strings_us": "a"}})
+
+        self.assertEqual(assignment.key, "NAME")
+        self.assertEqual(group.key, "GROUP")
+        self.assertEqual(group.value, [assignment])
+        self.assertEqual(container.key, "CONTAINER")
+        self.assertEqual(container.locales, {"strings_us": "a"})
+
+    def test_pickle(self):
+        group = pickle.loads(pickle.dumps(Group("SETTINGS", {
+            "value": [Assignment("NAME", "Tmyplugin")]
+        })))
+
+        self.assertEqual(group.id, "SETTINGS")
+        self.assertEqual(group.value[0].value, "Tmyplugin")
+
+    @unittest.skipIf(
+        sys.version_info < (3, 7), "module __getattr__ requires python 3.7"
+    )
+    def test_lazy_import(self):
+        modules = subprocess.check_output(
+            [sys.executable, "-c", IMPORT_SOURCE], cwd=project_path
+        ).decode("utf-8").split()
+
+        self.assertIn("bootstrap.classes.description", modules)
+        self.assertNotIn("bootstrap.classes.template", modules)
+        self.assertNotIn("hashlib", modules)
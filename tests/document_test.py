@@ -0,0 +1,128 @@
+"""Test document module."""
+
+import unittest
+import copy
+import json
+import os
+import tempfile
+
+from bootstrap.document import load_document,\
+    build_description,\
+    DocumentError,\
+    SNAPSHOT_EXTENSION,\
+    tomllib
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.render.res import render_resource
+from tests.reducers_test import create_description
+
+DOCUMENT = {
+    "id": "Tmyplugin",
+    "key": "CONTAINER",
+    "value": [
+        {"key": "NAME", "value": "Tmyplugin"},
+        {
+            "id": "SETTINGS",
+            "key": "GROUP",
+            "value": [
+                {
+                    "id": "STRENGTH",
+                    "key": "REAL",
+                    "value": [
+                        {"key": "MIN", "value": 0.0},
+                        {"key": "UNIT", "value": "PERCENT"}
+                    ],
+                    "locales": {
+                        "strings_us": "Strength",
+                        "strings_de": "Staerke"
+                    }
+                }
+            ],
+            "locales": {
+                "strings_us": "Settings"
+            }
+        }
+    ],
+    "locales": {
+        "strings_us": "My awesome plugin",
+        "strings_de": "Mein Plugin"
+    }
+}
+
+DOCUMENT_TOML = """id = "Tmyplugin"
+key = "CONTAINER"
+locales = { strings_us = "My Plugin" }
+
+[[value]]
+key = "NAME"
+value = "Tmyplugin"
+
+[[value]]
+id = "STRENGTH"
+key = "REAL"
+locales = { strings_us = "Strength" }
+value = [{ key = "UNIT", value = "PERCENT" }]
+"""
+
+
+class TestDocumentMethods(unittest.TestCase):
+
+    def test_load_document(self):
+        document = copy.deepcopy(DOCUMENT)
+        expected = reduce_fused(create_description())
+
+        with tempfile.TemporaryDirectory() as directory:
+            document_file = os.path.join(directory, "tmyplugin.json")
+
+            with open(document_file, "w") as f:
+                json.dump(document, f)
+
+            for index in range(2):
+                result = reduce_fused(load_document(document_file))
+
+                self.assertEqual(result, expected)
+                self.assertTrue(
+                    os.path.isfile(document_file + SNAPSHOT_EXTENSION)
+                )
+
+            document["value"][0]["value"] = "Tother"
+
+            with open(document_file, "w") as f:
+                json.dump(document, f)
+
+            self.assertIn(
+                "NAME  Tother;",
+                render_resource(
+                    reduce_fused(load_document(document_file))["resource"]
+                )
+            )
+
+    @unittest.skipIf(tomllib is None, "toml is not available")
+    def test_load_document_toml(self):
+        with tempfile.TemporaryDirectory() as directory:
+            document_file = os.path.join(directory, "tmyplugin.toml")
+
+            with open(document_file, "w") as f:
+                f.write(DOCUMENT_TOML)
+
+            description = load_document(document_file, False)
+
+        self.assertEqual(render_resource(
+            reduce_fused(description)["resource"]
+        ), """CONTAINER Tmyplugin
+{
+    NAME  Tmyplugin;
+    REAL STRENGTH
+    {
+        UNIT  PERCENT;
+    }
+}""")
+
+    def test_build_description_error(self):
+        with self.assertRaises(DocumentError) as context:
+            build_description({"key": "CONTAINER", "value": [{}, "NAME"]})
+
+        self.assertIn("/value/1", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
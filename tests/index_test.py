@@ -0,0 +1,117 @@
+"""Test index module."""
+
+import unittest
+
+from bootstrap import Description, Assignment, Group, Container
+from bootstrap.classes.index import DescriptionIndex
+
+
+def create_root():
+    """Create a plugin description with a group placed twice."""
+    strength = Description({
+        "id": "STRENGTH",
+        "key": "REAL",
+        "value": [
+            Assignment("UNIT", "PERCENT")
+        ]
+    })
+
+    offsets = Group("OFFSETS", {
+        "value": [
+            Description({"id": "OFFSET", "key": "REAL"})
+        ]
+    })
+
+    return Container("Tmyplugin", {
+        "value": [
+            Assignment("NAME", "Tmyplugin"),
+            Group("SETTINGS", {
+                "value": [strength, offsets]
+            }),
+            offsets
+        ]
+    })
+
+
+class TestIndexMethods(unittest.TestCase):
+
+    def test_lookup(self):
+        root = create_root()
+        index = DescriptionIndex(root)
+
+        strength = index.Get("STRENGTH")
+
+        self.assertIs(strength, root.value[1].value[0])
+        self.assertIs(index.GetByValue(strength.GetId()), strength)
+        self.assertIsNone(index.Get("MISSING"))
+        self.assertEqual(
+            [x.id for x in index.GetByKey("REAL")], ["STRENGTH", "OFFSET"]
+        )
+        self.assertEqual(len(index), 7)
+
+    def test_navigation(self):
+        root = create_root()
+        index = DescriptionIndex(root)
+
+        offset = index.Get("OFFSET")
+        offsets = index.Get("OFFSETS")
+
+        self.assertIs(index.GetParent(offset), offsets)
+        self.assertEqual(
+            [x.id for x in index.GetParents(offsets)],
+            ["SETTINGS", "Tmyplugin"]
+        )
+        self.assertEqual(
+            [x.id for x in index.GetAncestors(offset)],
+            ["OFFSETS", "SETTINGS", "Tmyplugin"]
+        )
+        self.assertEqual(
+            index.GetPath(offset), "Tmyplugin/SETTINGS/OFFSETS/OFFSET"
+        )
+        self.assertEqual(index.Find("Tmyplugin/OFFSETS/OFFSET"), [offset])
+        self.assertEqual(index.Find("Tmyplugin/SETTINGS/REAL"), [])
+        self.assertEqual(len(index.Find("Tmyplugin/SETTINGS/STRENGTH")), 1)
+
+    def test_replace(self):
+        root = create_root()
+        index = DescriptionIndex(root)
+
+        offsets = index.Get("OFFSETS")
+
+        replacement = Group("OFFSETS", {
+            "value": [
+                Description({"id": "SHIFT", "key": "REAL"})
+            ]
+        })
+
+        index.Replace(offsets, replacement)
+
+        self.assertIs(root.value[2], replacement)
+        self.assertIs(root.value[1].value[1], replacement)
+        self.assertNotIn(offsets, index)
+        self.assertIsNone(index.Get("OFFSET"))
+        self.assertEqual(
+            index.GetPath(index.Get("SHIFT")),
+            "Tmyplugin/SETTINGS/OFFSETS/SHIFT"
+        )
+
+        strength = index.Get("STRENGTH")
+
+        index.Insert(replacement, strength, 0)
+        index.Remove(root.value[1])
+
+        self.assertEqual(index.GetParents(strength), [replacement])
+        self.assertIsNone(index.Get("SETTINGS"))
+
+        fresh = DescriptionIndex(root)
+
+        self.assertEqual(set(fresh.nodes), set(index.nodes))
+        self.assertEqual(set(fresh.ids), set(index.ids))
+        self.assertEqual(set(fresh.keys), set(index.keys))
+
+        with self.assertRaises(KeyError):
+            index.GetParent(offsets)
+
+
+if __name__ == "__main__":
+    unittest.main()
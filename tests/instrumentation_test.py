@@ -0,0 +1,82 @@
+"""Test instrumentation module."""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+from bootstrap.io import build
+from bootstrap.classes.instrumentation import Instrumentation
+from tests.io_test import create_plugin
+
+
+class TestInstrumentationMethods(unittest.TestCase):
+
+    def test_build_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            destination_directory = os.path.join(directory, "dist")
+            profile_file = os.path.join(directory, "reports", "build.prof")
+
+            instrumentation = Instrumentation(sys.version_info >= (3, 9))
+
+            build(
+                module.root, plugin_file, destination_directory,
+                "tmyplugin", instrumentation=instrumentation,
+                profile=profile_file
+            )
+
+            stages = {
+                x["name"]: x for x in instrumentation.GetReport()["stages"]
+            }
+
+            for name in ("fingerprint", "reduce", "header", "resource",
+                         "strings", "plugin", "write", "save_manifest"):
+                self.assertIn(name, stages)
+
+            self.assertEqual(stages["fingerprint"]["data"]["nodes"], 5)
+            self.assertGreater(stages["write"]["data"]["bytes"], 0)
+            if instrumentation.trace_memory:
+                self.assertIn("memory", stages["reduce"])
+            self.assertTrue(os.path.isfile(profile_file))
+
+            trace_file = os.path.join(directory, "trace.json")
+
+            instrumentation.WriteTrace(trace_file)
+
+            with open(trace_file) as f:
+                events = json.load(f)["traceEvents"]
+
+            self.assertEqual(
+                len(events), len(instrumentation.GetReport()["stages"])
+            )
+            self.assertEqual(events[0]["ph"], "X")
+
+
+    @unittest.skipIf(
+        sys.version_info < (3, 9), "tracing memory requires python 3.9"
+    )
+    def test_trace_memory(self):
+        instrumentation = Instrumentation(True)
+
+        with instrumentation.Stage("outer"):
+            contents = bytearray(10 ** 7)
+
+            del contents
+
+            with instrumentation.Stage("inner"):
+                contents = bytearray(10 ** 5)
+
+        stages = {
+            x["name"]: x["memory"]
+            for x in instrumentation.GetReport()["stages"]
+        }
+
+        self.assertGreaterEqual(stages["outer"], 10 ** 7)
+        self.assertGreaterEqual(stages["inner"], 10 ** 5)
+        self.assertLess(stages["inner"], 10 ** 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
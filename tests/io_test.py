@@ -1,10 +1,27 @@
 """Test io module."""
 
 import unittest
+import json
 import os
+import subprocess
 import sys
+import tempfile
+import zipfile
 
-from bootstrap.io import build
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from bootstrap import Description, Container
+from bootstrap.io import build,\
+    compile_plugin,\
+    bundle_plugin,\
+    write_strings,\
+    get_parallel_mode,\
+    run_worker,\
+    STRINGS_PROCESS_ENTRIES
+from bootstrap.classes.cache import RenderCache
+from bootstrap.classes.output import MemoryOutput, ZipOutput
+from bootstrap.utilities.imports import load_source
 
 project_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 examples_path = os.path.join(project_path, "examples")
@@ -18,8 +35,228 @@ except ImportError:
     pass
 
 
+PLUGIN_SOURCE = """import os
+
+#----begin_resource_section----
+from bootstrap import Description, Assignment, Container, Group
+
+strength = Description({
+    "id": "STRENGTH",
+    "key": "REAL",
+    "value": [
+        Assignment("UNIT", "PERCENT")
+    ],
+    "locales": {
+        "strings_us": "Strength"
+    }
+})
+
+root = Container("Tmyplugin", {
+    "value": [
+        Assignment("NAME", "Tmyplugin"),
+        Group("SETTINGS", {
+            "value": [
+                strength
+            ]
+        })
+    ],
+    "locales": {
+        "strings_us": "My awesome plugin"
+    }
+})
+#----end_resource_section----
+
+#----begin_id_section----
+STRENGTH = strength.GetId()
+#----end_id_section----
+
+PLUGIN_ID = 223456790
+"""
+
+
+def create_plugin(directory, name="tmyplugin", source=PLUGIN_SOURCE):
+    """Write a plugin without c4d dependencies and load its module."""
+    plugin_file = os.path.join(directory, "{}.py".format(name))
+
+    with open(plugin_file, "w") as f:
+        f.write(source)
+
+    return plugin_file, load_source(name, plugin_file)
+
+
+def get_mode(strings_reduced):
+    """Choose the parallel mode as on a machine with four cpus."""
+    with mock.patch("os.cpu_count", return_value=4):
+        return get_parallel_mode(strings_reduced)
+
+
 class TestIoMethods(unittest.TestCase):
 
+    def test_build_incremental(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            destination_directory = os.path.join(directory, "dist")
+
+            result = build(
+                module.root, plugin_file, destination_directory, "tmyplugin"
+            )
+
+            self.assertEqual(len(result["rebuilt"]), 4)
+            self.assertEqual(result["skipped"], [])
+
+            with open(os.path.join(destination_directory, "tmyplugin.pyp")) \
+                    as f:
+                self.assertIn("STRENGTH = 34087515", f.read())
+
+            result = build(
+                module.root, plugin_file, destination_directory, "tmyplugin"
+            )
+
+            self.assertEqual(result["rebuilt"], [])
+            self.assertEqual(len(result["skipped"]), 4)
+
+            module.strength.locales["strings_us"] = "Force"
+
+            result = build(
+                module.root, plugin_file, destination_directory, "tmyplugin"
+            )
+
+            self.assertEqual(len(result["rebuilt"]), 4)
+
+    def test_build_id_value(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            cache = RenderCache(os.path.join(directory, "cache"))
+
+            build(
+                module.root, plugin_file, os.path.join(directory, "first"),
+                "tmyplugin", cache=cache
+            )
+
+            module.strength.config["id_value"] = 1234
+
+            for name in ("first", "second"):
+                destination_directory = os.path.join(directory, name)
+
+                result = build(
+                    module.root, plugin_file, destination_directory,
+                    "tmyplugin", cache=cache
+                )
+
+                self.assertIn(
+                    "res/description/tmyplugin.h", result["rebuilt"]
+                )
+
+                with open(os.path.join(
+                    destination_directory, "res", "description",
+                    "tmyplugin.h"
+                )) as f:
+                    header = f.read()
+
+                self.assertIn("STRENGTH = 1234", header)
+                self.assertNotIn("34087515", header)
+
+    def test_build_shared_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            destination_directory = os.path.join(directory, "dist")
+
+            plugins = [
+                create_plugin(directory, x) + (x,)
+                for x in ("tmyplugin", "tother")
+            ]
+
+            for plugin_file, module, filename in plugins:
+                result = build(
+                    module.root, plugin_file, destination_directory, filename
+                )
+
+                self.assertEqual(len(result["rebuilt"]), 4)
+
+            for plugin_file, module, filename in plugins:
+                result = build(
+                    module.root, plugin_file, destination_directory, filename
+                )
+
+                self.assertEqual(result["rebuilt"], [])
+                self.assertEqual(len(result["skipped"]), 4)
+
+    def test_write_strings_parallel(self):
+        locales = ["strings_{}".format(x) for x in ("us", "de", "fr", "jp")]
+
+        root = Container("Tmyplugin", {
+            "value": [
+                Description({
+                    "id": "PARAMETER_{}".format(x),
+                    "key": "REAL",
+                    "locales": {y: "{} {}".format(y, x) for y in locales}
+                }) for x in range(50)
+            ],
+            "locales": {x: "My awesome plugin" for x in locales}
+        })
+
+        files = []
+
+        for parallel in ("sequential", "thread", "process"):
+            with MemoryOutput() as output:
+                relative_paths = write_strings(
+                    root, None, "tmyplugin", output=output, parallel=parallel
+                )
+
+            self.assertEqual(len(relative_paths), 4)
+
+            files.append(output.files)
+
+        self.assertEqual(files[0], files[1])
+        self.assertEqual(files[0], files[2])
+
+        with tempfile.TemporaryDirectory() as directory:
+            archive_file = os.path.join(directory, "tmyplugin.zip")
+
+            with ZipOutput(archive_file) as output:
+                write_strings(
+                    root, None, "tmyplugin", output=output, parallel="thread"
+                )
+
+            with zipfile.ZipFile(archive_file) as archive:
+                self.assertEqual({
+                    x: archive.read(x).decode("utf-8")
+                    for x in archive.namelist()
+                }, files[0])
+
+        with self.assertRaises(ValueError):
+            get_parallel_mode({}, "fibers")
+
+        self.assertEqual(get_parallel_mode({"strings_us": []}), "sequential")
+
+    def test_import(self):
+        modules = subprocess.check_output(
+            [
+                sys.executable, "-c",
+                "import sys, bootstrap.io; print(\" \".join(sys.modules))"
+            ],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).decode().split()
+
+        self.assertNotIn("concurrent.futures", modules)
+        self.assertNotIn("multiprocessing", modules)
+
+    def test_parallel_mode_worker(self):
+        size = STRINGS_PROCESS_ENTRIES // 2
+
+        strings_reduced = {
+            "strings_us": [None] * size,
+            "strings_de": [None] * size
+        }
+
+        self.assertEqual(get_mode(strings_reduced), "process")
+
+        with ProcessPoolExecutor(1) as executor:
+            mode = executor.submit(
+                run_worker, get_mode, strings_reduced
+            ).result()
+
+        self.assertEqual(mode, "thread")
+
     def test_build(self):
         if "c4d" in sys.modules:
             plugin_file = os.path.join(examples_path, "tmyplugin.py")
@@ -35,3 +272,106 @@ class TestIoMethods(unittest.TestCase):
             self.assertTrue(result)
         else:
             self.skipTest("missing module c4d")
+
+    def test_compile_plugin(self):
+        with tempfile.TemporaryDirectory() as directory:
+            compile_plugin(
+                os.path.join(examples_path, "tmyplugin.py"),
+                directory,
+                "tmyplugin"
+            )
+
+            with open(os.path.join(directory, "tmyplugin.pyp")) as f:
+                contents = f.read()
+
+            self.assertIn("import c4d", contents)
+            self.assertIn("STRENGTH = 34087515", contents)
+            self.assertNotIn("from bootstrap", contents)
+
+    def test_compile_plugin_fallback(self):
+        source = PLUGIN_SOURCE.replace(
+            "import os", "import os\n\nOFFSET = 1"
+        ).replace(
+            "STRENGTH = strength.GetId()",
+            "STRENGTH = strength.GetId()\nSHIFTED = strength.GetId() + OFFSET"
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory, source=source)
+
+            compile_plugin(plugin_file, directory, "tmyplugin")
+
+            with open(os.path.join(directory, "tmyplugin.pyp")) as f:
+                self.assertIn("SHIFTED = 34087516", f.read())
+
+    def test_bundle_plugin(self):
+        source = PLUGIN_SOURCE.replace(
+            "PLUGIN_ID = 223456790",
+            "from thelpers import double\n\nprint(double(STRENGTH))"
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file = os.path.join(directory, "tmyplugin.py")
+
+            with open(plugin_file, "w") as f:
+                f.write(source)
+
+            with open(os.path.join(directory, "thelpers.py"), "w") as f:
+                f.write("def double(x):\n    return 2 * x\n")
+
+            destination_directory = os.path.join(directory, "dist")
+
+            bundle_plugin(plugin_file, destination_directory, "tmyplugin")
+
+            output = subprocess.check_output(
+                [sys.executable, "tmyplugin.pyp"],
+                cwd=destination_directory
+            )
+
+            self.assertEqual(output.strip(), b"68175030")
+
+            with open(
+                os.path.join(destination_directory, "tmyplugin.pyp.map")
+            ) as f:
+                source_map = json.load(f)
+
+            self.assertEqual(
+                source_map["sources"], ["thelpers.py", "tmyplugin.py"]
+            )
+            self.assertEqual(source_map["lines"][-1], [1, 39])
+
+    def test_bundle_package(self):
+        source = PLUGIN_SOURCE.replace(
+            "PLUGIN_ID = 223456790",
+            "import tpackage\n\nprint(tpackage.sub.double(STRENGTH))"
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file = os.path.join(directory, "tmyplugin.py")
+
+            with open(plugin_file, "w") as f:
+                f.write(source)
+
+            package_directory = os.path.join(directory, "tpackage")
+
+            os.makedirs(package_directory)
+
+            for name, contents in (
+                ("__init__.py", "from . import sub\n"),
+                ("sub.py", "from . import base\n\n"
+                           "def double(x):\n    return base.FACTOR * x\n"),
+                ("base.py", "FACTOR = 2\n")
+            ):
+                with open(os.path.join(package_directory, name), "w") as f:
+                    f.write(contents)
+
+            destination_directory = os.path.join(directory, "dist")
+
+            bundle_plugin(plugin_file, destination_directory, "tmyplugin")
+
+            output = subprocess.check_output(
+                [sys.executable, "tmyplugin.pyp"],
+                cwd=destination_directory
+            )
+
+            self.assertEqual(output.strip(), b"68175030")
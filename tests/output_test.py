@@ -0,0 +1,168 @@
+"""Test output module."""
+
+import unittest
+import json
+import os
+import tempfile
+import zipfile
+
+from concurrent.futures import ThreadPoolExecutor
+
+from bootstrap.io import build
+from bootstrap.classes.output import Output, MemoryOutput, ZipOutput
+from bootstrap.utilities.manifest import MANIFEST_FILENAME
+from tests.io_test import create_plugin
+
+
+def read_files(directory):
+    """Read all files below the directory except the manifest."""
+    files = {}
+
+    for relative_path in list_files(directory):
+        if relative_path == MANIFEST_FILENAME:
+            continue
+
+        with open(os.path.join(directory, relative_path), "r") as f:
+            files[relative_path.replace(os.sep, "/")] = f.read()
+
+    return files
+
+
+def list_files(directory):
+    """List all files below the directory relative to it."""
+    return sorted(
+        os.path.relpath(os.path.join(root, x), directory)
+        for root, directories, files in os.walk(directory)
+        for x in files
+    )
+
+
+class TestOutput(unittest.TestCase):
+
+    def test_commit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with Output(directory) as output:
+                output.Write("res/a.str", lambda writer: writer.Write("a"))
+
+                self.assertFalse(
+                    os.path.isfile(os.path.join(directory, "res", "a.str"))
+                )
+
+            self.assertEqual(list_files(directory), ["res/a.str"])
+
+            with Output(directory) as output:
+                contents_hash, size, pending = output.Write(
+                    "res/a.str", lambda writer: writer.Write("a"),
+                    "86f7e437faa5a7fce15d1ddcb9eaeaea377667b8"
+                )
+
+            self.assertFalse(pending)
+            self.assertEqual(size, 1)
+
+    def test_discard(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                with Output(directory, True) as output:
+                    output.Write("a.str", lambda writer: writer.Write("a"))
+
+                    raise ValueError()
+
+            self.assertEqual(list_files(directory), [".bootstrap-lock"])
+
+    def test_build_memory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            destination_directory = os.path.join(directory, "dist")
+
+            build(module.root, plugin_file, destination_directory, "tmyplugin")
+
+            output = MemoryOutput()
+
+            result = build(
+                module.root, plugin_file, None, "tmyplugin", output=output
+            )
+
+            self.assertEqual(len(result["rebuilt"]), 4)
+            self.assertEqual(output.files, read_files(destination_directory))
+
+    def test_build_zip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            destination_directory = os.path.join(directory, "dist")
+            archive_file = os.path.join(directory, "zip", "tmyplugin.zip")
+
+            build(module.root, plugin_file, destination_directory, "tmyplugin")
+
+            build(
+                module.root, plugin_file, None, "tmyplugin",
+                output=ZipOutput(archive_file, "tmyplugin")
+            )
+
+            self.assertEqual(os.listdir(os.path.dirname(archive_file)), [
+                "tmyplugin.zip"
+            ])
+
+            with zipfile.ZipFile(archive_file) as archive:
+                files = {
+                    x: archive.read(x).decode("utf-8")
+                    for x in archive.namelist()
+                }
+
+            self.assertEqual(files, {
+                "tmyplugin/" + x: y
+                for x, y in read_files(destination_directory).items()
+            })
+
+            with self.assertRaises(ValueError):
+                with ZipOutput(archive_file) as output:
+                    output.Write("a.str", lambda writer: writer.Write("a"))
+
+                    raise ValueError()
+
+            self.assertEqual(os.listdir(os.path.dirname(archive_file)), [
+                "tmyplugin.zip"
+            ])
+
+            with ZipOutput(archive_file, lock=True) as output:
+                output.Write("a.str", lambda writer: writer.Write("a"))
+
+            self.assertEqual(
+                sorted(os.listdir(os.path.dirname(archive_file))),
+                ["tmyplugin.zip", "tmyplugin.zip.lock"]
+            )
+
+    def test_build_concurrent(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            destination_directory = os.path.join(directory, "dist")
+
+            def run(index):
+                return build(
+                    module.root, plugin_file, destination_directory,
+                    "tmyplugin", True, lock=True
+                )
+
+            with ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(run, range(16)))
+
+            self.assertTrue(all(len(x["rebuilt"]) == 4 for x in results))
+            self.assertEqual(list_files(destination_directory), [
+                ".bootstrap-lock",
+                MANIFEST_FILENAME,
+                "res/description/tmyplugin.h",
+                "res/description/tmyplugin.res",
+                "res/strings_us/description/tmyplugin.str",
+                "tmyplugin.pyp"
+            ])
+
+            with open(os.path.join(destination_directory, MANIFEST_FILENAME)) \
+                    as f:
+                manifest = json.load(f)
+
+            self.assertEqual(
+                len(manifest["plugins"]["tmyplugin"]["stages"]), 4
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+"""Test parser module."""
+
+import unittest
+import os
+import tempfile
+
+from io import StringIO
+
+from bootstrap.io import build
+from bootstrap.parser import parse_header,\
+    parse_resource,\
+    parse_strings,\
+    resolve_header,\
+    import_resources,\
+    ParseError
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.render.h import render_header
+from bootstrap.render.res import render_resource
+from bootstrap.render.str import render_strings
+from tests.io_test import create_plugin
+
+RESOURCE = """// legacy resource
+CONTAINER Tlegacy
+{
+    NAME Tlegacy;
+    INCLUDE Tbase;
+
+    GROUP ID_SETTINGS /* settings */
+    {
+        LONG MODE
+        {
+            CYCLE
+            {
+                MODE_A;
+                MODE_B;
+            }
+        }
+        SEPARATOR { LINE; }
+    }
+}
+"""
+
+HEADER = """#ifndef _Tlegacy_H_
+#define _Tlegacy_H_
+
+enum
+{
+    ID_SETTINGS = 1000,
+    MODE,
+    MODE_A = 0,
+    MODE_B = 1
+};
+
+#endif
+"""
+
+LEGACY_RESOURCE = """CONTAINER Tlegacy
+{
+    NAME Tlegacy;
+    INCLUDE Obase;
+
+    GROUP ID_OBJECTPROPERTIES
+    {
+        LONG LEG_MODE
+        {
+            CYCLE
+            {
+                LEG_MODE_A;
+                LEG_MODE_B;
+            }
+        }
+        REAL LEG_LENGTH { UNIT METER; }
+    }
+}
+"""
+
+LEGACY_HEADER = """#ifndef _Oatom_H_
+#define _Oatom_H_
+
+enum
+{
+    Tlegacy = 1000000,
+    LEG_MODE = 1000,
+    LEG_MODE_A = 0,
+    LEG_MODE_B = 1,
+    LEG_LENGTH = 1001,
+};
+
+#endif
+"""
+
+LEGACY_STRINGS = """STRINGTABLE Tlegacy
+{
+    Tlegacy "Legacy";
+    LEG_MODE "Mode"
+    {
+        LEG_MODE_A "A";
+        LEG_MODE_B "B";
+    }
+    LEG_LENGTH "Length";
+}
+"""
+
+
+def create_legacy(directory):
+    """Create the res directory of a hand written plugin."""
+    files = {
+        ("description", "tlegacy.h"): LEGACY_HEADER,
+        ("description", "tlegacy.res"): LEGACY_RESOURCE,
+        ("strings_us", "description", "tlegacy.str"): LEGACY_STRINGS
+    }
+
+    for path, contents in files.items():
+        path = os.path.join(directory, *path)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(contents)
+
+
+def render(description):
+    """Render all files of the description."""
+    reduced = reduce_fused(description)
+
+    return (
+        render_header(reduced["header"]),
+        render_resource(reduced["resource"]),
+        render_strings(reduced["strings"])
+    )
+
+
+class TestParserMethods(unittest.TestCase):
+
+    def test_parse_header(self):
+        self.assertEqual(parse_header(StringIO(HEADER)), {
+            "ID_SETTINGS": "1000",
+            "MODE": None,
+            "MODE_A": "0",
+            "MODE_B": "1"
+        })
+
+    def test_resolve_header(self):
+        self.assertEqual(resolve_header(parse_header(StringIO(HEADER))), {
+            "ID_SETTINGS": 1000,
+            "MODE": 1001,
+            "MODE_A": 0,
+            "MODE_B": 1
+        })
+
+        self.assertEqual(resolve_header({
+            "A": "0x10", "B": None, "C": "A", "D": "B + 1", "E": None
+        }), {"A": 16, "B": 17, "C": 16, "D": None, "E": None})
+
+    def test_parse_resource(self):
+        description = parse_resource(
+            StringIO(RESOURCE), parse_header(StringIO(HEADER))
+        )
+
+        self.assertEqual(description.id, "Tlegacy")
+        self.assertEqual(description.value[0].config, {
+            "id": None, "key": "NAME", "value": "Tlegacy", "locales": None
+        })
+
+        cycle = description.value[2].value[0].value[0]
+
+        self.assertEqual(cycle.key, "CYCLE")
+        self.assertEqual([x.id for x in cycle.value], ["MODE_A", "MODE_B"])
+
+        with self.assertRaises(ParseError) as context:
+            parse_resource(StringIO(RESOURCE.replace("LINE;", "LINE; }")))
+
+        self.assertIn(":19:", str(context.exception))
+
+    def test_parse_strings(self):
+        self.assertEqual(parse_strings(StringIO("""STRINGTABLE Tlegacy
+{
+    Tlegacy "Legacy \\"Plugin\\"";
+    MODE "Mode" " A";
+}
+""")), {
+            "Tlegacy": 'Legacy \\"Plugin\\"',
+            "MODE": "Mode A"
+        })
+
+        self.assertEqual(parse_strings(StringIO("""STRINGTABLE Tlegacy
+{
+    MODE { MODE_A "A"; MODE_B "B"; }
+}
+""")), {"MODE_A": "A", "MODE_B": "B"})
+
+        with self.assertRaises(ParseError):
+            parse_strings(StringIO("STRINGTABLE T { MODE { A { B; } } }"))
+
+    def test_import_resources(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            destination_directory = os.path.join(directory, "dist")
+
+            build(module.root, plugin_file, destination_directory, "tmyplugin")
+
+            description = import_resources(
+                os.path.join(destination_directory, "res"), "tmyplugin"
+            )
+
+        self.assertEqual(render(description), render(module.root))
+
+    def test_import_legacy(self):
+        with tempfile.TemporaryDirectory() as directory:
+            create_legacy(directory)
+
+            description = import_resources(directory, "tlegacy")
+
+        header, resource, strings = render(description)
+
+        self.assertEqual(header, LEGACY_HEADER)
+        self.assertEqual(description.GetId(), 1000000)
+        self.assertIn("GROUP ID_OBJECTPROPERTIES", resource)
+        self.assertIn("LEG_MODE_B \"B\";", strings["strings_us"])
+
+
+if __name__ == "__main__":
+    unittest.main()
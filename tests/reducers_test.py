@@ -0,0 +1,147 @@
+"""Test reducers modules."""
+
+import unittest
+
+from bootstrap import Description, Assignment, Group, Container
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.reducers.h import reduce_header, iter_header
+from bootstrap.reducers.res import reduce_resource
+from bootstrap.reducers.str import reduce_strings, iter_strings
+from bootstrap.render.res import render_resource
+from bootstrap.utilities.manifest import fingerprint_nodes
+
+
+def create_description():
+    strength = Description({
+        "id": "STRENGTH",
+        "key": "REAL",
+        "value": [
+            Assignment("MIN", 0.0),
+            Assignment("UNIT", "PERCENT")
+        ],
+        "locales": {
+            "strings_us": "Strength",
+            "strings_de": "Staerke"
+        }
+    })
+
+    settings = Group("SETTINGS", {
+        "value": [
+            strength
+        ],
+        "locales": {
+            "strings_us": "Settings"
+        }
+    })
+
+    return Container("Tmyplugin", {
+        "value": [
+            Assignment("NAME", "Tmyplugin"),
+            settings
+        ],
+        "locales": {
+            "strings_us": "My awesome plugin",
+            "strings_de": "Mein Plugin"
+        }
+    })
+
+
+class TestReducersMethods(unittest.TestCase):
+
+    def test_reduce_header(self):
+        result = reduce_header(create_description())
+
+        self.assertEqual(
+            [x["key"] for x in result],
+            ["Tmyplugin", "SETTINGS", "STRENGTH"]
+        )
+        self.assertEqual(result[2]["value"], 34087515)
+
+    def test_reduce_strings(self):
+        description = create_description()
+
+        result = reduce_strings(description)
+
+        self.assertEqual(list(result.keys()), ["strings_us", "strings_de"])
+        self.assertEqual(
+            result["strings_de"],
+            [
+                {"key": "Tmyplugin", "value": "Mein Plugin"},
+                {"key": "STRENGTH", "value": "Staerke"}
+            ]
+        )
+        self.assertEqual(
+            reduce_strings(description, "strings_de"), result["strings_de"]
+        )
+
+    def test_reduce_fused(self):
+        description = create_description()
+
+        result = reduce_fused(description)
+
+        self.assertEqual(result["header"], reduce_header(description))
+        self.assertEqual(result["resource"], reduce_resource(description))
+        self.assertEqual(result["strings"], reduce_strings(description))
+
+    def test_iter(self):
+        description = create_description()
+
+        self.assertEqual(
+            list(iter_header(description)), reduce_header(description)
+        )
+        self.assertEqual(
+            list(iter_strings(description, "strings_us")),
+            reduce_strings(description, "strings_us")
+        )
+
+    def test_depth(self):
+        description = Group("GROUP_0", {"locales": {"strings_us": "0"}})
+        root = description
+
+        for index in range(1, 2000):
+            group = Group("GROUP_{}".format(index), {
+                "locales": {"strings_us": str(index)}
+            })
+
+            description.value = [group]
+            description = group
+
+        result = reduce_fused(root)
+
+        self.assertEqual(len(result["header"]), 2000)
+        self.assertEqual(len(result["strings"]["strings_us"]), 2000)
+        self.assertEqual(len(list(iter_header(root))), 2000)
+        self.assertTrue(
+            render_resource(result["resource"]).endswith("}\n}")
+        )
+
+    def test_shared(self):
+        description = Group("GROUP_0", {"locales": {"strings_us": "0"}})
+
+        for index in range(1, 16):
+            description = Group("GROUP_{}".format(index), {
+                "value": [
+                    description,
+                    Group("GROUP_0", {"locales": {"strings_us": "0"}})
+                    if index == 1 else description
+                ],
+                "locales": {"strings_us": str(index)}
+            })
+
+        result = reduce_fused(description)
+        value = result["resource"]["value"]
+
+        self.assertEqual(len(result["header"]), 2 ** 16 - 1)
+        self.assertEqual(result["header"], list(iter_header(description)))
+        self.assertIs(value[0], value[1])
+
+        resource = reduce_fused(
+            description, fingerprints=fingerprint_nodes(description)
+        )["resource"]
+
+        for index in range(14):
+            self.assertIs(resource["value"][0], resource["value"][1])
+
+            resource = resource["value"][0]
+
+        self.assertEqual(resource["id"], "GROUP_1")
@@ -0,0 +1,89 @@
+"""Test registry module."""
+
+import unittest
+import json
+import os
+import tempfile
+
+from bootstrap import Description, Group, Container
+from bootstrap.classes.description import hash_id
+from bootstrap.classes.registry import IdRegistry, IdCollisionError
+
+SETTINGS_ID = hash_id("SETTINGS")
+
+
+class TestRegistryMethods(unittest.TestCase):
+
+    def test_register(self):
+        registry = IdRegistry()
+
+        registry.Register(Container("Tmyplugin", {
+            "value": [
+                Group("SETTINGS"),
+                Group("SETTINGS")
+            ]
+        }))
+
+        self.assertEqual(registry.ids["SETTINGS"], 59458043)
+        self.assertEqual(registry.collisions, [])
+
+        registry.Check()
+
+    def test_register_id_value(self):
+        registry = IdRegistry()
+
+        registry.Register(Container("Tmyplugin", {
+            "value": [
+                Group("SETTINGS"),
+                Description({"id": "FIXED", "id_value": SETTINGS_ID}),
+                Description({"id": "ID_OBJECTPROPERTIES", "external": True}),
+                Description({"id": "MODE", "id_value": 1000})
+            ]
+        }), "tmyplugin")
+
+        self.assertEqual(registry.ids["MODE"], 1000)
+        self.assertNotIn("ID_OBJECTPROPERTIES", registry.ids)
+        self.assertEqual(registry.collisions[0]["ids"], ["SETTINGS", "FIXED"])
+        self.assertRaises(IdCollisionError, registry.Check)
+
+        registry = IdRegistry()
+
+        registry.Update(["MODE", "SETTINGS"], values=[1000, None])
+
+        self.assertEqual(registry.ids, {
+            "MODE": 1000, "SETTINGS": SETTINGS_ID
+        })
+
+    def test_collision(self):
+        registry = IdRegistry()
+
+        registry.ids["OTHER"] = SETTINGS_ID
+        registry.owners[SETTINGS_ID] = "OTHER"
+
+        registry.Update(["SETTINGS"], "tmyplugin")
+
+        self.assertEqual(registry.collisions[0]["ids"], ["OTHER", "SETTINGS"])
+        self.assertRaises(IdCollisionError, registry.Check)
+
+    def test_ledger(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ledger_file = os.path.join(directory, "ledger.json")
+
+            registry = IdRegistry(ledger_file)
+            registry.Update(["SETTINGS"])
+            registry.Save()
+
+            registry = IdRegistry(ledger_file)
+            registry.Update(["SETTINGS"])
+
+            self.assertEqual(registry.collisions, [])
+
+            with open(ledger_file, "w") as f:
+                json.dump({"RETIRED": SETTINGS_ID}, f)
+
+            registry = IdRegistry(ledger_file)
+            registry.Update(["SETTINGS"])
+
+            self.assertEqual(registry.collisions[0]["ids"], [
+                "RETIRED", "SETTINGS"
+            ])
@@ -0,0 +1,79 @@
+"""Test render modules."""
+
+import unittest
+import copy
+
+from io import StringIO
+
+from bootstrap.classes.writer import Writer
+from bootstrap.reducers.fused import reduce_fused
+from bootstrap.render.h import render_header, stream_header
+from bootstrap.render.res import render_resource, stream_resource
+from bootstrap.render.str import render_strings
+from tests.reducers_test import create_description
+
+
+class TestRenderMethods(unittest.TestCase):
+
+    def test_render_resource(self):
+        reduced = reduce_fused(create_description())
+
+        result = render_resource(reduced["resource"])
+        result_excpected = """CONTAINER Tmyplugin
+{
+    NAME  Tmyplugin;
+    GROUP SETTINGS
+    {
+        REAL STRENGTH
+        {
+            MIN  0.0;
+            UNIT  PERCENT;
+        }
+    }
+}"""
+
+        self.assertEqual(result, result_excpected)
+
+    def test_render_strings(self):
+        reduced = reduce_fused(create_description())
+
+        result = render_strings(reduced["strings"])
+
+        self.assertEqual(result["strings_de"], """STRINGTABLE Tmyplugin
+{
+    Tmyplugin "Mein Plugin";
+    STRENGTH "Staerke";
+}
+""")
+
+    def test_stream(self):
+        reduced = reduce_fused(create_description())
+
+        for render, stream, key in [
+            (render_header, stream_header, "header"),
+            (render_resource, stream_resource, "resource")
+        ]:
+            contents = StringIO()
+            writer = Writer(contents)
+
+            writer.Indent("  ")
+            writer.Write("\n")
+            stream(reduced[key], writer)
+            writer.Dedent()
+
+            self.assertEqual(
+                contents.getvalue(),
+                "\n  " + render(reduced[key]).replace("\n", "\n  ")
+            )
+
+    def test_render_shared(self):
+        reduced = reduce_fused(create_description())
+        group = reduced["resource"]["value"][1]
+
+        reduced["resource"]["value"].append({
+            "id": "NESTED", "key": "GROUP", "value": [group]
+        })
+
+        expected = render_resource(copy.deepcopy(reduced["resource"]))
+
+        self.assertEqual(render_resource(reduced["resource"]), expected)
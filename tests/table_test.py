@@ -0,0 +1,119 @@
+"""Test table module."""
+
+import unittest
+import os
+import tempfile
+
+from bootstrap import Description, Assignment, Group
+from bootstrap.document import dump_document
+from bootstrap.table import Column, TableError, build_table, load_csv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CSV = """id,max,strings_us,strings_de
+RED,1.0,Red,Rot
+GREEN,0.5,Green,
+BLUE,2.0,Blue,Blau
+"""
+
+TEMPLATE = Description({
+    "id": Column("id"),
+    "key": "REAL",
+    "value": [
+        Assignment("MIN", 0.0),
+        Assignment("MAX", Column("max")),
+        Assignment("UNIT", "PERCENT")
+    ],
+    "locales": {
+        "strings_us": Column("strings_us"),
+        "strings_de": Column("strings_de")
+    },
+    "channel": Column("id")
+})
+
+
+def create_parameter(description_id, maximum, locales):
+    """Create the parameter the template builds for a row."""
+    return Description({
+        "id": description_id,
+        "key": "REAL",
+        "value": [
+            Assignment("MIN", 0.0),
+            Assignment("MAX", maximum),
+            Assignment("UNIT", "PERCENT")
+        ],
+        "locales": locales,
+        "channel": description_id
+    })
+
+
+class TestTableMethods(unittest.TestCase):
+
+    def test_build_table(self):
+        parameters = build_table({
+            "id": ["RED", "GREEN"],
+            "max": (1.0, 0.5),
+            "strings_us": ["Red", "Green"],
+            "strings_de": ["Rot", "Grün"]
+        }, TEMPLATE)
+
+        self.assertEqual([dump_document(x) for x in parameters], [
+            dump_document(create_parameter(
+                "RED", 1.0, {"strings_us": "Red", "strings_de": "Rot"}
+            )),
+            dump_document(create_parameter(
+                "GREEN", 0.5, {"strings_us": "Green", "strings_de": "Grün"}
+            ))
+        ])
+
+        self.assertIsInstance(parameters[0].value[0], Assignment)
+        self.assertIsNot(parameters[0].locales, parameters[1].locales)
+        self.assertEqual(parameters[1].channel, "GREEN")
+
+    def test_load_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "channels.csv")
+
+            with open(csv_file, "w", encoding="utf-8") as f:
+                f.write(CSV)
+
+            columns = load_csv(csv_file, {"max": float})
+
+        self.assertEqual(columns["max"], [1.0, 0.5, 2.0])
+        self.assertEqual(columns["strings_de"], ["Rot", None, "Blau"])
+
+        group = Group("CHANNELS", {
+            "value": build_table(columns, TEMPLATE)
+        })
+
+        self.assertEqual(group.value[1].locales, {"strings_us": "Green"})
+        self.assertEqual(group.value[2].value[1].value, 2.0)
+
+    def test_build_table_errors(self):
+        with self.assertRaises(TableError):
+            build_table({"id": ["RED"]}, TEMPLATE)
+
+        with self.assertRaises(TableError):
+            build_table({"id": ["RED"], "max": []}, {"id": Column("id")})
+
+    @unittest.skipIf(numpy is None, "missing module numpy")
+    def test_build_table_numpy(self):
+        table = numpy.array(
+            [("RED", 1.0, "Red", "Rot")],
+            dtype=[
+                ("id", "U8"), ("max", "f8"),
+                ("strings_us", "U8"), ("strings_de", "U8")
+            ]
+        )
+
+        parameters = build_table(table, TEMPLATE)
+
+        self.assertIs(parameters[0].value[1].value.__class__, float)
+        self.assertEqual(parameters[0].id, "RED")
+
+
+if __name__ == "__main__":
+    unittest.main()
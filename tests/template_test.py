@@ -28,3 +28,30 @@ class TestTemplateMethods(unittest.TestCase):
 }"""
 
         self.assertEqual(result, result_excpected)
+
+    def test_render_missing(self):
+        template = Template("{key} {id} {value}")
+
+        result = template.Render({"key": "NAME", "value": "test"})
+
+        self.assertEqual(result, "NAME  test")
+
+        result = template.Render({"key": "GROUP", "id": "test"})
+
+        self.assertEqual(result, "GROUP test")
+
+    def test_render_indentation(self):
+        template = Template(
+            """{{
+    {value}
+}}"""
+        )
+
+        result = template.Render({"value": ["FOO;", "BAR\nBAZ;"]})
+        result_excpected = """{
+    FOO;
+    BAR
+    BAZ;
+}"""
+
+        self.assertEqual(result, result_excpected)
@@ -0,0 +1,142 @@
+"""Test validation module."""
+
+import unittest
+import os
+import tempfile
+
+from bootstrap import Description, Assignment, Group, Container
+from bootstrap.io import build
+from bootstrap.validation import validate_description, ValidationError
+from tests.io_test import create_plugin
+
+
+def get_codes(diagnostics):
+    """Return the code and path of every diagnostic."""
+    return [(x["code"], x["path"]) for x in diagnostics]
+
+
+class TestValidationMethods(unittest.TestCase):
+
+    def test_validate(self):
+        strength = Description({
+            "id": "STRENGTH",
+            "key": "REAL",
+            "locales": {
+                "strings_us": "Strength"
+            }
+        })
+
+        root = Container("Tmyplugin", {
+            "value": [
+                Assignment("NAME", "Tmyplugin"),
+                Group("SETTINGS", {
+                    "value": [
+                        strength,
+                        Description({
+                            "id": "STRENGTH",
+                            "key": "REAL"
+                        }),
+                        Description({
+                            "key": "LONG",
+                            "locales": {
+                                "strings_us": "Mode"
+                            }
+                        }),
+                        Description({
+                            "id": "OFFSET",
+                            "key": "REAL",
+                            "locales": {
+                                "strings_de": "Versatz"
+                            }
+                        }),
+                        "SEPARATOR"
+                    ]
+                }),
+                strength
+            ],
+            "locales": {
+                "strings_us": "My awesome plugin"
+            }
+        })
+
+        self.assertEqual(get_codes(validate_description(root)), [
+            ("duplicate_id", "Tmyplugin/SETTINGS/STRENGTH"),
+            ("locales_without_id", "Tmyplugin/SETTINGS/LONG"),
+            ("unrendered_locale", "Tmyplugin/SETTINGS/OFFSET"),
+            ("invalid_child", "Tmyplugin/SETTINGS/?"),
+            ("repeated_description", "Tmyplugin/STRENGTH"),
+            ("missing_locale", "Tmyplugin/SETTINGS/OFFSET")
+        ])
+
+    def test_validate_root(self):
+        root = Description({
+            "key": "CONTAINER",
+            "value": [
+                Assignment("NAME", "Tmyplugin")
+            ],
+            "locales": {
+                "strings_us": "My awesome plugin"
+            }
+        })
+
+        self.assertEqual(get_codes(validate_description(root)), [
+            ("stringtable_name", "CONTAINER"),
+            ("locales_without_id", "CONTAINER")
+        ])
+
+    def test_validate_coverage(self):
+        root = Container("Tmyplugin", {
+            "value": [
+                Description({
+                    "id": "PARAMETER_{}".format(x),
+                    "key": "REAL",
+                    "locales": {
+                        "strings_us": "Parameter",
+                        "strings_de": "Parameter"
+                    } if x % 7 else {
+                        "strings_us": "Parameter"
+                    }
+                }) for x in range(20)
+            ],
+            "locales": {
+                "strings_us": "My awesome plugin",
+                "strings_de": "Mein tolles Plugin"
+            }
+        })
+
+        self.assertEqual(get_codes(validate_description(root)), [
+            ("missing_locale", "Tmyplugin/PARAMETER_{}".format(x))
+            for x in (0, 7, 14)
+        ])
+
+    def test_build(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file, module = create_plugin(directory)
+            destination_directory = os.path.join(directory, "dist")
+
+            module.root.value.append(Group("SETTINGS"))
+
+            with self.assertRaises(ValidationError) as context:
+                build(
+                    module.root, plugin_file, destination_directory,
+                    "tmyplugin"
+                )
+
+            self.assertEqual(
+                get_codes(context.exception.diagnostics),
+                [("duplicate_id", "Tmyplugin/SETTINGS")]
+            )
+
+            self.assertFalse(os.path.exists(destination_directory))
+
+            module.root.value.pop()
+
+            result = build(
+                module.root, plugin_file, destination_directory, "tmyplugin"
+            )
+
+            self.assertEqual(result["diagnostics"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Test watch module."""
+
+import unittest
+import os
+import sys
+import tempfile
+
+from bootstrap.watch import Watcher
+
+PLUGIN_SOURCE = """#----begin_resource_section----
+from bootstrap import Container
+from twatchsettings import settings
+
+root = Container("Twatch", {
+    "value": [
+        settings
+    ]
+})
+#----end_resource_section----
+"""
+
+SETTINGS_SOURCE = """from bootstrap import Group
+
+settings = Group("{}")
+"""
+
+
+class TestWatchMethods(unittest.TestCase):
+
+    def write(self, path, contents):
+        with open(path, "w") as f:
+            f.write(contents)
+
+        # make sure the modification is visible on coarse file systems
+        mtime = os.stat(path).st_mtime_ns + 10 ** 9
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_poll(self):
+        path = list(sys.path)
+
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file = os.path.join(directory, "twatch.py")
+            settings_file = os.path.join(directory, "twatchsettings.py")
+            header_file = os.path.join(
+                directory, "dist", "res", "description", "twatch.h"
+            )
+
+            self.write(plugin_file, PLUGIN_SOURCE)
+            self.write(settings_file, SETTINGS_SOURCE.format("SETTINGS"))
+
+            watcher = Watcher([{
+                "plugin_file": plugin_file,
+                "description": "root",
+                "destination_directory": os.path.join(directory, "dist"),
+                "filename": "twatch"
+            }], debounce=0)
+
+            try:
+                self.assertTrue(watcher.Build(0)["success"])
+                self.assertEqual(watcher.Poll(), [])
+
+                self.write(settings_file, SETTINGS_SOURCE.format("CHANGED"))
+
+                results = watcher.Poll()
+            finally:
+                sys.path[:] = path
+                sys.modules.pop("twatch", None)
+                sys.modules.pop("twatchsettings", None)
+
+            self.assertEqual(len(results), 1)
+            self.assertTrue(results[0]["success"])
+
+            with open(header_file) as f:
+                self.assertIn("CHANGED", f.read())
+
+    def test_poll_failed(self):
+        path = list(sys.path)
+
+        with tempfile.TemporaryDirectory() as directory:
+            plugin_file = os.path.join(directory, "twatch.py")
+            settings_file = os.path.join(directory, "twatchsettings.py")
+            header_file = os.path.join(
+                directory, "dist", "res", "description", "twatch.h"
+            )
+
+            self.write(plugin_file, PLUGIN_SOURCE)
+            self.write(settings_file, SETTINGS_SOURCE.format("SETTINGS"))
+
+            watcher = Watcher([{
+                "plugin_file": plugin_file,
+                "description": "root",
+                "destination_directory": os.path.join(directory, "dist"),
+                "filename": "twatch"
+            }], debounce=0)
+
+            try:
+                self.assertTrue(watcher.Build(0)["success"])
+
+                self.write(settings_file, "settings = (\n")
+
+                broken = watcher.Poll()
+
+                self.write(settings_file, SETTINGS_SOURCE.format("FIXED"))
+
+                fixed = watcher.Poll()
+            finally:
+                sys.path[:] = path
+                sys.modules.pop("twatch", None)
+                sys.modules.pop("twatchsettings", None)
+
+            self.assertEqual(len(broken), 1)
+            self.assertFalse(broken[0]["success"])
+            self.assertIn("SyntaxError", broken[0]["error"])
+
+            self.assertEqual(len(fixed), 1)
+            self.assertTrue(fixed[0]["success"])
+
+            with open(header_file) as f:
+                self.assertIn("FIXED", f.read())
@@ -0,0 +1,118 @@
+"""Test workspace module."""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+from bootstrap.__main__ import main
+from bootstrap.workspace import load_workspace,\
+    build_workspace,\
+    build_plugin
+from tests.io_test import PLUGIN_SOURCE, create_plugin
+
+
+class TestWorkspaceMethods(unittest.TestCase):
+
+    def create_workspace(self, directory):
+        create_plugin(directory, "tfirst")
+        create_plugin(directory, "tsecond")
+
+        workspace_file = os.path.join(directory, "workspace.json")
+
+        with open(workspace_file, "w") as f:
+            json.dump({
+                "plugins": [
+                    {
+                        "plugin_file": "tfirst.py",
+                        "description": "root",
+                        "destination_directory": "dist/first",
+                        "filename": "tfirst"
+                    },
+                    {
+                        "plugin_file": "tsecond.py",
+                        "description": "missing",
+                        "destination_directory": "dist/second",
+                        "filename": "tsecond"
+                    }
+                ]
+            }, f)
+
+        return workspace_file
+
+    def test_build_workspace(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugins = load_workspace(self.create_workspace(directory))
+
+            results = build_workspace(plugins, 2)
+
+            self.assertTrue(results[0]["success"])
+            self.assertFalse(results[1]["success"])
+            self.assertIn("AttributeError", results[1]["error"])
+            self.assertEqual(results[0]["ids"]["STRENGTH"], 34087515)
+            self.assertTrue(os.path.isfile(
+                os.path.join(directory, "dist", "first", "tfirst.pyp")
+            ))
+
+    def test_build_archive(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plugins = load_workspace(self.create_workspace(directory))
+            archive_directory = os.path.join(directory, "archives")
+
+            results = build_workspace(
+                plugins, 1, archive_directory=archive_directory
+            )
+
+            self.assertTrue(results[0]["success"])
+            self.assertFalse(os.path.exists(os.path.join(directory, "dist")))
+            self.assertEqual(os.listdir(archive_directory), ["tfirst.zip"])
+
+    def test_build_plugin_modules(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "thelper.py"), "w") as f:
+                f.write("import colorsys\n")
+
+            plugin_file = os.path.join(directory, "tmodules.py")
+
+            with open(plugin_file, "w") as f:
+                f.write("import thelper\n" + PLUGIN_SOURCE)
+
+            sys.modules.pop("colorsys", None)
+
+            result = build_plugin({
+                "plugin_file": plugin_file,
+                "description": "root",
+                "destination_directory": os.path.join(directory, "dist"),
+                "filename": "tmodules"
+            })
+
+            self.assertTrue(result["success"])
+            self.assertNotIn("tmodules", sys.modules)
+            self.assertNotIn("thelper", sys.modules)
+            self.assertIn("colorsys", sys.modules)
+
+    @unittest.skipIf(
+        sys.version_info < (3, 9), "tracing memory requires python 3.9"
+    )
+    def test_main_trace_memory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            workspace_file = self.create_workspace(directory)
+            report_directory = os.path.join(directory, "reports")
+
+            main([
+                "build", workspace_file, "-j", "1",
+                "--report-directory", report_directory, "--trace-memory"
+            ])
+
+            with open(os.path.join(report_directory, "tfirst.json")) as f:
+                stages = json.load(f)["stages"]
+
+        self.assertTrue(all("memory" in x for x in stages))
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            workspace_file = self.create_workspace(directory)
+
+            self.assertEqual(main(["build", workspace_file, "-j", "1"]), 1)
+            self.assertEqual(main(["validate", workspace_file]), 1)